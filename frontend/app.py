@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 import tempfile
 import json
+import uuid
 from datetime import datetime
 from typing import Tuple
 from ml.report.report_generator import ReportGenerator
@@ -18,7 +19,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 from ml.voice.voice_processor import VoiceProcessor
 from ml.rag.vector_store import VectorStoreManager
 from ml.resume_parser.resume_processor import ResumeProcessor
-from ml.interview.interview_manager import InterviewManager
+from ml.resume_parser.role_fit import get_role_fit_scorer
+from ml.interview.interview_manager import get_interview_manager
+from ml.interview.interview_session import InterviewSession
 from ml.avatar.avatar_manager import AvatarManager
 from ml.mcq.mcq_manager import MCQManager
 
@@ -142,6 +145,20 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
+def _stable_user_id() -> str:
+    """
+    Get this user's ID, keeping it in the URL so it survives new tabs and restarts.
+    
+    Seen questions and review schedules are persisted per user, so the ID
+    must be the same the next time the user opens the app from that link.
+    """
+    try:
+        return str(uuid.UUID(st.query_params.get("user")))
+    except (TypeError, ValueError):
+        user_id = str(uuid.uuid4())
+        st.query_params["user"] = user_id
+        return user_id
+
 # Initialize session state
 if 'voice_processor' not in st.session_state:
     st.session_state.voice_processor = VoiceProcessor()
@@ -150,7 +167,8 @@ if 'vector_store' not in st.session_state:
 if 'resume_processor' not in st.session_state:
     st.session_state.resume_processor = ResumeProcessor(st.session_state.vector_store)
 if 'interview_manager' not in st.session_state:
-    st.session_state.interview_manager = InterviewManager()
+    # Stateless engine shared process-wide; per-candidate state is interview_session
+    st.session_state.interview_manager = get_interview_manager()
 if 'avatar_manager' not in st.session_state:
     st.session_state.avatar_manager = AvatarManager()
 if 'chat_history' not in st.session_state:
@@ -158,6 +176,7 @@ if 'chat_history' not in st.session_state:
 if 'current_avatar_video' not in st.session_state:
     st.session_state.current_avatar_video = None
 if 'mcq_manager' not in st.session_state:
+    # Lightweight handle; the MCQ bank and index are shared process-wide
     st.session_state.mcq_manager = MCQManager()
 if 'current_questions' not in st.session_state:
     st.session_state.current_questions = []
@@ -165,6 +184,8 @@ if 'user_answers' not in st.session_state:
     st.session_state.user_answers = {}
 if 'show_results' not in st.session_state:
     st.session_state.show_results = False
+if 'user_id' not in st.session_state:
+    st.session_state.user_id = _stable_user_id()
 
 def main():
     st.title("🎯 Interview Coach")
@@ -215,8 +236,8 @@ def show_mock_interview():
     st.write("Start your AI-powered mock interview session")
     
     # Initialize session state variables
-    if "interview_manager" not in st.session_state:
-        st.session_state.interview_manager = InterviewManager(st.session_state.vector_store)
+    if "interview_session" not in st.session_state:
+        st.session_state.interview_session = None
     if "interview_responses" not in st.session_state:
         st.session_state.interview_responses = []
     if "current_question" not in st.session_state:
@@ -226,12 +247,39 @@ def show_mock_interview():
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
     
+    # Pick up an interview interrupted by a restart; its session ID is kept in the URL
+    if st.session_state.interview_session is None and st.query_params.get("interview"):
+        session = st.session_state.interview_manager.resume_session(st.query_params["interview"])
+        if session is not None and session.last_question:
+            st.session_state.interview_session = session
+            st.session_state.interview_started = True
+            st.session_state.current_question = session.last_question
+            st.session_state.current_question_id = session.turn_count // 2 + 1
+            st.session_state.chat_history = [
+                {"role": turn["role"], "content": turn["content"]}
+                for turn in session.history[:-1]
+            ]
+    
+    # Rank roles against the uploaded resume, if any
+    roles = ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer"]
+    best = None
+    if st.session_state.get("resume_skills"):
+        ranking = [r for r in get_role_fit_scorer().rank_roles(st.session_state.resume_skills) if r["role"] in roles]
+        # No recommendation when none of the resume's skills match any role
+        if ranking and ranking[0]["score"] > 0:
+            best = ranking[0]
+            st.info(
+                f"Recommended role from your resume: **{best['role']}** ({best['score']:.0%} fit"
+                + (f", based on {', '.join(best['matched_skills'])})" if best["matched_skills"] else ")")
+            )
+    
     # Role and experience level selection
     col1, col2 = st.columns(2)
     with col1:
         role = st.selectbox(
             "Select Role",
-            ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer"]
+            roles,
+            index=roles.index(best["role"]) if best else 0
         )
     with col2:
         experience_level = st.selectbox(
@@ -242,7 +290,16 @@ def show_mock_interview():
     # Start interview button
     if st.button("Start Interview"):
         with st.spinner("Starting interview..."):
-            initial_question = st.session_state.interview_manager.start_interview(role, experience_level)
+            st.session_state.interview_session = InterviewSession(
+                role,
+                experience_level,
+                skills=st.session_state.get("resume_skills"),
+                resume_hash=st.session_state.get("resume_hash")
+            )
+            initial_question = st.session_state.interview_manager.start_interview(
+                st.session_state.interview_session
+            )
+            st.query_params["interview"] = st.session_state.interview_session.session_id
             st.session_state.current_question = initial_question
             st.session_state.interview_started = True
             st.session_state.chat_history = []
@@ -275,16 +332,14 @@ def show_mock_interview():
             if answer:
                 with st.spinner("Evaluating your answer..."):
                     # Get AI response with evaluation
-                    response = st.session_state.interview_manager.get_response(answer)
+                    session = st.session_state.interview_session
+                    response = st.session_state.interview_manager.get_response(session, answer)
                     
                     # Extract feedback and next question from response
                     feedback, next_question = _parse_response(response)
                     
-                    # Get similarity score from interview manager
-                    similarity = st.session_state.interview_manager.answer_evaluator.evaluate_answer(
-                        candidate_answer=answer,
-                        expected_answer=st.session_state.current_question
-                    )[0]
+                    # Similarity score recorded while evaluating the answer
+                    similarity = session.last_score or 0.0
                     
                     # Store response data
                     response_data = {
@@ -372,6 +427,9 @@ def show_mock_interview():
             
             # Reset session state
             st.session_state.interview_started = False
+            st.session_state.interview_session = None
+            if "interview" in st.query_params:
+                del st.query_params["interview"]
             st.session_state.current_question = None
             st.session_state.chat_history = []
             st.session_state.interview_responses = []
@@ -446,29 +504,26 @@ def show_resume_analysis():
     
     if uploaded_file:
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
-            # Process the resume
+            # Process the upload in memory; getvalue() returns the uploaded
+            # bytes without copying since the buffer is never written to
+            file_type = Path(uploaded_file.name).suffix.lstrip(".").lower()
             with st.spinner("Processing your resume..."):
-                result = st.session_state.resume_processor.process_resume(tmp_path)
+                result = st.session_state.resume_processor.process_resume(uploaded_file.getvalue(), file_type)
             
-            if result["status"] == "success":
+            if result["success"]:
                 st.success("Resume processed successfully!")
                 
                 # Display statistics
                 st.subheader("Processing Statistics")
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("Total Chunks", result["stats"]["total_chunks"])
+                    st.metric("Total Chunks", result["statistics"]["total_chunks"])
                 with col2:
-                    st.metric("Avg Chunk Size", f"{result['stats']['avg_chunk_size']:.0f} chars")
+                    st.metric("Avg Chunk Size", f"{result['statistics']['avg_chunk_size']:.0f} chars")
                 with col3:
-                    st.metric("Min Chunk Size", f"{result['stats']['min_chunk_size']} chars")
+                    st.metric("Min Chunk Size", f"{result['statistics']['min_chunk_size']} chars")
                 with col4:
-                    st.metric("Max Chunk Size", f"{result['stats']['max_chunk_size']} chars")
+                    st.metric("Max Chunk Size", f"{result['statistics']['max_chunk_size']} chars")
                 
                 # Vector store status
                 if result["vector_store_status"] == "success":
@@ -505,18 +560,29 @@ def show_resume_analysis():
                                     st.markdown(f"""
                                         <div class="search-result">
                                             <div class="content">{result['content']}</div>
-                                            <div class="score">Relevance: {result['score']:.2f}</div>
-                                            <div class="chunk-id">Chunk ID: {result['chunk_id']}</div>
+                                            <div class="score">Relevance: {result['relevance_score']:.2f}</div>
+                                            <div class="chunk-id">Chunk ID: {result['metadata'].get('chunk_id', '')}</div>
                                         </div>
                                     """, unsafe_allow_html=True)
                         else:
                             st.info("No relevant sections found. Try different search terms.")
                 
-                # Placeholder for AI analysis
-                st.info("AI analysis coming soon!")
-                
-                # Clean up temporary file
-                os.unlink(tmp_path)
+                # Skills found locally; also used to seed mock interviews
+                st.subheader("Skills")
+                st.session_state.resume_skills = [entry["skill"] for entry in result["skills"]]
+                # Interviews only draw context from this resume's chunks
+                st.session_state.resume_hash = result.get("content_hash")
+                if result["skills"]:
+                    by_category = {}
+                    for entry in result["skills"]:
+                        by_category.setdefault(entry["category"], []).append(entry)
+                    for category, entries in by_category.items():
+                        st.write(f"**{category}:** " + ", ".join(
+                            f"{entry['skill']} ({entry['count']})" if entry["count"] > 1 else entry["skill"]
+                            for entry in entries
+                        ))
+                else:
+                    st.info("No known skills were found in this resume.")
             else:
                 st.error(f"Error processing resume: {result['error']}")
                 
@@ -567,8 +633,37 @@ def show_mcqs():
     
     # Generate new questions button
     if st.button("Generate New Questions"):
-        # Get role-specific questions using semantic search
-        questions = st.session_state.mcq_manager.get_role_specific_questions(selected_role)
+        # Pick the questions that best match the user's estimated level
+        questions = st.session_state.mcq_manager.get_adaptive_questions(
+            selected_role,
+            st.session_state.user_id
+        )
+        st.session_state.current_questions = questions
+        st.session_state.show_results = False
+        st.session_state.user_answers = {}
+    
+    if st.button("Review Missed Questions"):
+        questions = st.session_state.mcq_manager.get_due_review_questions(st.session_state.user_id)
+        if questions:
+            st.session_state.current_questions = questions
+            st.session_state.show_results = False
+            st.session_state.user_answers = {}
+        else:
+            next_due = st.session_state.mcq_manager.get_next_review_time(st.session_state.user_id)
+            if next_due is None:
+                st.info("No questions are due for review yet. Questions you miss will be scheduled here.")
+            else:
+                st.info(
+                    "No questions are due for review yet. The next review is due "
+                    f"{datetime.fromtimestamp(next_due):%b %d, %H:%M}; open the app from this page's link to keep your schedule."
+                )
+    
+    if st.button("Random Unseen Questions"):
+        questions = st.session_state.mcq_manager.get_random_questions(
+            5,
+            role_id=selected_role,
+            user_id=st.session_state.user_id
+        )
         st.session_state.current_questions = questions
         st.session_state.show_results = False
         st.session_state.user_answers = {}
@@ -581,27 +676,23 @@ def show_mcqs():
             st.write(f"**Question {i+1}:** {question['question']}")
             
             # Display options
-            for j, option in enumerate(question["options"]):
-                key = f"q{i}_option{j}"
-                if key not in st.session_state.user_answers:
-                    st.session_state.user_answers[key] = None
-                
-                st.radio(
-                    f"Option {j+1}",
-                    [option],
-                    key=key,
-                    disabled=st.session_state.show_results
-                )
+            st.session_state.user_answers[i] = st.radio(
+                "Options",
+                list(range(len(question["options"]))),
+                format_func=lambda j, options=question["options"]: options[j],
+                key=f"q{i}_answer",
+                index=None,
+                disabled=st.session_state.show_results
+            )
             
             # Show feedback if results are displayed
             if st.session_state.show_results:
-                result = st.session_state.mcq_manager.check_answer(
-                    question,
-                    st.session_state.user_answers.get(f"q{i}_option{question['correct_answer']}")
-                )
+                result = st.session_state.quiz_results["questions"][i]
                 
                 if result["is_correct"]:
                     st.success("Correct!")
+                elif result["correct_option"] is None:
+                    st.error("Incorrect. The correct answer for this question is unavailable.")
                 else:
                     st.error(f"Incorrect. The correct answer is: {question['options'][result['correct_option']]}")
                 
@@ -609,9 +700,23 @@ def show_mcqs():
             
             st.markdown("---")
         
+        if st.session_state.show_results:
+            results = st.session_state.quiz_results
+            st.metric("Score", f"{results['correct_count']}/{results['total']}", delta=f"{results['score']:.0%}")
+            for topic, topic_result in results["topics"].items():
+                st.write(f"**{topic}:** {topic_result['correct']}/{topic_result['total']}")
+        
         # Submit button
         if not st.session_state.show_results:
             if st.button("Submit Answers"):
+                # Grade the whole submission once; reruns reuse the stored results
+                questions = st.session_state.current_questions
+                st.session_state.quiz_results = st.session_state.mcq_manager.grade_quiz(
+                    questions,
+                    [st.session_state.user_answers.get(i) for i in range(len(questions))],
+                    role_id=selected_role,
+                    user_id=st.session_state.user_id
+                )
                 st.session_state.show_results = True
                 st.experimental_rerun()
         
@@ -857,6 +962,15 @@ def show_analytics():
 def show_voice_chat():
     st.header("Voice Chat")
     
+    # Continue the mock interview session, if one is running
+    if st.session_state.get("interview_session") is None:
+        st.session_state.interview_session = InterviewSession(
+            "Software Engineer",
+            "Mid Level",
+            skills=st.session_state.get("resume_skills"),
+            resume_hash=st.session_state.get("resume_hash")
+        )
+    
     # Avatar selection
     avatar_id = st.selectbox(
         "Choose your interviewer",
@@ -912,7 +1026,9 @@ def show_voice_chat():
                     })
                     
                     # Get AI response
-                    response = st.session_state.interview_manager.get_response(transcribed_text)
+                    response = st.session_state.interview_manager.get_response(
+                        st.session_state.interview_session, transcribed_text
+                    )
                     
                     # Generate avatar video
                     with st.spinner("Generating avatar response..."):
@@ -944,7 +1060,9 @@ def show_voice_chat():
             })
             
             # Get AI response
-            response = st.session_state.interview_manager.get_response(text_input)
+            response = st.session_state.interview_manager.get_response(
+                st.session_state.interview_session, text_input
+            )
             
             # Generate avatar video
             with st.spinner("Generating avatar response..."):
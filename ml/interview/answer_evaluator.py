@@ -1,41 +1,75 @@
 import os
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from openai import OpenAI
 import streamlit as st
+from ..rag.context_packer import ContextPacker
 from ..rag.vector_store import VectorStoreManager
+from .follow_up_cache import FollowUpCache
 
 class AnswerEvaluator:
-    def __init__(self, vector_store: VectorStoreManager):
+    def __init__(self, vector_store: VectorStoreManager, follow_up_cache: Optional[FollowUpCache] = None, max_cached_embeddings: int = 1024, context_packer: Optional[ContextPacker] = None):
         """
         Initialize the answer evaluator.
         
         Args:
             vector_store (VectorStoreManager): Vector store manager for RAG
+            follow_up_cache (Optional[FollowUpCache]): Serves stored follow-ups
+                for near-identical (question, answer) pairs
+            max_cached_embeddings (int): Recent texts whose embeddings are kept
+            context_packer (Optional[ContextPacker]): Fits retrieved context
+                into a token budget
         """
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.vector_store = vector_store
         self.similarity_threshold = 0.5
+        self.context_packer = context_packer or ContextPacker()
+        self.follow_up_cache = follow_up_cache
+        self.max_cached_embeddings = max_cached_embeddings
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embeddings_lock = threading.Lock()
     
     def get_embedding(self, text: str) -> List[float]:
         """
         Get embedding for a text using OpenAI's API.
         
+        Embeddings of recent texts are kept, so a question or answer that is
+        evaluated and then looked up again is only embedded once.
+        
         Args:
             text (str): Text to embed
             
         Returns:
             List[float]: Embedding vector
         """
+        with self._embeddings_lock:
+            embedding = self._embeddings.get(text)
+            if embedding is not None:
+                self._embeddings.move_to_end(text)
+                return embedding
+        
         try:
             response = self.client.embeddings.create(
                 model="text-embedding-3-small",
                 input=text
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
         except Exception as e:
             st.error(f"Error getting embedding: {str(e)}")
             return []
+        
+        with self._embeddings_lock:
+            self._embeddings[text] = embedding
+            while len(self._embeddings) > self.max_cached_embeddings:
+                self._embeddings.popitem(last=False)
+        return embedding
+    
+    def cached_embedding(self, text: str) -> Optional[List[float]]:
+        """Get the embedding of a recently embedded text without calling the API."""
+        with self._embeddings_lock:
+            return self._embeddings.get(text)
     
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
@@ -86,18 +120,49 @@ class AnswerEvaluator:
         
         return similarity, is_acceptable
     
-    def generate_follow_up(self, question: str, candidate_answer: str, context: Optional[str] = None) -> str:
+    def generate_follow_up(
+        self,
+        question: str,
+        candidate_answer: str,
+        context: Optional[str] = None,
+        embed: bool = True,
+        resume_hash: Optional[str] = None
+    ) -> str:
         """
         Generate a follow-up question using RAG.
         
+        With a follow-up cache, a follow-up already generated for a close
+        enough (question, answer) pair is returned without calling the model.
+        Cached follow-ups are shared by every candidate, so on a miss the
+        follow-up is generated from the question and answer alone; the
+        context is only used when the pair can't be embedded for the cache.
+        
         Args:
             question (str): Original question
             candidate_answer (str): Candidate's answer
-            context (Optional[str]): Additional context for the question
+            context (Optional[str]): Additional context for the question; when given,
+                the vector store is not searched again
+            embed (bool): Embed the question and answer for the cache lookup; if
+                False, the cache is only used when both embeddings are cached
+            resume_hash (Optional[str]): Content hash of the candidate's resume;
+                the context, or the vector store search, comes from it
             
         Returns:
             str: Follow-up question
         """
+        cache_key = None
+        if self.follow_up_cache is not None:
+            get_embedding = self.get_embedding if embed else self.cached_embedding
+            question_embedding = get_embedding(question)
+            answer_embedding = get_embedding(candidate_answer)
+            if question_embedding and answer_embedding:
+                cached = self.follow_up_cache.get(question_embedding, answer_embedding)
+                if cached is not None:
+                    return cached
+                cache_key = (question_embedding, answer_embedding)
+                # No candidate's resume may reach a follow-up served to others
+                context = ""
+        
         try:
             # Prepare prompt for follow-up generation
             prompt = f"""
@@ -114,16 +179,18 @@ class AnswerEvaluator:
             Follow-up Question:
             """
             
-            # Get relevant context from vector store
-            search_results = self.vector_store.search(
-                query=f"{question} {candidate_answer}",
-                n_results=3
-            )
-            
-            # Add relevant context to the prompt
-            if search_results:
-                context = "\n".join([result["content"] for result in search_results])
-                prompt += f"\nRelevant Context:\n{context}"
+            # Get relevant context from vector store, unless the caller already did
+            if context is None:
+                search_results = self.vector_store.search(
+                    query=f"{question} {candidate_answer}",
+                    n_results=3,
+                    where={"content_hash": resume_hash} if resume_hash else None
+                )
+                
+                # Add relevant context to the prompt, within its token budget
+                context, _ = self.context_packer.pack(search_results or [])
+                if context:
+                    prompt += f"\nRelevant Context:\n{context}"
             
             # Generate follow-up question
             response = self.client.chat.completions.create(
@@ -136,11 +203,15 @@ class AnswerEvaluator:
                 max_tokens=150
             )
             
-            return response.choices[0].message.content.strip()
+            follow_up = response.choices[0].message.content.strip()
             
         except Exception as e:
             st.error(f"Error generating follow-up question: {str(e)}")
             return "Could you elaborate more on your answer?"
+        
+        if cache_key is not None and follow_up:
+            self.follow_up_cache.put(*cache_key, follow_up)
+        return follow_up
     
     def get_feedback(self, similarity: float, is_acceptable: bool) -> str:
         """
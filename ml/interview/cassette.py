@@ -0,0 +1,216 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from langchain.embeddings.base import Embeddings
+from openai.types import CreateEmbeddingResponse
+from openai.types.chat import ChatCompletion
+
+# Request arguments that only affect transport, not the response
+_TRANSPORT_KEYS = {"timeout", "extra_headers", "extra_query", "extra_body"}
+
+CASSETTE_MODES = ("auto", "record", "replay")
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+def _normalize(value: Any) -> Any:
+    """Normalize a request so formatting-only differences share a key."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if k not in _TRANSPORT_KEYS and v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+def _pack_vector(vector: List[float]) -> str:
+    # float32 + base64 is about a quarter of the size of JSON floats
+    return base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode("ascii")
+
+def _unpack_vector(packed: str) -> List[float]:
+    return np.frombuffer(base64.b64decode(packed), dtype="<f4").tolist()
+
+class Cassette:
+    def __init__(self, path: str, mode: str = "auto", latency_scale: float = 0.0):
+        """
+        Open a cassette of recorded model calls.
+
+        The cassette is a JSON Lines file with one recorded call per line,
+        keyed by a hash of the normalized request. Repeated requests replay
+        their recorded responses in order; past the end, replay mode repeats
+        the last one and auto mode records a new one.
+
+        Args:
+            path (str): Cassette file
+            mode (str): "replay" serves recorded calls and fails on anything
+                else, "record" starts a fresh recording, "auto" replays what
+                it has and records the rest
+            latency_scale (float): Replayed calls sleep for their recorded
+                latency times this factor (0 for none, 1 for the original)
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if mode == "record":
+            open(path, "w").close()
+        elif os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry["key"], []).append(entry)
+
+    @staticmethod
+    def request_key(kind: str, request: Dict[str, Any]) -> str:
+        """
+        Get the key for a request.
+
+        Args:
+            kind (str): Call type, e.g. "chat" or "embeddings"
+            request (Dict[str, Any]): Request arguments
+
+        Returns:
+            str: Hex digest identifying the normalized request
+        """
+        payload = json.dumps([kind, _normalize(request)], sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def call(self, kind: str, request: Dict[str, Any], send: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Replay a recorded response or make and record the call.
+
+        Args:
+            kind (str): Call type, e.g. "chat" or "embeddings"
+            request (Dict[str, Any]): Request arguments, used for the key
+            send: Makes the real call and returns the response as JSON-compatible data
+
+        Returns:
+            Dict[str, Any]: The response data
+        """
+        key = self.request_key(kind, request)
+        if self.mode != "record":
+            entry = None
+            with self._lock:
+                entries = self._entries.get(key, [])
+                index = self._cursors.get(key, 0)
+                # In auto mode, a repeat past the recorded ones is recorded too
+                if index < len(entries) or (entries and self.mode == "replay"):
+                    self._cursors[key] = index + 1
+                    entry = entries[min(index, len(entries) - 1)]
+            if entry is not None:
+                if self.latency_scale > 0:
+                    time.sleep(entry["latency"] * self.latency_scale)
+                return entry["response"]
+            if self.mode == "replay":
+                raise CassetteMissError(f"No recorded {kind} response for request {key}")
+
+        start = time.perf_counter()
+        response = send()
+        entry = {
+            "key": key,
+            "kind": kind,
+            "latency": round(time.perf_counter() - start, 4),
+            "response": response
+        }
+        with self._lock:
+            self._entries.setdefault(key, []).append(entry)
+            self._cursors[key] = len(self._entries[key])
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        return response
+
+class CassetteClient:
+    """Stand-in for an OpenAI client that records to or replays from a cassette."""
+
+    def __init__(self, cassette: Cassette, client: Optional[Any] = None):
+        """
+        Wrap an OpenAI client.
+
+        Args:
+            cassette (Cassette): Cassette to record to or replay from
+            client: The real client; only needed when calls are recorded
+        """
+        self.cassette = cassette
+        self.client = client
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_chat_completion))
+        self.embeddings = SimpleNamespace(create=self._create_embedding)
+
+    def _create_chat_completion(self, **kwargs: Any) -> ChatCompletion:
+        data = self.cassette.call(
+            "chat",
+            kwargs,
+            lambda: self.client.chat.completions.create(**kwargs).model_dump()
+        )
+        return ChatCompletion.model_validate(data)
+
+    def _create_embedding(self, **kwargs: Any) -> CreateEmbeddingResponse:
+        def send() -> Dict[str, Any]:
+            data = self.client.embeddings.create(**kwargs).model_dump()
+            for item in data["data"]:
+                item["embedding"] = _pack_vector(item["embedding"])
+            return data
+
+        data = self.cassette.call("embeddings", kwargs, send)
+        data = dict(data, data=[dict(item, embedding=_unpack_vector(item["embedding"])) for item in data["data"]])
+        return CreateEmbeddingResponse.model_validate(data)
+
+class CassetteEmbeddings(Embeddings):
+    """LangChain embeddings that record to or replay from a cassette."""
+
+    def __init__(self, cassette: Cassette, embeddings: Optional[Embeddings] = None, model: Optional[str] = None):
+        """
+        Wrap LangChain embeddings.
+
+        Args:
+            cassette (Cassette): Cassette to record to or replay from
+            embeddings: The real embeddings; only needed when calls are recorded
+            model (Optional[str]): Model name for request keys (default: the wrapped embeddings' model)
+        """
+        self.cassette = cassette
+        self.embeddings = embeddings
+        self.model = model or getattr(embeddings, "model", None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        data = self.cassette.call(
+            "embed_documents",
+            {"model": self.model, "input": list(texts)},
+            lambda: {"embeddings": [_pack_vector(v) for v in self.embeddings.embed_documents(texts)]}
+        )
+        return [_unpack_vector(v) for v in data["embeddings"]]
+
+    def embed_query(self, text: str) -> List[float]:
+        data = self.cassette.call(
+            "embed_query",
+            {"model": self.model, "input": text},
+            lambda: {"embedding": _pack_vector(self.embeddings.embed_query(text))}
+        )
+        return _unpack_vector(data["embedding"])
+
+def use_cassette(manager: Any, cassette: Cassette) -> None:
+    """
+    Route every model call made by an InterviewManager through a cassette.
+
+    Covers the manager's chat calls, its AnswerEvaluator's chat and
+    embedding calls, and the vector store's query and document embeddings.
+
+    Args:
+        manager (InterviewManager): Manager to patch in place
+        cassette (Cassette): Cassette to record to or replay from
+    """
+    manager.client = CassetteClient(cassette, manager.client)
+    manager.answer_evaluator.client = CassetteClient(cassette, manager.answer_evaluator.client)
+    manager.vector_store.embeddings = CassetteEmbeddings(cassette, manager.vector_store.embeddings)
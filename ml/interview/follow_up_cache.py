@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+class FollowUpCache:
+    def __init__(self, threshold: float = 0.95, ttl_seconds: float = 7 * 24 * 3600, max_items: int = 10000):
+        """
+        Initialize the semantic follow-up cache.
+
+        Entries are (question embedding, answer embedding) -> follow-up
+        question, held in two L2-normalized float32 matrices. A lookup is a
+        matrix-vector product over the questions, then over the answers of
+        entries with a close question; it hits when some live entry is at
+        least threshold-similar to both the question and the answer.
+
+        Args:
+            threshold (float): Minimum cosine similarity for both question and answer
+            ttl_seconds (float): Age after which entries are no longer served
+            max_items (int): Maximum entries; the least recently used are replaced
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._questions: Optional[np.ndarray] = None
+        self._answers: Optional[np.ndarray] = None
+        self._follow_ups: List[Optional[str]] = []
+        self._created_at = np.zeros(0)
+        self._last_used = np.zeros(0)
+        self._size = 0
+        self._stats = {"hits": 0, "misses": 0, "inserts": 0, "evictions": 0}
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        return array / max(float(np.linalg.norm(array)), 1e-12)
+
+    def _live(self, now: float) -> np.ndarray:
+        """Mask of entries that are filled and not expired. Caller holds the lock."""
+        return self._created_at[:self._size] >= now - self.ttl_seconds
+
+    def get(self, question_embedding: List[float], answer_embedding: List[float]) -> Optional[str]:
+        """
+        Find a stored follow-up for a close enough (question, answer) pair.
+
+        Args:
+            question_embedding (List[float]): Embedding of the question
+            answer_embedding (List[float]): Embedding of the candidate's answer
+
+        Returns:
+            Optional[str]: The follow-up of the closest match, or None
+        """
+        question = self._normalize(question_embedding)
+        answer = self._normalize(answer_embedding)
+        now = time.time()
+        with self._lock:
+            if self._size and self._questions.shape[1] == question.shape[0]:
+                # Only entries for a close question need their answers compared
+                candidates = np.flatnonzero(
+                    (self._questions[:self._size] @ question >= self.threshold) & self._live(now)
+                )
+                if candidates.size:
+                    # A pair is only as close as its less similar half
+                    scores = np.minimum(
+                        self._questions[candidates] @ question,
+                        self._answers[candidates] @ answer
+                    )
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        slot = int(candidates[best])
+                        self._last_used[slot] = now
+                        self._stats["hits"] += 1
+                        return self._follow_ups[slot]
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, question_embedding: List[float], answer_embedding: List[float], follow_up: str) -> None:
+        """
+        Store a generated follow-up.
+
+        Args:
+            question_embedding (List[float]): Embedding of the question
+            answer_embedding (List[float]): Embedding of the candidate's answer
+            follow_up (str): The follow-up question generated for them
+        """
+        question = self._normalize(question_embedding)
+        answer = self._normalize(answer_embedding)
+        now = time.time()
+        with self._lock:
+            if self._questions is None or self._questions.shape[1] != question.shape[0]:
+                # First entry, or the embedding model changed: start over
+                self._allocate(question.shape[0], min(self.max_items, 256))
+
+            expired = np.flatnonzero(~self._live(now))
+            if expired.size:
+                slot = int(expired[0])
+            elif self._size < self.max_items:
+                if self._size == len(self._follow_ups):
+                    self._grow(min(self.max_items, 2 * self._size))
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used[:self._size]))
+                self._stats["evictions"] += 1
+
+            self._questions[slot] = question
+            self._answers[slot] = answer
+            self._follow_ups[slot] = follow_up
+            self._created_at[slot] = now
+            self._last_used[slot] = now
+            self._stats["inserts"] += 1
+
+    def _allocate(self, dim: int, capacity: int) -> None:
+        self._questions = np.zeros((capacity, dim), dtype=np.float32)
+        self._answers = np.zeros((capacity, dim), dtype=np.float32)
+        self._follow_ups = [None] * capacity
+        self._created_at = np.zeros(capacity)
+        self._last_used = np.zeros(capacity)
+        self._size = 0
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self._follow_ups)
+        dim = self._questions.shape[1]
+        self._questions = np.vstack([self._questions, np.zeros((extra, dim), dtype=np.float32)])
+        self._answers = np.vstack([self._answers, np.zeros((extra, dim), dtype=np.float32)])
+        self._follow_ups.extend([None] * extra)
+        self._created_at = np.concatenate([self._created_at, np.zeros(extra)])
+        self._last_used = np.concatenate([self._last_used, np.zeros(extra)])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict[str, Any]: hits, misses, inserts, evictions, hit_rate and size
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                hit_rate=self._stats["hits"] / lookups if lookups else 0.0,
+                size=int(self._live(time.time()).sum())
+            )
@@ -1,45 +1,157 @@
+import json
 import os
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 from openai import OpenAI
 import streamlit as st
+from ..rag.context_packer import ContextPacker
 from ..rag.vector_store import VectorStoreManager
 from .answer_evaluator import AnswerEvaluator
+from .cassette import Cassette, use_cassette
+from .follow_up_cache import FollowUpCache
+from .interview_session import InterviewSession
+from .latency import DEFAULT_STAGE_BUDGETS, LatencyMetrics
+from .question_dedup import AskedQuestionIndex
+from .session_store import SessionStore, get_session_store
+
+# Upper bound on a single API request made by a turn stage; stages stop
+# waiting much sooner, this only frees the worker thread eventually
+STAGE_REQUEST_TIMEOUT = 30.0
+
+# Stage calls that ran past their budget and are still running; beyond this
+# stages are skipped, so abandoned calls can't occupy every stage worker
+MAX_ABANDONED_STAGE_CALLS = 24
+
+# Questions that were generated too late for their turn are kept as fallbacks
+# for later turns of the same session; they are grounded in that candidate's
+# resume and answers, so they are never served to another session
+QUESTION_BANK_SIZE = 8
+QUESTION_BANK_SESSIONS = 1024
+
+# Generated questions this similar to one already asked in the session are regenerated
+QUESTION_DEDUP_THRESHOLD = 0.9
+MAX_QUESTION_REGENERATIONS = 1
+
+# Sessions whose asked-question embeddings are kept in memory
+ASKED_INDEX_SESSIONS = 1024
+
+SKILL_QUESTION_TEMPLATE = "Can you walk me through a project where you used {skill}? What trade-offs did you make?"
+ROLE_QUESTION_TEMPLATE = "What is the most technically challenging problem you have solved as a {role}, and how did you approach it?"
+FOLLOW_UP_TEMPLATES = [
+    "Could you walk me through your reasoning on that in more detail?",
+    "Can you give a concrete example from your own work?",
+    "What would you do differently if you faced that problem again?"
+]
 
 class InterviewManager:
-    def __init__(self, vector_store: VectorStoreManager):
-        """Initialize InterviewManager with vector store."""
+    def __init__(self, vector_store: VectorStoreManager, session_store: Optional[SessionStore] = None, stage_budgets: Optional[Dict[str, float]] = None):
+        """
+        Initialize InterviewManager with vector store.
+        
+        The manager only holds long-lived clients and keeps no per-candidate
+        state, so one instance can serve every session in the process.
+        Interview progress lives in the InterviewSession passed to each call
+        and, when a session store is given, is logged after every turn.
+        
+        Args:
+            vector_store: Resume chunks used for context
+            session_store: Durable log of interview turns
+            stage_budgets: Seconds allowed per turn stage ("embedding",
+                "retrieval", "generation"), overriding DEFAULT_STAGE_BUDGETS
+        """
         self.vector_store = vector_store
-        self.answer_evaluator = AnswerEvaluator()
+        self.session_store = session_store
+        self.context_packer = ContextPacker()
+        self.answer_evaluator = AnswerEvaluator(
+            vector_store,
+            follow_up_cache=FollowUpCache(),
+            context_packer=self.context_packer
+        )
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.interview_history = []
+        self.stage_budgets = dict(DEFAULT_STAGE_BUDGETS, **(stage_budgets or {}))
+        self.metrics = LatencyMetrics()
+        # Stage calls run here so a turn can stop waiting on a slow one
+        self._stage_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="interview-stage")
+        self._abandoned_calls = 0
+        self._abandoned_lock = threading.Lock()
+        # session_id -> late questions, least recently used session first
+        self._question_bank: "OrderedDict[str, Deque[str]]" = OrderedDict()
+        self._bank_lock = threading.Lock()
+        self.dedup_threshold = QUESTION_DEDUP_THRESHOLD
+        # session_id -> embeddings of the questions asked; rebuilt from the
+        # evaluator's embedding cache if a session moves between workers
+        self._asked_indexes: "OrderedDict[str, AskedQuestionIndex]" = OrderedDict()
+        self._asked_lock = threading.Lock()
     
-    def generate_questions(self, resume_text: str, categories: Optional[List[str]] = None, difficulty: Optional[str] = None) -> List[Dict[str, Any]]:
+    def generate_questions(
+        self,
+        resume_text: str,
+        categories: Optional[List[str]] = None,
+        difficulty: Optional[str] = None,
+        num_questions: int = 5,
+        max_workers: int = 4,
+        resume_hash: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Generate interview questions based on resume.
         
+        Questions are generated concurrently, one resume chunk per request,
+        with at most max_workers requests in flight. Category and difficulty
+        are part of each request rather than filters applied afterwards, and
+        spare chunks are only used if a generation fails.
+        
         Args:
             resume_text: Resume text
-            categories: Optional list of question categories
+            categories: Optional list of question categories, spread across chunks
             difficulty: Optional difficulty level
+            num_questions: Number of questions to generate
+            max_workers: Maximum concurrent generation requests
+            resume_hash: Content hash of the resume; limits the search to its chunks
             
         Returns:
-            List of question dictionaries
-        """
-        # Search for relevant content
-        results = self.vector_store.search(resume_text, n_results=5)
-        
-        # Generate questions based on results
-        questions = []
-        for result in results:
-            question = self._generate_question_from_chunk(result["document"])
-            if question:
-                if categories and question["category"] not in categories:
-                    continue
-                if difficulty and question["difficulty"] != difficulty:
-                    continue
-                questions.append(question)
-        
-        return questions
+            List of question dictionaries, in retrieval order
+        """
+        # Search for relevant content, with a few spare chunks
+        results = self.vector_store.search(
+            resume_text,
+            n_results=num_questions + max(1, num_questions // 2),
+            where={"content_hash": resume_hash} if resume_hash else None
+        )
+        targets = [
+            (result["document"], categories[i % len(categories)] if categories else None)
+            for i, result in enumerate(results)
+        ]
+        if not targets:
+            return []
+        
+        questions: Dict[int, Dict[str, Any]] = {}
+        pending = iter(enumerate(targets))
+        workers = max(1, min(max_workers, num_questions))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight = {}
+            while True:
+                # Only keep as many requests in flight as questions still needed
+                while len(in_flight) < min(workers, num_questions - len(questions)):
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    index, (chunk, category) = item
+                    future = pool.submit(self._generate_question_from_chunk, chunk, category, difficulty)
+                    in_flight[future] = index
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    question = future.result()
+                    if question:
+                        questions[index] = question
+        
+        return [questions[index] for index in sorted(questions)][:num_questions]
     
     def evaluate_answer(self, question: str, answer: str, expected_answer: str, threshold: float = 0.5) -> Dict[str, Any]:
         """
@@ -79,189 +191,509 @@ class InterviewManager:
             expected_answer=expected_answer
         )
     
-    def _generate_question_from_chunk(self, chunk: str) -> Optional[Dict[str, Any]]:
-        """Generate a question from a resume chunk."""
-        # This is a placeholder for the actual question generation logic
-        # In a real implementation, this would use an LLM to generate questions
-        return {
-            "question": f"Can you elaborate on your experience with {chunk[:50]}...?",
-            "expected_answer": "The candidate should provide detailed information about their experience.",
-            "category": "Technical",
-            "difficulty": "Intermediate"
-        }
-    
-    def start_interview(self, role: str, experience_level: str) -> str:
+    def _generate_question_from_chunk(self, chunk: str, category: Optional[str] = None, difficulty: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
-        Start a new interview session.
+        Generate a question from a resume chunk.
         
         Args:
-            role (str): The role being interviewed for
-            experience_level (str): Candidate's experience level
+            chunk: Resume chunk to ground the question in
+            category: Required question category, if any
+            difficulty: Required difficulty level, if any
             
         Returns:
-            str: Initial interview question
+            Question dictionary with the requested category and difficulty, or
+            None if generation failed so a spare chunk can be used instead
         """
+        category_rule = f'The category must be "{category}".' if category else 'Choose a category such as "Technical", "Behavioral" or "Problem Solving".'
+        difficulty_rule = f'The difficulty must be "{difficulty}".' if difficulty else 'Choose a difficulty of "Beginner", "Intermediate" or "Advanced".'
         try:
-            # Prepare system message
-            system_message = f"""
-            You are an expert interviewer conducting a technical interview for a {role} position.
-            The candidate's experience level is {experience_level}.
-            Focus on asking relevant technical questions and evaluating their responses.
-            """
-            
-            # Generate initial question
             response = self.client.chat.completions.create(
                 model="gpt-4-turbo-preview",
                 messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": "Start the interview with an appropriate technical question."}
+                    {"role": "system", "content": "You are an expert technical interviewer. Respond with JSON only."},
+                    {"role": "user", "content": f"""
+            Write one interview question about this excerpt from the candidate's resume:
+            {chunk}
+            
+            {category_rule} {difficulty_rule}
+            Respond with a JSON object with the keys "question", "expected_answer", "category" and "difficulty".
+            """}
                 ],
+                response_format={"type": "json_object"},
                 temperature=0.7,
-                max_tokens=150
+                max_tokens=300
             )
+            question = json.loads(response.choices[0].message.content)
+            if not question.get("question"):
+                return None
+        except Exception as e:
+            print(f"Error generating question: {str(e)}")
+            return None
+        
+        question.setdefault("expected_answer", "")
+        question["category"] = category or question.get("category") or "Technical"
+        question["difficulty"] = difficulty or question.get("difficulty") or "Intermediate"
+        return question
+    
+    def resume_session(self, session_id: str) -> Optional[InterviewSession]:
+        """
+        Rehydrate a session from the session store, e.g. after a restart.
+        
+        Args:
+            session_id (str): Session ID
             
-            initial_question = response.choices[0].message.content.strip()
+        Returns:
+            Optional[InterviewSession]: The session, or None if it isn't stored
+        """
+        if self.session_store is None:
+            return None
+        return self.session_store.load(session_id)
+    
+    def _record_turns(self, session: InterviewSession, first_seq: int) -> None:
+        """Queue the turns added since first_seq for the session store."""
+        if self.session_store is not None:
+            self.session_store.append(session, [turn for turn in session.history if turn["seq"] >= first_seq])
+    
+    def start_interview(self, session: InterviewSession) -> str:
+        """
+        Start a new interview session.
+        
+        Args:
+            session (InterviewSession): Session holding the role, experience level and skills
             
-            # Store in history
-            self.interview_history.append({
-                "role": "assistant",
-                "content": initial_question,
-                "type": "question"
-            })
+        Returns:
+            str: Initial interview question
+        """
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            initial_question = self._within_budget(
+                "generation",
+                self._generate_initial_question,
+                session,
+                on_late=lambda question: self._bank_question(session, question)
+            )
+            if initial_question is None:
+                initial_question, tier = self._fallback_question(session)
+            else:
+                tier = "generated"
+            self.metrics.record_tier(tier)
             
+            # Store in history
+            first_seq = session.turn_count
+            session.add_turn("assistant", initial_question, "question")
+            self._record_turns(session, first_seq)
+            outcome = "ok"
             return initial_question
-            
-        except Exception as e:
-            st.error(f"Error starting interview: {str(e)}")
-            return "Let's begin the interview. Could you tell me about your experience with [relevant technology]?"
+        finally:
+            self.metrics.record_stage("turn", time.perf_counter() - started, outcome)
     
-    def get_response(self, user_input: str) -> str:
+    def get_response(self, session: InterviewSession, user_input: str) -> str:
         """
         Get AI response to user input.
         
+        The answer, its similarity score and the next question are recorded
+        in the session. Each stage (embedding, retrieval, generation) has its
+        own deadline; a stage that misses it is skipped or replaced by a
+        cached or template question, so the turn never waits much longer
+        than the sum of the budgets.
+        
         Args:
+            session (InterviewSession): The candidate's interview session
             user_input (str): User's input/answer
             
         Returns:
             str: AI response
         """
+        started = time.perf_counter()
+        first_seq = session.turn_count
+        outcome = "ok"
         try:
-            # Store user input in history
-            self.interview_history.append({
-                "role": "user",
-                "content": user_input,
-                "type": "answer"
-            })
+            # Get the last question before recording the answer
+            last_question = session.last_question
             
-            # Get the last question from history
-            last_question = next(
-                (item["content"] for item in reversed(self.interview_history) 
-                 if item["type"] == "question"),
-                None
-            )
-            
-            if last_question:
-                # Evaluate the answer
-                similarity, is_acceptable = self.answer_evaluator.evaluate_answer(
-                    candidate_answer=user_input,
-                    expected_answer=last_question  # Using question as expected answer for now
-                )
+            if not last_question:
+                session.add_turn("user", user_input, "answer")
                 
-                # Get feedback
-                feedback = self.answer_evaluator.get_feedback(similarity, is_acceptable)
-                
-                # Generate follow-up if needed
-                if not is_acceptable:
-                    follow_up = self.answer_evaluator.generate_follow_up(
-                        question=last_question,
-                        candidate_answer=user_input
-                    )
-                    
-                    # Store follow-up in history
-                    self.interview_history.append({
-                        "role": "assistant",
-                        "content": follow_up,
-                        "type": "question"
-                    })
-                    
-                    return f"{feedback}\n\nFollow-up question: {follow_up}"
-                else:
-                    # Generate next question
-                    next_question = self._generate_next_question(user_input)
-                    
-                    # Store next question in history
-                    self.interview_history.append({
-                        "role": "assistant",
-                        "content": next_question,
-                        "type": "question"
-                    })
-                    
-                    return f"{feedback}\n\nNext question: {next_question}"
-            else:
                 # Generate new question if no previous question
-                new_question = self._generate_next_question(user_input)
+                new_question = self._next_question(session, user_input)
                 
                 # Store new question in history
-                self.interview_history.append({
-                    "role": "assistant",
-                    "content": new_question,
-                    "type": "question"
-                })
-                
+                session.add_turn("assistant", new_question, "question")
                 return new_question
             
+            # Evaluate the answer
+            evaluation = self._within_budget(
+                "embedding",
+                self.answer_evaluator.evaluate_answer,
+                candidate_answer=user_input,
+                expected_answer=last_question  # Using question as expected answer for now
+            )
+            if evaluation is None:
+                # Unscored answers move on rather than trigger a follow-up
+                similarity, is_acceptable = None, True
+                feedback = "Thanks for your answer."
+            else:
+                similarity, is_acceptable = evaluation
+                feedback = self.answer_evaluator.get_feedback(similarity, is_acceptable)
+            session.add_turn("user", user_input, "answer", score=similarity)
+            
+            # Generate follow-up if needed
+            if not is_acceptable:
+                follow_up = self._follow_up_question(session, last_question, user_input)
+                
+                # Store follow-up in history
+                session.add_turn("assistant", follow_up, "question")
+                
+                return f"{feedback}\n\nFollow-up question: {follow_up}"
+            
+            # Generate next question
+            next_question = self._next_question(session, user_input)
+            
+            # Store next question in history
+            session.add_turn("assistant", next_question, "question")
+            
+            return f"{feedback}\n\nNext question: {next_question}"
+            
         except Exception as e:
             st.error(f"Error getting response: {str(e)}")
+            outcome = "error"
             return "I apologize, but I'm having trouble processing your response. Could you please rephrase your answer?"
+        finally:
+            # Logged in the background, so the turn doesn't wait on disk
+            self._record_turns(session, first_seq)
+            self.metrics.record_stage("turn", time.perf_counter() - started, outcome)
     
-    def _generate_next_question(self, context: str) -> str:
+    def _within_budget(self, stage: str, func: Callable[..., Any], *args: Any, on_late: Optional[Callable[[Any], None]] = None, budget: Optional[float] = None, **kwargs: Any) -> Any:
         """
-        Generate the next interview question based on context.
+        Run one turn stage, giving up once its budget is spent.
+        
+        A call that misses its deadline is cancelled if it hasn't started and
+        nobody wants its late result. While MAX_ABANDONED_STAGE_CALLS calls
+        are still running past their deadline, stages are skipped outright.
         
         Args:
-            context (str): Context from previous interaction
+            stage (str): Stage name, a key of stage_budgets
+            func: The stage call
+            on_late: Receives the result if the call completes after the deadline
+            budget: Seconds to wait instead of the stage's budget
             
         Returns:
-            str: Next question
+            The call's result, or None if it failed, returned nothing or timed out
         """
+        started = time.perf_counter()
+        if self._abandoned_calls >= MAX_ABANDONED_STAGE_CALLS:
+            self.metrics.record_event("stage_pool_saturated")
+            self.metrics.record_stage(stage, 0.0, "timeout")
+            return None
+        future = self._stage_pool.submit(func, *args, **kwargs)
         try:
-            # Get relevant context from vector store
-            search_results = self.vector_store.search(
-                query=context,
-                n_results=3
+            result = future.result(timeout=self.stage_budgets[stage] if budget is None else max(budget, 0.0))
+        except FuturesTimeoutError:
+            self.metrics.record_stage(stage, time.perf_counter() - started, "timeout")
+            if on_late is None:
+                # Nobody needs the result; drop the call if it hasn't started
+                future.cancel()
+            else:
+                # Keep a slow result for later turns instead of wasting it
+                def keep_late_result(done: Future) -> None:
+                    if done.exception() is None and done.result():
+                        on_late(done.result())
+                future.add_done_callback(keep_late_result)
+            if not future.cancelled():
+                self._track_abandoned(future)
+            return None
+        except Exception as e:
+            print(f"Error in {stage} stage: {str(e)}")
+            self.metrics.record_stage(stage, time.perf_counter() - started, "error")
+            return None
+        self.metrics.record_stage(stage, time.perf_counter() - started, "ok" if result is not None else "error")
+        return result
+    
+    def _track_abandoned(self, future: Future) -> None:
+        """Count a call that is still running past its deadline until it finishes."""
+        def release(_: Future) -> None:
+            with self._abandoned_lock:
+                self._abandoned_calls -= 1
+        
+        with self._abandoned_lock:
+            self._abandoned_calls += 1
+        future.add_done_callback(release)
+    
+    def _retrieve_context(self, query: str, session: InterviewSession) -> str:
+        """
+        Get context from the session's resume for a query, packed into the
+        context token budget.
+        
+        The collection holds every candidate's chunks, so the search is
+        limited to the session's resume. Returns "" if the session has no
+        resume or retrieval misses its budget.
+        """
+        if not session.resume_hash:
+            return ""
+        results = self._within_budget(
+            "retrieval",
+            self.vector_store.search,
+            query=query,
+            n_results=3,
+            where={"content_hash": session.resume_hash}
+        )
+        context, report = self.context_packer.pack(results or [])
+        self.metrics.record_event("context_tokens", report["tokens_packed"])
+        self.metrics.record_event("context_tokens_saved", report["tokens_saved"])
+        return context
+    
+    def _next_question(self, session: InterviewSession, context: str) -> str:
+        """
+        Get the next question: generated, else cached, else from a template.
+        
+        A generated question that paraphrases one already asked in the
+        session is regenerated, all within one generation budget.
+        """
+        relevant_context = self._retrieve_context(context, session)
+        deadline = time.perf_counter() + self.stage_budgets["generation"]
+        asked = self._asked_index(session)
+        avoid: List[str] = []
+        question = None
+        for _ in range(1 + MAX_QUESTION_REGENERATIONS):
+            candidate = self._within_budget(
+                "generation",
+                self._generate_next_question,
+                context,
+                relevant_context,
+                avoid,
+                on_late=lambda late: self._bank_question(session, late),
+                budget=deadline - time.perf_counter()
             )
-            
-            # Prepare prompt
-            prompt = f"""
-            Previous interaction: {context}
-            
-            Based on the candidate's response, generate the next appropriate technical question that:
-            1. Builds upon their previous answer
-            2. Explores related technical concepts
-            3. Maintains a logical progression in the interview
-            4. Is specific and focused
-            
-            Next Question:
-            """
-            
-            # Add relevant context
-            if search_results:
-                context = "\n".join([result["content"] for result in search_results])
-                prompt += f"\nRelevant Context:\n{context}"
-            
-            # Generate next question
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=150
+            if candidate is None:
+                break
+            # Embedded now, this is reused when the answer to it is scored
+            embedding = self._within_budget(
+                "embedding",
+                self.answer_evaluator.get_embedding,
+                candidate,
+                budget=min(self.stage_budgets["embedding"], deadline - time.perf_counter())
             )
+            if not embedding:
+                question = candidate
+                break
+            similarity, nearest = asked.nearest(embedding)
+            if similarity < self.dedup_threshold:
+                question = candidate
+                asked.add(candidate, embedding)
+                break
+            self.metrics.record_event("duplicate_question")
+            avoid = [candidate, nearest]
+        
+        if question is None:
+            question, tier = self._fallback_question(session)
+        else:
+            tier = "generated"
+        self.metrics.record_tier(tier)
+        return question
+    
+    def _asked_index(self, session: InterviewSession) -> AskedQuestionIndex:
+        """
+        Get the asked-question embeddings of a session.
+        
+        Questions in the session history are added as soon as their
+        embedding has been computed for scoring; nothing is embedded here.
+        """
+        with self._asked_lock:
+            index = self._asked_indexes.get(session.session_id)
+            if index is None:
+                index = self._asked_indexes[session.session_id] = AskedQuestionIndex()
+            self._asked_indexes.move_to_end(session.session_id)
+            while len(self._asked_indexes) > ASKED_INDEX_SESSIONS:
+                self._asked_indexes.popitem(last=False)
+        
+        for turn in session.history:
+            if turn["type"] == "question" and turn["content"] not in index.texts:
+                embedding = self.answer_evaluator.cached_embedding(turn["content"])
+                if embedding:
+                    index.add(turn["content"], embedding)
+        return index
+    
+    def _follow_up_question(self, session: InterviewSession, question: str, answer: str) -> str:
+        """
+        Get a follow-up on an answer: generated, else from a template.
+        
+        The follow-up cache is looked up by the question and answer
+        embeddings. Scoring the answer usually embedded both already; any
+        that are missing are embedded within the embedding budget, and the
+        generation stage only uses embeddings that are already cached.
+        Cached follow-ups don't use resume context, so it is only retrieved
+        when the cache can't be used.
+        """
+        cacheable = False
+        if self.answer_evaluator.follow_up_cache is not None:
+            deadline = time.perf_counter() + self.stage_budgets["embedding"]
+            for text in (question, answer):
+                if self.answer_evaluator.cached_embedding(text) is None:
+                    self._within_budget(
+                        "embedding",
+                        self.answer_evaluator.get_embedding,
+                        text,
+                        budget=deadline - time.perf_counter()
+                    )
+            cacheable = all(self.answer_evaluator.cached_embedding(text) is not None for text in (question, answer))
+        follow_up = self._within_budget(
+            "generation",
+            self.answer_evaluator.generate_follow_up,
+            question=question,
+            candidate_answer=answer,
+            context="" if cacheable else self._retrieve_context(f"{question} {answer}", session),
+            embed=False,
+            resume_hash=session.resume_hash
+        )
+        if follow_up is None:
+            follow_up, tier = self._fallback_question(session, follow_up=True)
+        else:
+            tier = "generated"
+        self.metrics.record_tier(tier)
+        return follow_up
+    
+    def _bank_question(self, session: InterviewSession, question: str) -> None:
+        """Keep a late generated question as a fallback for later turns of the session."""
+        with self._bank_lock:
+            bank = self._question_bank.get(session.session_id)
+            if bank is None:
+                bank = self._question_bank[session.session_id] = deque(maxlen=QUESTION_BANK_SIZE)
+            self._question_bank.move_to_end(session.session_id)
+            while len(self._question_bank) > QUESTION_BANK_SESSIONS:
+                self._question_bank.popitem(last=False)
+            if question not in bank:
+                bank.append(question)
+    
+    def _fallback_question(self, session: InterviewSession, follow_up: bool = False) -> Tuple[str, str]:
+        """
+        Pick a question without calling the model.
+        
+        Questions generated too late for an earlier turn of the session come
+        first, then templates built from the session's skills. Questions the
+        session has already been asked are skipped.
+        
+        Returns:
+            Tuple[str, str]: (question, tier)
+        """
+        asked = {turn["content"] for turn in session.history if turn["type"] == "question"}
+        if follow_up:
+            candidates = FOLLOW_UP_TEMPLATES
+        else:
+            with self._bank_lock:
+                cached = [q for q in reversed(self._question_bank.get(session.session_id, ())) if q not in asked]
+            if cached:
+                return cached[0], "cached"
+            candidates = [SKILL_QUESTION_TEMPLATE.format(skill=skill) for skill in session.skills]
+            candidates.append(ROLE_QUESTION_TEMPLATE.format(role=session.role))
+        
+        for candidate in candidates:
+            if candidate not in asked:
+                return candidate, "template"
+        return candidates[-1], "template"
+    
+    def _generate_initial_question(self, session: InterviewSession) -> str:
+        """Generate the opening question for a session. Raises on API errors."""
+        # Prepare system message
+        system_message = f"""
+        You are an expert interviewer conducting a technical interview for a {session.role} position.
+        The candidate's experience level is {session.experience_level}.
+        Focus on asking relevant technical questions and evaluating their responses.
+        """
+        if session.skills:
+            system_message += f"The candidate's resume lists these skills: {', '.join(session.skills)}.\n"
+        
+        # Generate initial question
+        response = self.client.chat.completions.create(
+            model="gpt-4-turbo-preview",
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": "Start the interview with an appropriate technical question."}
+            ],
+            temperature=0.7,
+            max_tokens=150,
+            timeout=STAGE_REQUEST_TIMEOUT
+        )
+        
+        return response.choices[0].message.content.strip()
+    
+    def _generate_next_question(self, context: str, relevant_context: str = "", avoid: Sequence[str] = ()) -> str:
+        """
+        Generate the next interview question based on context.
+        
+        Args:
+            context (str): Context from previous interaction
+            relevant_context (str): Resume context retrieved for the interaction
+            avoid (Sequence[str]): Questions the new one must not repeat or paraphrase
             
-            return response.choices[0].message.content.strip()
+        Returns:
+            str: Next question
             
-        except Exception as e:
-            st.error(f"Error generating next question: {str(e)}")
-            return "Could you tell me more about your experience with [relevant technology]?" 
\ No newline at end of file
+        Raises:
+            Exception: If the API call fails, so the caller can fall back
+        """
+        # Prepare prompt
+        prompt = f"""
+        Previous interaction: {context}
+        
+        Based on the candidate's response, generate the next appropriate technical question that:
+        1. Builds upon their previous answer
+        2. Explores related technical concepts
+        3. Maintains a logical progression in the interview
+        4. Is specific and focused
+        
+        Next Question:
+        """
+        
+        # Add relevant context
+        if relevant_context:
+            prompt += f"\nRelevant Context:\n{relevant_context}"
+        if avoid:
+            prompt += "\nDo not repeat or paraphrase these questions, which were already asked:\n"
+            prompt += "\n".join(f"- {question}" for question in avoid)
+        
+        # Generate next question
+        response = self.client.chat.completions.create(
+            model="gpt-4-turbo-preview",
+            messages=[
+                {"role": "system", "content": "You are an expert technical interviewer."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=150,
+            timeout=STAGE_REQUEST_TIMEOUT
+        )
+        
+        return response.choices[0].message.content.strip()
+
+_managers: Dict[str, InterviewManager] = {}
+_managers_lock = threading.Lock()
+
+def get_interview_manager(collection_name: str = "resume_chunks") -> InterviewManager:
+    """
+    Get the process-wide interview engine for a collection, creating it on first use.
+    
+    When OPENAI_CASSETTE names a cassette file, model calls go through it
+    (see ml.interview.cassette), in OPENAI_CASSETTE_MODE ("replay" by
+    default) with replayed latency scaled by OPENAI_CASSETTE_LATENCY.
+    
+    Args:
+        collection_name (str): Vector store collection to draw resume context from
+        
+    Returns:
+        InterviewManager: Manager shared by every session in this process
+    """
+    manager = _managers.get(collection_name)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.get(collection_name)
+            if manager is None:
+                manager = InterviewManager(VectorStoreManager(collection_name), session_store=get_session_store())
+                if os.getenv("OPENAI_CASSETTE"):
+                    use_cassette(manager, Cassette(
+                        os.getenv("OPENAI_CASSETTE"),
+                        mode=os.getenv("OPENAI_CASSETTE_MODE", "replay"),
+                        latency_scale=float(os.getenv("OPENAI_CASSETTE_LATENCY", "0"))
+                    ))
+                _managers[collection_name] = manager
+    return manager
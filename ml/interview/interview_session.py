@@ -0,0 +1,109 @@
+import json
+import uuid
+from typing import Any, Dict, List, Optional
+
+class InterviewSession:
+    """
+    Per-candidate interview state, kept apart from the shared InterviewManager.
+
+    A session holds only plain data, so it can live in st.session_state, be
+    stored as JSON and be resumed by any worker. The history keeps the last
+    max_history_items turns; older turns are never sent to the model.
+    """
+
+    __slots__ = ("session_id", "role", "experience_level", "skills", "resume_hash", "history", "max_history_items", "turn_count")
+
+    def __init__(
+        self,
+        role: str,
+        experience_level: str,
+        skills: Optional[List[str]] = None,
+        resume_hash: Optional[str] = None,
+        session_id: Optional[str] = None,
+        history: Optional[List[Dict[str, Any]]] = None,
+        max_history_items: int = 20,
+        turn_count: Optional[int] = None
+    ):
+        """
+        Initialize an interview session.
+
+        Args:
+            role (str): The role being interviewed for
+            experience_level (str): Candidate's experience level
+            skills (Optional[List[str]]): Skills found on the candidate's resume
+            resume_hash (Optional[str]): Content hash of the candidate's resume; only
+                chunks with this hash are used as context
+            session_id (Optional[str]): Existing session ID (default: a new one)
+            history (Optional[List[Dict[str, Any]]]): Turns so far, oldest first
+            max_history_items (int): Number of turns kept
+            turn_count (Optional[int]): Turns recorded so far, including dropped ones
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.role = role
+        self.experience_level = experience_level
+        self.skills = list(skills or [])[:20]
+        self.resume_hash = resume_hash
+        self.history: List[Dict[str, Any]] = list(history or [])
+        self.max_history_items = max_history_items
+        self.turn_count = len(self.history) if turn_count is None else turn_count
+
+    def add_turn(self, role: str, content: str, turn_type: str, score: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Record a question or an answer.
+
+        Each turn gets the next sequence number, so turns can be logged and
+        replayed in order.
+
+        Args:
+            role (str): "assistant" or "user"
+            content (str): Question or answer text
+            turn_type (str): "question" or "answer"
+            score (Optional[float]): Similarity score of an answer
+
+        Returns:
+            Dict[str, Any]: The recorded turn
+        """
+        turn: Dict[str, Any] = {"seq": self.turn_count, "role": role, "content": content, "type": turn_type}
+        if score is not None:
+            turn["score"] = float(score)
+        self.turn_count += 1
+        self.history.append(turn)
+        del self.history[:-self.max_history_items]
+        return turn
+
+    @property
+    def last_question(self) -> Optional[str]:
+        """The most recent question asked, if any."""
+        return next((turn["content"] for turn in reversed(self.history) if turn["type"] == "question"), None)
+
+    @property
+    def last_score(self) -> Optional[float]:
+        """The similarity score of the most recent answer, if it was evaluated."""
+        return next((turn.get("score") for turn in reversed(self.history) if turn["type"] == "answer"), None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the session as JSON-compatible data."""
+        return {
+            "session_id": self.session_id,
+            "role": self.role,
+            "experience_level": self.experience_level,
+            "skills": self.skills,
+            "resume_hash": self.resume_hash,
+            "history": self.history,
+            "max_history_items": self.max_history_items,
+            "turn_count": self.turn_count
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InterviewSession":
+        """Rebuild a session from to_dict() output."""
+        return cls(**data)
+
+    def to_json(self) -> str:
+        """Serialize the session to a compact JSON string."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "InterviewSession":
+        """Rebuild a session from to_json() output."""
+        return cls.from_dict(json.loads(data))
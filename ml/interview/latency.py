@@ -0,0 +1,85 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Default per-stage deadlines for one interview turn, in seconds
+DEFAULT_STAGE_BUDGETS = {
+    "embedding": 2.0,
+    "retrieval": 1.0,
+    "generation": 6.0
+}
+
+# Where a turn's question came from, best first
+QUESTION_TIERS = ("generated", "cached", "template")
+
+def _percentile(samples: Deque[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class LatencyMetrics:
+    def __init__(self, max_samples: int = 1024):
+        """
+        Initialize in-process latency and fallback counters.
+
+        Latencies are kept as a sliding window of the most recent samples per
+        stage, so percentiles reflect current upstream behaviour.
+
+        Args:
+            max_samples (int): Samples kept per stage for percentiles
+        """
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+        self._tiers: Dict[str, int] = {tier: 0 for tier in QUESTION_TIERS}
+        self._events: Dict[str, int] = {}
+
+    def record_stage(self, stage: str, seconds: float, outcome: str) -> None:
+        """
+        Record one stage call.
+
+        Args:
+            stage (str): Stage name, e.g. "embedding" or "turn"
+            seconds (float): Time waited for the stage
+            outcome (str): "ok", "timeout" or "error"
+        """
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.max_samples)
+                self._outcomes[stage] = {"ok": 0, "timeout": 0, "error": 0}
+            samples.append(seconds)
+            self._outcomes[stage][outcome] = self._outcomes[stage].get(outcome, 0) + 1
+
+    def record_tier(self, tier: str) -> None:
+        """Record which fallback tier supplied a question."""
+        with self._lock:
+            self._tiers[tier] = self._tiers.get(tier, 0) + 1
+
+    def record_event(self, event: str, count: int = 1) -> None:
+        """Count an event, e.g. a rejected duplicate question or tokens saved."""
+        with self._lock:
+            self._events[event] = self._events.get(event, 0) + count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current counters.
+
+        Returns:
+            Dict[str, Any]: Per stage, outcome counts and p50/p99 latency in
+                milliseconds; per tier, the number of questions it supplied;
+                per event, its count
+        """
+        with self._lock:
+            stages = {}
+            for stage, samples in self._samples.items():
+                p50 = _percentile(samples, 0.50)
+                p99 = _percentile(samples, 0.99)
+                stages[stage] = dict(
+                    self._outcomes[stage],
+                    p50_ms=None if p50 is None else p50 * 1000,
+                    p99_ms=None if p99 is None else p99 * 1000
+                )
+            return {"stages": stages, "tiers": dict(self._tiers), "events": dict(self._events)}
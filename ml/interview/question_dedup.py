@@ -0,0 +1,56 @@
+from typing import List, Optional, Set, Tuple
+import numpy as np
+
+class AskedQuestionIndex:
+    def __init__(self, capacity: int = 32):
+        """
+        Initialize the embeddings of questions asked in one session.
+
+        Embeddings are kept L2-normalized in one float32 matrix, so checking
+        a candidate against every asked question is a single matrix-vector
+        product. Once full, the oldest question is overwritten.
+
+        Args:
+            capacity (int): Number of recent questions kept
+        """
+        self.capacity = capacity
+        self.texts: Set[str] = set()
+        self._matrix: Optional[np.ndarray] = None
+        self._texts: List[Optional[str]] = [None] * capacity
+        self._count = 0
+
+    def add(self, text: str, embedding: List[float]) -> None:
+        """Record an asked question and its embedding."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+            self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+            self._texts = [None] * self.capacity
+            self.texts = set()
+            self._count = 0
+
+        slot = self._count % self.capacity
+        if self._texts[slot] is not None:
+            self.texts.discard(self._texts[slot])
+        self._matrix[slot] = vector / max(float(np.linalg.norm(vector)), 1e-12)
+        self._texts[slot] = text
+        self.texts.add(text)
+        self._count += 1
+
+    def nearest(self, embedding: List[float]) -> Tuple[float, Optional[str]]:
+        """
+        Find the asked question closest to a candidate.
+
+        Args:
+            embedding (List[float]): Embedding of the candidate question
+
+        Returns:
+            Tuple[float, Optional[str]]: (cosine similarity, question text),
+                or (0.0, None) if nothing comparable has been asked
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+            return 0.0, None
+        size = min(self._count, self.capacity)
+        similarities = self._matrix[:size] @ (vector / max(float(np.linalg.norm(vector)), 1e-12))
+        best = int(np.argmax(similarities))
+        return float(similarities[best]), self._texts[best]
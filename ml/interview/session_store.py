@@ -0,0 +1,264 @@
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from .interview_session import InterviewSession
+
+# Writes kept for retry while the database is failing; the oldest are dropped beyond this
+MAX_FAILED_WRITES = 10000
+
+# Queued to make the writer retry failed writes without waiting for retry_interval
+_RETRY = object()
+
+class SessionStore:
+    def __init__(self, db_path: str = "data/interview_sessions.db", batch_size: int = 256, retry_interval: float = 1.0):
+        """
+        Initialize the durable interview session log with database path.
+
+        Turns are appended to a SQLite database in WAL mode by a background
+        writer thread, so recording a turn never waits on disk. Pending turns
+        are grouped into one transaction per batch, and are flushed before
+        any read and at interpreter exit. A batch that fails to commit is
+        kept and retried with the next batch, or after retry_interval
+        seconds; last_error and flush() report the failure meanwhile.
+
+        Args:
+            db_path (str): Path to the SQLite database
+            batch_size (int): Maximum queued writes committed together
+            retry_interval (float): Seconds between retries of failed writes
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.last_error: Optional[Exception] = None
+        self.dropped_writes = 0
+        # Writes whose batch failed, oldest first; only the writer thread changes this
+        self._failed: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._init_db()
+        self._writer = threading.Thread(target=self._write_loop, name="interview-session-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        """Create the session tables if they don't exist."""
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            # WAL is a property of the database file; readers never block the writer
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interview_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    experience_level TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    resume_hash TEXT,
+                    max_history_items INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interview_turns (
+                    session_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    role TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    score REAL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (session_id, seq)
+                )
+            """)
+            # Databases created before sessions recorded their resume
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(interview_sessions)")}
+            if "resume_hash" not in columns:
+                cursor.execute("ALTER TABLE interview_sessions ADD COLUMN resume_hash TEXT")
+            conn.commit()
+
+    def append(self, session: InterviewSession, turns: List[Dict[str, Any]]) -> None:
+        """
+        Queue new turns of a session for writing and return immediately.
+
+        Args:
+            session (InterviewSession): The session the turns belong to
+            turns (List[Dict[str, Any]]): Turns recorded by session.add_turn
+        """
+        header = {
+            "session_id": session.session_id,
+            "role": session.role,
+            "experience_level": session.experience_level,
+            "skills": json.dumps(session.skills),
+            "resume_hash": session.resume_hash,
+            "max_history_items": session.max_history_items,
+            "at": time.time()
+        }
+        self._queue.put((header, [dict(turn) for turn in turns]))
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.retry_interval if self._failed else None)
+                    batch = [item]
+                except queue.Empty:
+                    # Nothing new; retry the failed writes on their own
+                    item, batch = _RETRY, []
+                while item is not None and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+
+                # Failed writes go first so turns are still committed in order
+                entries = self._failed + [entry for entry in batch if isinstance(entry, tuple)]
+                try:
+                    self._write_batch(conn, entries)
+                    self._failed = []
+                    self.last_error = None
+                except sqlite3.Error as e:
+                    print(f"Error writing interview sessions, will retry: {str(e)}")
+                    self.last_error = e
+                    if len(entries) > MAX_FAILED_WRITES:
+                        self.dropped_writes += len(entries) - MAX_FAILED_WRITES
+                        print(f"Dropped {len(entries) - MAX_FAILED_WRITES} interview session writes")
+                    self._failed = entries[-MAX_FAILED_WRITES:]
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if batch and batch[-1] is None:
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, batch: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]) -> None:
+        if not batch:
+            return
+        with conn:
+            for header, turns in batch:
+                conn.execute("""
+                    INSERT INTO interview_sessions
+                        (session_id, role, experience_level, skills, resume_hash, max_history_items, created_at, updated_at)
+                    VALUES (:session_id, :role, :experience_level, :skills, :resume_hash, :max_history_items, :at, :at)
+                    ON CONFLICT(session_id) DO UPDATE SET updated_at = excluded.updated_at
+                """, header)
+                # Turns are append-only; replaying a turn is a no-op
+                conn.executemany("""
+                    INSERT OR IGNORE INTO interview_turns
+                        (session_id, seq, role, type, content, score, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (header["session_id"], turn["seq"], turn["role"], turn["type"],
+                     turn["content"], turn.get("score"), header["at"])
+                    for turn in turns
+                ])
+
+    def flush(self) -> bool:
+        """
+        Wait until every queued turn has been written or has failed to write.
+
+        Returns:
+            bool: True if everything was written, False if some writes failed
+                and are waiting to be retried (see last_error)
+        """
+        if self._writer.is_alive():
+            if self._failed:
+                self._queue.put(_RETRY)
+            self._queue.join()
+        return not self._failed
+
+    def load(self, session_id: str) -> Optional[InterviewSession]:
+        """
+        Rehydrate a session from the log.
+
+        Args:
+            session_id (str): Session ID
+
+        Returns:
+            Optional[InterviewSession]: The session with its most recent turns,
+                or None if it was never recorded
+        """
+        if not self.flush():
+            print(f"Loading interview session {session_id} while some turns are unwritten: {str(self.last_error)}")
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT role, experience_level, skills, resume_hash, max_history_items
+                FROM interview_sessions
+                WHERE session_id = ?
+            """, (session_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            role, experience_level, skills, resume_hash, max_history_items = row
+
+            cursor.execute("""
+                SELECT seq, role, type, content, score
+                FROM interview_turns
+                WHERE session_id = ?
+                ORDER BY seq DESC
+                LIMIT ?
+            """, (session_id, max_history_items))
+            rows = cursor.fetchall()
+
+        history = []
+        for seq, turn_role, turn_type, content, score in reversed(rows):
+            turn: Dict[str, Any] = {"seq": seq, "role": turn_role, "content": content, "type": turn_type}
+            if score is not None:
+                turn["score"] = score
+            history.append(turn)
+
+        return InterviewSession(
+            role,
+            experience_level,
+            skills=json.loads(skills),
+            resume_hash=resume_hash,
+            session_id=session_id,
+            history=history,
+            max_history_items=max_history_items,
+            turn_count=rows[0][0] + 1 if rows else 0
+        )
+
+    def close(self) -> None:
+        """Write everything still queued and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+_stores: Dict[str, SessionStore] = {}
+_stores_lock = threading.Lock()
+
+def get_session_store(db_path: str = "data/interview_sessions.db") -> SessionStore:
+    """
+    Get the process-wide session store for a database, creating it on first use.
+
+    Args:
+        db_path (str): Path to the SQLite database
+
+    Returns:
+        SessionStore: Store shared by every caller in this process
+    """
+    key = os.path.abspath(db_path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = SessionStore(db_path)
+                _stores[key] = store
+    return store
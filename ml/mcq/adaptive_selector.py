@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+class AdaptiveSelector:
+    def __init__(
+        self,
+        question_ids: Sequence[str],
+        pools: Optional[Dict[str, Sequence[str]]] = None,
+        k_question: float = 0.4,
+        k_user: float = 0.8,
+        exploration: float = 0.1,
+        seed: Optional[int] = None,
+        max_users: int = 100000
+    ):
+        """
+        Initialize the adaptive question selector.
+
+        Questions and users are calibrated on a shared logit scale with a
+        Rasch (1PL) model: P(correct) = sigmoid(ability - difficulty). Both
+        estimates are updated Elo-style after every answer, with step sizes
+        that shrink as more answers are observed.
+
+        Args:
+            question_ids (Sequence[str]): All question IDs, in catalog order
+            pools (Optional[Dict[str, Sequence[str]]]): Question IDs per role
+            k_question (float): Base step size for difficulty updates
+            k_user (float): Base step size for ability updates
+            exploration (float): Bonus for rarely attempted questions
+            seed (Optional[int]): Seed for tie-breaking jitter
+            max_users (int): Users whose ability is kept; the least recently
+                updated one is forgotten to make room for a new one
+        """
+        self.k_question = k_question
+        self.k_user = k_user
+        self.exploration = exploration
+        self.max_users = max_users
+        self._lock = threading.Lock()
+        self._rng = np.random.default_rng(seed)
+
+        self.question_ids: List[str] = []
+        self._ordinals: Dict[str, int] = {}
+        self.difficulty = np.zeros(0, dtype=np.float32)
+        self.attempts = np.zeros(0, dtype=np.int32)
+        self._pools: Dict[str, np.ndarray] = {}
+
+        # user_id -> ability slot, least recently updated first
+        self._users: "OrderedDict[str, int]" = OrderedDict()
+        self.ability = np.zeros(min(16, max_users), dtype=np.float32)
+        self.user_attempts = np.zeros(min(16, max_users), dtype=np.int32)
+
+        self.sync(question_ids, pools)
+
+    def sync(self, question_ids: Sequence[str], pools: Optional[Dict[str, Sequence[str]]] = None) -> None:
+        """
+        Align the selector with a (possibly reloaded) question bank.
+
+        Estimates are carried over by question ID; new questions start at
+        difficulty 0.
+
+        Args:
+            question_ids (Sequence[str]): All question IDs, in catalog order
+            pools (Optional[Dict[str, Sequence[str]]]): Question IDs per role
+        """
+        with self._lock:
+            difficulty = np.zeros(len(question_ids), dtype=np.float32)
+            attempts = np.zeros(len(question_ids), dtype=np.int32)
+            for i, question_id in enumerate(question_ids):
+                old = self._ordinals.get(question_id)
+                if old is not None:
+                    difficulty[i] = self.difficulty[old]
+                    attempts[i] = self.attempts[old]
+
+            self.question_ids = list(question_ids)
+            self._ordinals = {question_id: i for i, question_id in enumerate(self.question_ids)}
+            self.difficulty = difficulty
+            self.attempts = attempts
+            self._pools = {
+                role_id: np.fromiter(
+                    (self._ordinals[q] for q in ids if q in self._ordinals), dtype=np.int64
+                )
+                for role_id, ids in (pools or {}).items()
+            }
+
+    def _user_slot(self, user_id: str) -> int:
+        """Get (or allocate) the ability slot for a user. Caller holds the lock."""
+        slot = self._users.get(user_id)
+        if slot is not None:
+            self._users.move_to_end(user_id)
+            return slot
+
+        if len(self._users) >= self.max_users:
+            # Reuse the least recently updated user's slot
+            _, slot = self._users.popitem(last=False)
+            self.ability[slot] = 0.0
+            self.user_attempts[slot] = 0
+        else:
+            slot = len(self._users)
+            if slot >= len(self.ability):
+                extra = min(len(self.ability), self.max_users - len(self.ability))
+                self.ability = np.concatenate([self.ability, np.zeros(extra, dtype=np.float32)])
+                self.user_attempts = np.concatenate([self.user_attempts, np.zeros(extra, dtype=np.int32)])
+        self._users[user_id] = slot
+        return slot
+
+    def get_ability(self, user_id: str) -> float:
+        """
+        Get a user's current ability estimate.
+
+        Args:
+            user_id (str): The user ID
+
+        Returns:
+            float: Ability on the logit scale (0.0 for new users)
+        """
+        slot = self._users.get(user_id)
+        return float(self.ability[slot]) if slot is not None else 0.0
+
+    def get_difficulty(self, question_id: str) -> Optional[float]:
+        """
+        Get a question's current difficulty estimate.
+
+        Args:
+            question_id (str): The question ID
+
+        Returns:
+            Optional[float]: Difficulty on the logit scale or None if unknown
+        """
+        ordinal = self._ordinals.get(question_id)
+        return float(self.difficulty[ordinal]) if ordinal is not None else None
+
+    def select(
+        self,
+        user_id: str,
+        n: int,
+        role_id: Optional[str] = None,
+        exclude_ids: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Pick the most informative questions for a user.
+
+        Fisher information p * (1 - p) is scored for the whole pool in one
+        vectorized pass; it peaks for questions the user has a ~50% chance of
+        answering correctly.
+
+        Args:
+            user_id (str): The user ID
+            n (int): Number of questions to return
+            role_id (Optional[str]): Restrict to this role's pool
+            exclude_ids (Optional[Iterable[str]]): Question IDs to skip
+
+        Returns:
+            List[str]: Question IDs, most informative first
+        """
+        if n <= 0:
+            return []
+
+        with self._lock:
+            if role_id is None:
+                pool = np.arange(len(self.question_ids))
+            else:
+                pool = self._pools.get(role_id)
+                if pool is None or len(pool) == 0:
+                    return []
+
+            slot = self._users.get(user_id)
+            theta = self.ability[slot] if slot is not None else 0.0
+            p = 1.0 / (1.0 + np.exp(self.difficulty[pool] - theta))
+            scores = p * (1.0 - p)
+            scores *= 1.0 + self.exploration / np.sqrt(1.0 + self.attempts[pool])
+            # Jitter breaks ties so equally informative questions rotate
+            scores += self._rng.random(len(pool)) * 1e-6
+
+            if exclude_ids:
+                excluded = [self._ordinals[q] for q in exclude_ids if q in self._ordinals]
+                if excluded:
+                    scores[np.isin(pool, excluded)] = -np.inf
+
+            n = min(n, int(np.isfinite(scores).sum()))
+            if n == 0:
+                return []
+
+            top = np.argpartition(-scores, n - 1)[:n]
+            top = top[np.argsort(-scores[top])]
+            return [self.question_ids[i] for i in pool[top]]
+
+    def update(self, user_id: str, question_id: str, is_correct: bool) -> float:
+        """
+        Update ability and difficulty estimates after an answer.
+
+        Args:
+            user_id (str): The user ID
+            question_id (str): The answered question ID
+            is_correct (bool): Whether the answer was correct
+
+        Returns:
+            float: The user's updated ability
+        """
+        with self._lock:
+            slot = self._user_slot(user_id)
+            ordinal = self._ordinals.get(question_id)
+            if ordinal is None:
+                return float(self.ability[slot])
+
+            theta = self.ability[slot]
+            b = self.difficulty[ordinal]
+            p = 1.0 / (1.0 + np.exp(b - theta))
+            residual = float(is_correct) - p
+
+            self.ability[slot] = theta + self.k_user / np.sqrt(1.0 + self.user_attempts[slot]) * residual
+            self.difficulty[ordinal] = b - self.k_question / np.sqrt(1.0 + self.attempts[ordinal]) * residual
+            self.user_attempts[slot] += 1
+            self.attempts[ordinal] += 1
+            return float(self.ability[slot])
+
+    def update_many(self, user_id: str, question_ids: Sequence[str], outcomes: Sequence[bool]) -> float:
+        """
+        Update estimates for a whole graded submission at once.
+
+        Equivalent to calling update() per answer with the user's ability held
+        fixed during the submission, but done in a single vectorized step.
+
+        Args:
+            user_id (str): The user ID
+            question_ids (Sequence[str]): The answered question IDs
+            outcomes (Sequence[bool]): Per-question correctness
+
+        Returns:
+            float: The user's updated ability
+        """
+        with self._lock:
+            slot = self._user_slot(user_id)
+            known = [
+                (self._ordinals[q], float(c))
+                for q, c in zip(question_ids, outcomes)
+                if q in self._ordinals
+            ]
+            if not known:
+                return float(self.ability[slot])
+
+            ordinals = np.fromiter((o for o, _ in known), dtype=np.int64, count=len(known))
+            y = np.fromiter((c for _, c in known), dtype=np.float32, count=len(known))
+
+            p = 1.0 / (1.0 + np.exp(self.difficulty[ordinals] - self.ability[slot]))
+            residual = y - p
+
+            question_steps = self.k_question / np.sqrt(1.0 + self.attempts[ordinals])
+            np.subtract.at(self.difficulty, ordinals, (question_steps * residual).astype(np.float32))
+            np.add.at(self.attempts, ordinals, 1)
+
+            user_steps = self.k_user / np.sqrt(1.0 + self.user_attempts[slot] + np.arange(len(known)))
+            self.ability[slot] += float((user_steps * residual).sum())
+            self.user_attempts[slot] += len(known)
+            return float(self.ability[slot])
@@ -0,0 +1,39 @@
+"""Reading the MCQ bank format, without the app's dependencies."""
+from typing import Any, Dict, Iterator, Tuple
+
+
+def iter_questions(mcqs: Any) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Walk the questions of an MCQ bank in bank order.
+
+    The bank is either {role_id: {"name": ..., "questions": [...]}} or a
+    flat list of questions tagged with a "role".
+
+    Args:
+        mcqs (Any): Parsed MCQ JSON
+
+    Yields:
+        Tuple[str, str, Dict[str, Any]]: (role ID, role name, question)
+    """
+    if isinstance(mcqs, dict):
+        for role_id, role_data in mcqs.items():
+            role_name = role_data.get("name", role_id)
+            for question in role_data.get("questions", []):
+                yield role_id, role_name, question
+    else:
+        for question in mcqs or []:
+            role_id = question.get("role", "")
+            yield role_id, role_id, question
+
+
+def questions_by_id(mcqs: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the questions of an MCQ bank by ID, in bank order.
+
+    Args:
+        mcqs (Any): Parsed MCQ JSON
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Questions that have an "id", by ID
+    """
+    return {question["id"]: question for _, _, question in iter_questions(mcqs) if "id" in question}
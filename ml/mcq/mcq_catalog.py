@@ -0,0 +1,324 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import streamlit as st
+from .adaptive_selector import AdaptiveSelector
+from .mcq_bank import iter_questions
+from .mcq_vector_store import MCQVectorStore
+
+# Seconds before seeding a bank version into the vector store is retried
+SEED_RETRY_INTERVAL = 60.0
+
+
+class _CatalogSnapshot:
+    """Immutable view of one version of the MCQ bank."""
+
+    __slots__ = ("mcqs", "questions", "by_id", "by_role", "role_of", "role_names", "version")
+
+    def __init__(self, mcqs: Any, version: int):
+        self.mcqs = mcqs
+        self.version = version
+        self.questions: List[Dict[str, Any]] = []
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_role: Dict[str, List[Dict[str, Any]]] = {}
+        self.role_of: Dict[str, str] = {}
+        self.role_names: Dict[str, str] = {}
+
+        if isinstance(mcqs, dict):
+            # Roles are listed even if they have no questions yet
+            for role_id, role_data in mcqs.items():
+                self.role_names[role_id] = role_data.get("name", role_id)
+        for role_id, role_name, question in iter_questions(mcqs):
+            self.role_names.setdefault(role_id, role_name)
+            self._add(role_id, question)
+
+    def _add(self, role_id: str, question: Dict[str, Any]) -> None:
+        self.questions.append(question)
+        self.by_role.setdefault(role_id, []).append(question)
+        if "id" in question:
+            self.by_id[question["id"]] = question
+            self.role_of[question["id"]] = role_id
+
+
+class MCQCatalog:
+    def __init__(self, mcq_file: str = "data/mcqs.json", reload_interval: float = 2.0):
+        """
+        Initialize a read-mostly MCQ catalog.
+
+        The catalog parses the bank once and shares it (and the vector store)
+        with every MCQManager that references it. The file is re-read when its
+        modification time changes, at most once per ``reload_interval`` seconds.
+
+        Args:
+            mcq_file (str): Path to the MCQ JSON file
+            reload_interval (float): Minimum seconds between file change checks
+        """
+        self.mcq_file = mcq_file
+        self.reload_interval = reload_interval
+        self._lock = threading.RLock()
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._vector_store: Optional[MCQVectorStore] = None
+        self._seeded_version = -1
+        # (version, monotonic time) of the last failed seeding attempt
+        self._seed_failure: Optional[tuple] = None
+        self._selector: Optional[AdaptiveSelector] = None
+        self._selector_version = -1
+        self._snapshot = _CatalogSnapshot([], 0)
+        self.reload(force=True)
+
+    def _read_file(self) -> Any:
+        """
+        Read the MCQ bank from disk.
+
+        Returns:
+            Any: Parsed JSON content, or an empty list if the file is missing
+        """
+        if not os.path.exists(self.mcq_file):
+            return []
+        with open(self.mcq_file, 'r') as f:
+            return json.load(f)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Re-read the bank if the file changed since the last load.
+
+        Args:
+            force (bool): Reload even if the modification time is unchanged
+
+        Returns:
+            bool: True if a new version was loaded, False otherwise
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            try:
+                mtime = os.path.getmtime(self.mcq_file) if os.path.exists(self.mcq_file) else None
+                if not force and mtime == self._mtime:
+                    return False
+                snapshot = _CatalogSnapshot(self._read_file(), self._snapshot.version + 1)
+            except Exception as e:
+                # Keep serving the previous version if the new file is broken
+                st.error(f"Error loading MCQs: {str(e)}")
+                return False
+
+            self._mtime = mtime
+            # Readers pick up the new version with a single reference swap
+            self._snapshot = snapshot
+            return True
+
+    def snapshot(self) -> _CatalogSnapshot:
+        """
+        Get the current version of the bank, reloading it if the file changed.
+
+        Returns:
+            _CatalogSnapshot: Current catalog snapshot
+        """
+        if time.monotonic() - self._last_check >= self.reload_interval:
+            self.reload()
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self.snapshot().version
+
+    @property
+    def mcqs(self) -> Any:
+        return self.snapshot().mcqs
+
+    @property
+    def questions(self) -> List[Dict[str, Any]]:
+        return self.snapshot().questions
+
+    @property
+    def vector_store(self) -> MCQVectorStore:
+        """
+        Get the shared vector store, seeding it with the current bank if needed.
+
+        Returns:
+            MCQVectorStore: Vector store shared by all sessions
+        """
+        snapshot = self.snapshot()
+        if self._vector_store is not None and (
+            self._seeded_version == snapshot.version or self._seed_failed_recently(snapshot.version)
+        ):
+            return self._vector_store
+
+        with self._lock:
+            if self._vector_store is None:
+                self._vector_store = MCQVectorStore()
+            if self._seeded_version != snapshot.version and not self._seed_failed_recently(snapshot.version):
+                if snapshot.version == 1 and self._index_matches(snapshot):
+                    self._seeded_version = snapshot.version
+                elif self._vector_store.add_mcqs(snapshot.mcqs):
+                    self._seeded_version = snapshot.version
+                    self._seed_failure = None
+                else:
+                    # add_mcqs already reported the error; don't retry on every access
+                    self._seed_failure = (snapshot.version, time.monotonic())
+            return self._vector_store
+
+    def _seed_failed_recently(self, version: int) -> bool:
+        """
+        Check if seeding this bank version failed within SEED_RETRY_INTERVAL.
+
+        Args:
+            version (int): Bank version
+
+        Returns:
+            bool: True if seeding should not be retried yet
+        """
+        failure = self._seed_failure
+        return (
+            failure is not None
+            and failure[0] == version
+            and time.monotonic() - failure[1] < SEED_RETRY_INTERVAL
+        )
+
+    @property
+    def selector(self) -> AdaptiveSelector:
+        """
+        Get the shared adaptive selector, aligned with the current bank.
+
+        Returns:
+            AdaptiveSelector: Selector shared by all sessions
+        """
+        snapshot = self.snapshot()
+        if self._selector is not None and self._selector_version == snapshot.version:
+            return self._selector
+
+        with self._lock:
+            question_ids = list(snapshot.by_id)
+            pools = {
+                role_id: [q["id"] for q in questions if "id" in q]
+                for role_id, questions in snapshot.by_role.items()
+            }
+            if self._selector is None:
+                self._selector = AdaptiveSelector(question_ids, pools)
+            elif self._selector_version != snapshot.version:
+                self._selector.sync(question_ids, pools)
+            self._selector_version = snapshot.version
+            return self._selector
+
+    def _index_matches(self, snapshot: _CatalogSnapshot) -> bool:
+        """
+        Check if the persisted vector store already holds exactly this bank.
+
+        Args:
+            snapshot (_CatalogSnapshot): Bank version to compare against
+
+        Returns:
+            bool: True if the stored question IDs match the bank's, False otherwise
+        """
+        try:
+            stored = self._vector_store.collection.get(include=[])["ids"]
+            return bool(stored) and set(stored) == set(snapshot.by_id)
+        except Exception:
+            return False
+
+    def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a question by ID.
+
+        Args:
+            question_id (str): The question ID
+
+        Returns:
+            Optional[Dict[str, Any]]: The question or None if not found
+        """
+        return self.snapshot().by_id.get(question_id)
+
+    def get_question_role(self, question_id: str) -> Optional[str]:
+        """
+        Get the role ID a question belongs to.
+
+        Args:
+            question_id (str): The question ID
+
+        Returns:
+            Optional[str]: The role ID or None if not found
+        """
+        return self.snapshot().role_of.get(question_id)
+
+    def resolve_role(self, role: str) -> Optional[str]:
+        """
+        Resolve a role ID or display name to a role ID.
+
+        Args:
+            role (str): Role ID or display name
+
+        Returns:
+            Optional[str]: The role ID or None if not found
+        """
+        snapshot = self.snapshot()
+        if role in snapshot.role_names:
+            return role
+        for role_id, name in snapshot.role_names.items():
+            if name == role:
+                return role_id
+        return None
+
+    def get_questions_by_role(self, role: str) -> List[Dict[str, Any]]:
+        """
+        Get questions for a specific role.
+
+        Args:
+            role (str): Role ID or display name
+
+        Returns:
+            List[Dict[str, Any]]: Questions for the role, in bank order
+        """
+        role_id = self.resolve_role(role)
+        if role_id is None:
+            return []
+        return self.snapshot().by_role.get(role_id, [])
+
+    def get_role_name(self, role_id: str) -> Optional[str]:
+        """
+        Get the display name for a role.
+
+        Args:
+            role_id (str): The role ID
+
+        Returns:
+            Optional[str]: The role name or None if not found
+        """
+        return self.snapshot().role_names.get(role_id)
+
+    def get_available_roles(self) -> List[Dict[str, str]]:
+        """
+        Get all roles in the bank.
+
+        Returns:
+            List[Dict[str, str]]: Roles with "id" and "name"
+        """
+        return [
+            {"id": role_id, "name": name}
+            for role_id, name in self.snapshot().role_names.items()
+        ]
+
+
+_catalogs: Dict[str, MCQCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(mcq_file: str = "data/mcqs.json") -> MCQCatalog:
+    """
+    Get the process-wide catalog for an MCQ file, creating it on first use.
+
+    Args:
+        mcq_file (str): Path to the MCQ JSON file
+
+    Returns:
+        MCQCatalog: Catalog shared by every caller in this process
+    """
+    key = os.path.abspath(mcq_file)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(key)
+            if catalog is None:
+                catalog = MCQCatalog(mcq_file)
+                _catalogs[key] = catalog
+    return catalog
@@ -0,0 +1,286 @@
+"""Near-duplicate detection for the MCQ bank.
+
+Run before seeding the vector store, e.g.::
+
+    python -m ml.mcq.mcq_dedup data/mcqs.json
+    python -m ml.mcq.mcq_dedup data/mcqs.json --remove --output data/mcqs.dedup.json
+"""
+import argparse
+import json
+import os
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from .mcq_bank import iter_questions, questions_by_id
+
+_WORD_RE = re.compile(r"\w+")
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def question_text(question: Dict[str, Any]) -> str:
+    """
+    Build the text used to compare two questions.
+
+    Args:
+        question (Dict[str, Any]): Question dictionary
+
+    Returns:
+        str: Question and options as a single string
+    """
+    return f"{question.get('question', '')} {' '.join(map(str, question.get('options', [])))}"
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # Keep the earliest question as the cluster root
+            if rj < ri:
+                ri, rj = rj, ri
+            self.parent[rj] = ri
+
+
+def minhash_signatures(texts: Sequence[str], num_perm: int = 64, shingle_size: int = 3, seed: int = 1) -> np.ndarray:
+    """
+    Compute MinHash signatures over word shingles.
+
+    Args:
+        texts (Sequence[str]): Texts to sign
+        num_perm (int): Number of hash permutations
+        shingle_size (int): Words per shingle
+        seed (int): Seed for the permutation coefficients
+
+    Returns:
+        np.ndarray: (len(texts), num_perm) uint64 signatures
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+    b = rng.integers(0, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    signatures = np.full((len(texts), num_perm), _MERSENNE_PRIME, dtype=np.uint64)
+    for i, text in enumerate(texts):
+        words = _WORD_RE.findall(text.lower())
+        shingles = {
+            " ".join(words[j:j + shingle_size])
+            for j in range(max(1, len(words) - shingle_size + 1))
+        }
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        if len(hashes):
+            # a, b, h < 2**31, so a * h + b cannot overflow uint64
+            signatures[i] = ((a * hashes + b) % _MERSENNE_PRIME).min(axis=1)
+    return signatures
+
+
+def lexical_duplicate_pairs(signatures: np.ndarray, threshold: float = 0.8, bands: int = 16) -> List[Tuple[int, int, float]]:
+    """
+    Find lexically near-identical pairs with MinHash LSH banding.
+
+    Args:
+        signatures (np.ndarray): MinHash signatures from minhash_signatures
+        threshold (float): Minimum estimated Jaccard similarity
+        bands (int): Number of LSH bands
+
+    Returns:
+        List[Tuple[int, int, float]]: (i, j, estimated Jaccard) with i < j
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    candidates = set()
+    for band in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        band_slice = signatures[:, band * rows:(band + 1) * rows]
+        for i in range(n):
+            buckets[band_slice[i].tobytes()].append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    candidates.add((members[x], members[y]))
+
+    pairs = []
+    for i, j in sorted(candidates):
+        jaccard = float(np.mean(signatures[i] == signatures[j]))
+        if jaccard >= threshold:
+            pairs.append((i, j, jaccard))
+    return pairs
+
+
+def embed_in_batches(texts: Sequence[str], embed_fn: Callable[[List[str]], List[List[float]]], batch_size: int = 256) -> np.ndarray:
+    """
+    Embed texts in batches and L2-normalize the result.
+
+    Args:
+        texts (Sequence[str]): Texts to embed
+        embed_fn (Callable): Function mapping a list of texts to embeddings
+        batch_size (int): Texts per embedding request
+
+    Returns:
+        np.ndarray: (len(texts), dim) float32 unit vectors
+    """
+    batches = [
+        np.asarray(embed_fn(list(texts[i:i + batch_size])), dtype=np.float32)
+        for i in range(0, len(texts), batch_size)
+    ]
+    if not batches:
+        return np.zeros((0, 0), dtype=np.float32)
+    embeddings = np.vstack(batches)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def similar_pairs(embeddings: np.ndarray, threshold: float = 0.92, block_size: int = 1024) -> Iterator[Tuple[int, int, float]]:
+    """
+    Find pairs of unit vectors with cosine similarity above a threshold.
+
+    The similarity matrix is computed one block_size x block_size tile at a
+    time (upper triangle only), so memory stays O(block_size ** 2).
+
+    Args:
+        embeddings (np.ndarray): (n, dim) unit vectors
+        threshold (float): Minimum cosine similarity
+        block_size (int): Rows per tile
+
+    Yields:
+        Tuple[int, int, float]: (i, j, similarity) with i < j
+    """
+    n = len(embeddings)
+    for start_i in range(0, n, block_size):
+        block_i = embeddings[start_i:start_i + block_size]
+        for start_j in range(start_i, n, block_size):
+            tile = block_i @ embeddings[start_j:start_j + block_size].T
+            if start_j == start_i:
+                tile = np.triu(tile, k=1)
+            rows, cols = np.nonzero(tile >= threshold)
+            for r, c in zip(rows.tolist(), cols.tolist()):
+                yield start_i + r, start_j + c, float(tile[r, c])
+
+
+def find_duplicate_clusters(
+    mcqs: Any,
+    embed_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+    threshold: float = 0.92,
+    lexical_threshold: float = 0.8,
+    batch_size: int = 256,
+    block_size: int = 1024
+) -> List[List[str]]:
+    """
+    Group near-duplicate questions in an MCQ bank.
+
+    Lexical duplicates are found first with MinHash; only one representative
+    per lexical cluster is embedded, and paraphrases among the representatives
+    are then found with blocked cosine similarity.
+
+    Args:
+        mcqs (Any): MCQ bank in either supported format
+        embed_fn (Optional[Callable]): Embedding function; lexical-only if None
+        threshold (float): Minimum cosine similarity for paraphrases
+        lexical_threshold (float): Minimum estimated Jaccard for lexical duplicates
+        batch_size (int): Texts per embedding request
+        block_size (int): Rows per similarity tile
+
+    Returns:
+        List[List[str]]: Clusters of question IDs, the one to keep first
+    """
+    questions = [q for _, _, q in iter_questions(mcqs) if "id" in q]
+    texts = [question_text(q) for q in questions]
+    clusters = _UnionFind(len(questions))
+
+    for i, j, _ in lexical_duplicate_pairs(minhash_signatures(texts), lexical_threshold):
+        clusters.union(i, j)
+
+    if embed_fn is not None:
+        representatives = [i for i in range(len(questions)) if clusters.find(i) == i]
+        embeddings = embed_in_batches([texts[i] for i in representatives], embed_fn, batch_size)
+        for i, j, _ in similar_pairs(embeddings, threshold, block_size):
+            clusters.union(representatives[i], representatives[j])
+
+    groups: Dict[int, List[str]] = defaultdict(list)
+    for i, question in enumerate(questions):
+        groups[clusters.find(i)].append(question["id"])
+    return [ids for ids in groups.values() if len(ids) > 1]
+
+
+def remove_duplicates(mcqs: Any, clusters: List[List[str]]) -> Any:
+    """
+    Drop all but the first question of each duplicate cluster.
+
+    Args:
+        mcqs (Any): MCQ bank in either supported format
+        clusters (List[List[str]]): Clusters from find_duplicate_clusters
+
+    Returns:
+        Any: A copy of the bank without the duplicates
+    """
+    drop = {question_id for ids in clusters for question_id in ids[1:]}
+    if isinstance(mcqs, dict):
+        return {
+            role_id: dict(role_data, questions=[q for q in role_data.get("questions", []) if q.get("id") not in drop])
+            for role_id, role_data in mcqs.items()
+        }
+    return [q for q in mcqs if q.get("id") not in drop]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Find near-duplicate questions in an MCQ bank.")
+    parser.add_argument("mcq_file", help="Path to the MCQ JSON file")
+    parser.add_argument("--threshold", type=float, default=0.92, help="Cosine similarity for paraphrases")
+    parser.add_argument("--lexical-threshold", type=float, default=0.8, help="Estimated Jaccard for lexical duplicates")
+    parser.add_argument("--batch-size", type=int, default=256, help="Texts per embedding request")
+    parser.add_argument("--block-size", type=int, default=1024, help="Rows per similarity tile")
+    parser.add_argument("--lexical-only", action="store_true", help="Skip embeddings")
+    parser.add_argument("--remove", action="store_true", help="Write a deduplicated bank")
+    parser.add_argument("--output", help="Output path for --remove (default: overwrite input)")
+    args = parser.parse_args(argv)
+
+    with open(args.mcq_file, "r") as f:
+        mcqs = json.load(f)
+
+    embed_fn = None
+    if not args.lexical_only:
+        from chromadb.utils import embedding_functions
+        embed_fn = embedding_functions.OpenAIEmbeddingFunction(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            model_name="text-embedding-3-small"
+        )
+
+    clusters = find_duplicate_clusters(
+        mcqs,
+        embed_fn=embed_fn,
+        threshold=args.threshold,
+        lexical_threshold=args.lexical_threshold,
+        batch_size=args.batch_size,
+        block_size=args.block_size
+    )
+
+    by_id = questions_by_id(mcqs)
+    for ids in clusters:
+        print(f"Keep {ids[0]}: {by_id[ids[0]].get('question', '')}")
+        for question_id in ids[1:]:
+            print(f"  dup {question_id}: {by_id[question_id].get('question', '')}")
+    print(f"{len(clusters)} clusters, {sum(len(ids) - 1 for ids in clusters)} duplicates")
+
+    if args.remove and clusters:
+        output = args.output or args.mcq_file
+        with open(output, "w") as f:
+            json.dump(remove_duplicates(mcqs, clusters), f, indent=2)
+        print(f"Deduplicated bank written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
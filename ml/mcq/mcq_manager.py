@@ -1,79 +1,63 @@
-import json
-import os
-from typing import List, Dict, Any
 import random
-from pathlib import Path
-from typing import Dict, List, Optional
-import streamlit as st
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .mcq_catalog import MCQCatalog, get_catalog
+from .mcq_stats import MCQStatsStore
 from .mcq_vector_store import MCQVectorStore
+from .review_scheduler import get_review_scheduler
+from .seen_tracker import SeenQuestionTracker
 
 class MCQManager:
-    def __init__(self, mcq_file: str = "data/mcqs.json"):
+    def __init__(self, mcq_file: str = "data/mcqs.json", catalog: Optional[MCQCatalog] = None, progress_db: str = "data/mcq_progress.db"):
         """
         Initialize the MCQ manager.
         
+        The manager is a lightweight per-session handle; the parsed bank and the
+        vector store live in a process-wide catalog shared by all sessions.
+        
         Args:
             mcq_file (str): Path to the MCQ JSON file
+            catalog (Optional[MCQCatalog]): Catalog to use instead of the shared one
+            progress_db (str): Path to the SQLite database for quiz statistics
         """
         self.mcq_file = mcq_file
-        self.mcqs = self._load_mcqs()
-        self.vector_store = MCQVectorStore()
-        
-        # Initialize vector store with MCQs if empty
-        if not self._is_vector_store_initialized():
-            self._initialize_vector_store()
-    
-    def _is_vector_store_initialized(self) -> bool:
-        """
-        Check if vector store is initialized with MCQs.
-        
-        Returns:
-            bool: True if initialized, False otherwise
-        """
-        try:
-            results = self.vector_store.search_mcqs("test", n_results=1)
-            return len(results) > 0
-        except:
-            return False
+        self.catalog = catalog if catalog is not None else get_catalog(mcq_file)
+        self.stats = MCQStatsStore(progress_db)
+        self.seen = SeenQuestionTracker(progress_db)
+        # Review queues are cached in memory, so every session shares one scheduler
+        self.reviews = get_review_scheduler(progress_db)
     
-    def _initialize_vector_store(self) -> None:
-        """Initialize vector store with MCQs."""
-        self.vector_store.add_mcqs(self.mcqs)
+    @property
+    def mcqs(self) -> Any:
+        return self.catalog.mcqs
     
-    def _load_mcqs(self) -> List[Dict[str, Any]]:
-        """
-        Load MCQs from the JSON file.
-        
-        Returns:
-            List[Dict[str, Any]]: List of MCQs
-        """
-        try:
-            if os.path.exists(self.mcq_file):
-                with open(self.mcq_file, 'r') as f:
-                    return json.load(f)
-            return []
-        except Exception as e:
-            st.error(f"Error loading MCQs: {str(e)}")
-            return []
+    @property
+    def vector_store(self) -> MCQVectorStore:
+        return self.catalog.vector_store
     
     def get_questions_by_role(self, role: str) -> List[Dict[str, Any]]:
         """
         Get questions for a specific role.
         
         Args:
-            role: Role name
+            role: Role ID or name
             
         Returns:
             List of question dictionaries
         """
-        return [q for q in self.mcqs if q.get("role") == role]
+        return list(self.catalog.get_questions_by_role(role))
     
-    def get_random_questions(self, num_questions: int) -> List[Dict[str, Any]]:
+    def get_random_questions(self, num_questions: int, role_id: Optional[str] = None, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get random questions.
         
+        With both a role and a user, questions the user has already seen for
+        that role are skipped until the whole role has been covered.
+        
         Args:
             num_questions: Number of questions to return
+            role_id: Optional role ID or name to draw from
+            user_id: Optional user ID for non-repeating draws
             
         Returns:
             List of question dictionaries
@@ -81,7 +65,20 @@ class MCQManager:
         if num_questions <= 0:
             return []
         
-        return random.sample(self.mcqs, min(num_questions, len(self.mcqs)))
+        if role_id is None:
+            questions = self.catalog.questions
+            return random.sample(questions, min(num_questions, len(questions)))
+        
+        questions = self.catalog.get_questions_by_role(role_id)
+        if user_id is None:
+            return random.sample(questions, min(num_questions, len(questions)))
+        
+        # Seen bits follow question IDs, not positions in the current bank
+        resolved_role = self.catalog.resolve_role(role_id)
+        ordinals = self.seen.ordinals(resolved_role, [q.get("id", q.get("question", "")) for q in questions])
+        by_ordinal = dict(zip(ordinals, questions))
+        drawn = self.seen.sample_unseen(user_id, resolved_role, ordinals, num_questions)
+        return [by_ordinal[ordinal] for ordinal in drawn]
     
     def search_questions(self, query: str, role_id: Optional[str] = None, n_results: int = 5) -> List[Dict]:
         """
@@ -96,20 +93,7 @@ class MCQManager:
             List[Dict]: List of relevant questions
         """
         results = self.vector_store.search_mcqs(query, role_id, n_results)
-        
-        # Convert vector store results to question format
-        questions = []
-        for result in results:
-            question_id = result["metadata"]["question_id"]
-            role_id = result["metadata"]["role_id"]
-            
-            # Find the original question in the MCQs
-            for question in self.mcqs:
-                if question["id"] == question_id:
-                    questions.append(question)
-                    break
-        
-        return questions
+        return self._resolve_results(results)
     
     def get_role_specific_questions(self, role_id: str, n_results: int = 5) -> List[Dict]:
         """
@@ -123,36 +107,234 @@ class MCQManager:
             List[Dict]: List of role-specific questions
         """
         results = self.vector_store.get_role_specific_mcqs(role_id, n_results)
+        return self._resolve_results(results)
+    
+    def get_adaptive_questions(self, role_id: str, user_id: str, num_questions: int = 5, exclude_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get the questions that best match a user's estimated level.
         
-        # Convert vector store results to question format
-        questions = []
-        for result in results:
-            question_id = result["metadata"]["question_id"]
+        Args:
+            role_id (str): The role ID
+            user_id (str): The user ID
+            num_questions (int): Number of questions to return
+            exclude_ids (Optional[List[str]]): Question IDs to skip
             
-            # Find the original question in the MCQs
-            for question in self.mcqs:
-                if question["id"] == question_id:
-                    questions.append(question)
-                    break
-        
-        return questions
+        Returns:
+            List[Dict[str, Any]]: Questions, most informative first (empty if
+                the role is unknown)
+        """
+        resolved_role = self.catalog.resolve_role(role_id)
+        if resolved_role is None:
+            return []
+        question_ids = self.catalog.selector.select(
+            user_id,
+            num_questions,
+            role_id=resolved_role,
+            exclude_ids=exclude_ids
+        )
+        return [self.catalog.get_question(question_id) for question_id in question_ids]
     
-    def check_answer(self, question: Dict[str, Any], answer: str) -> Dict[str, Any]:
+    def check_answer(self, question: Dict[str, Any], answer: str, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Check if an answer is correct.
         
         Args:
             question: Question dictionary
             answer: User's answer
+            user_id: Optional user ID; updates the adaptive estimates if given
             
         Returns:
             Dict containing result and explanation
         """
         is_correct = answer == question["correct_answer"]
-        return {
+        result = {
             "is_correct": is_correct,
             "explanation": question["explanation"]
         }
+        if user_id is not None and "id" in question:
+            result["ability"] = self.catalog.selector.update(user_id, question["id"], is_correct)
+            self.reviews.record_answers(user_id, [question["id"]], [is_correct])
+        return result
+    
+    def get_due_review_questions(self, user_id: str, num_questions: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get previously missed questions that are due for review.
+        
+        Args:
+            user_id (str): The user ID
+            num_questions (int): Maximum number of questions to return
+            
+        Returns:
+            List[Dict[str, Any]]: Due questions, most overdue first
+        """
+        # Questions removed from the bank are dropped from the queue
+        by_id = self.catalog.snapshot().by_id
+        return [by_id[question_id] for question_id in self.reviews.get_due(user_id, num_questions, known_ids=by_id)]
+    
+    def get_next_review_time(self, user_id: str) -> Optional[float]:
+        """
+        Get when the user's next missed question is due for review.
+        
+        Args:
+            user_id (str): The user ID
+            
+        Returns:
+            Optional[float]: UNIX time, or None if no review is scheduled
+        """
+        return self.reviews.next_due_at(user_id, known_ids=self.catalog.snapshot().by_id)
+    
+    @staticmethod
+    def _option_index(question: Dict[str, Any], answer: Any) -> int:
+        """
+        Normalize an answer to an option index.
+        
+        Accepts an option index, a letter ("A", "B", ...) or the option text.
+        
+        Args:
+            question: Question dictionary
+            answer: Answer in any supported form
+            
+        Returns:
+            int: Option index, or -1 if the answer is missing, unknown or not
+                one of the question's options
+        """
+        if answer is None or isinstance(answer, bool):
+            return -1
+        options = question.get("options", [])
+        index = -1
+        if isinstance(answer, (int, np.integer)):
+            index = int(answer)
+        elif isinstance(answer, str):
+            if answer in options:
+                return options.index(answer)
+            if len(answer) == 1 and answer.isalpha():
+                index = ord(answer.upper()) - ord("A")
+        return index if 0 <= index < len(options) else -1
+    
+    def grade_quiz(self, questions: Sequence[Dict[str, Any]], answers: Sequence[Any], role_id: Optional[str] = None, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Grade a whole quiz submission in one call.
+        
+        Updates the persisted per-question and per-role statistics once, and the
+        adaptive estimates if a user ID is given. Each question counts towards
+        the role it belongs to in the bank, so a review quiz mixing roles is
+        not all credited to role_id.
+        
+        Args:
+            questions: Questions in the order they were shown
+            answers: User's answers aligned with questions (None if unanswered)
+            role_id: Role the quiz was taken for; used for questions not in the bank
+            user_id: Optional user ID for adaptive updates
+            
+        Returns:
+            Dict containing score, per-question results and per-topic results.
+            A question's correct_option is None if its correct answer can't be
+            matched to one of its options.
+        """
+        chosen = np.fromiter(
+            (self._option_index(q, a) for q, a in zip(questions, answers)),
+            dtype=np.int64,
+            count=len(questions)
+        )
+        correct = np.fromiter(
+            (self._option_index(q, q["correct_answer"]) for q in questions),
+            dtype=np.int64,
+            count=len(questions)
+        )
+        is_correct = (chosen == correct) & (chosen >= 0)
+        
+        question_ids = [q.get("id") for q in questions]
+        roles = [self.catalog.get_question_role(question_id) or role_id for question_id in question_ids]
+        topics = [
+            q.get("topic") or question_role or "General"
+            for q, question_role in zip(questions, roles)
+        ]
+        topic_names, topic_index = np.unique(np.array(topics, dtype=object), return_inverse=True)
+        topic_totals = np.bincount(topic_index, minlength=len(topic_names))
+        topic_correct = np.bincount(topic_index, weights=is_correct, minlength=len(topic_names))
+        
+        graded_ids = []
+        graded_correct = []
+        by_role: Dict[Optional[str], Tuple[List[str], List[bool]]] = {}
+        for question_id, question_role, c in zip(question_ids, roles, is_correct):
+            if question_id is None:
+                continue
+            graded_ids.append(question_id)
+            graded_correct.append(bool(c))
+            role_ids, role_correct = by_role.setdefault(question_role, ([], []))
+            role_ids.append(question_id)
+            role_correct.append(bool(c))
+        for question_role, (role_ids, role_correct) in by_role.items():
+            self.stats.record_submission(question_role, role_ids, role_correct)
+        
+        result = {
+            "score": float(is_correct.mean()) if len(questions) else 0.0,
+            "correct_count": int(is_correct.sum()),
+            "total": len(questions),
+            "questions": [
+                {
+                    "question_id": question_id,
+                    "is_correct": bool(c),
+                    "chosen_option": int(ch) if ch >= 0 else None,
+                    "correct_option": int(co) if co >= 0 else None,
+                    "explanation": q.get("explanation", "")
+                }
+                for q, question_id, c, ch, co in zip(questions, question_ids, is_correct, chosen, correct)
+            ],
+            "topics": {
+                str(name): {
+                    "correct": int(c),
+                    "total": int(t),
+                    "score": float(c / t)
+                }
+                for name, c, t in zip(topic_names, topic_correct, topic_totals)
+            }
+        }
+        if user_id is not None:
+            result["ability"] = self.catalog.selector.update_many(user_id, graded_ids, graded_correct)
+            self.reviews.record_answers(user_id, graded_ids, graded_correct)
+        return result
+    
+    def get_question_statistics(self, question_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get aggregate correct rates per question.
+        
+        Args:
+            question_ids (Optional[List[str]]): Optional IDs to restrict to
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by question ID
+        """
+        return self.stats.get_question_stats(question_ids)
+    
+    def get_role_statistics(self, role_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get aggregate quiz averages per role.
+        
+        Args:
+            role_id (Optional[str]): Optional role ID to restrict to
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by role ID
+        """
+        return self.stats.get_role_stats(role_id)
+    
+    def _resolve_results(self, results: List[Dict]) -> List[Dict]:
+        """
+        Convert vector store results to question format.
+        
+        Args:
+            results (List[Dict]): Vector store results
+            
+        Returns:
+            List[Dict]: Original questions from the bank
+        """
+        questions = []
+        for result in results:
+            question = self.catalog.get_question(result["metadata"]["question_id"])
+            if question is not None:
+                questions.append(question)
+        return questions
     
     def get_role_name(self, role_id: str) -> Optional[str]:
         """
@@ -164,7 +346,13 @@ class MCQManager:
         Returns:
             Optional[str]: The role name or None if not found
         """
-        for role in self.mcqs:
-            if role.get("id") == role_id:
-                return role.get("name")
-        return None 
\ No newline at end of file
+        return self.catalog.get_role_name(role_id)
+    
+    def get_available_roles(self) -> List[Dict[str, str]]:
+        """
+        Get all roles in the MCQ bank.
+        
+        Returns:
+            List[Dict[str, str]]: Roles with "id" and "name"
+        """
+        return self.catalog.get_available_roles()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+class MCQStatsStore:
+    def __init__(self, db_path: str = "data/mcq_progress.db"):
+        """Initialize the MCQ statistics store with database path."""
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Create the aggregate statistics tables if they don't exist."""
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS question_stats (
+                    question_id TEXT PRIMARY KEY,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    correct INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS role_stats (
+                    role_id TEXT PRIMARY KEY,
+                    submissions INTEGER NOT NULL DEFAULT 0,
+                    questions INTEGER NOT NULL DEFAULT 0,
+                    correct INTEGER NOT NULL DEFAULT 0,
+                    score_sum REAL NOT NULL DEFAULT 0
+                )
+            """)
+            conn.commit()
+
+    def record_submission(self, role_id: Optional[str], question_ids: Sequence[str], is_correct: Sequence[bool]) -> None:
+        """
+        Fold one graded submission into the running aggregates.
+
+        Args:
+            role_id: Role the quiz was taken for
+            question_ids: IDs of the graded questions
+            is_correct: Per-question correctness, aligned with question_ids
+        """
+        if not question_ids:
+            return
+
+        correct = sum(bool(c) for c in is_correct)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO question_stats (question_id, attempts, correct)
+                VALUES (?, 1, ?)
+                ON CONFLICT(question_id) DO UPDATE SET
+                    attempts = attempts + 1,
+                    correct = correct + excluded.correct
+            """, [(question_id, int(bool(c))) for question_id, c in zip(question_ids, is_correct)])
+            if role_id is not None:
+                cursor.execute("""
+                    INSERT INTO role_stats (role_id, submissions, questions, correct, score_sum)
+                    VALUES (?, 1, ?, ?, ?)
+                    ON CONFLICT(role_id) DO UPDATE SET
+                        submissions = submissions + 1,
+                        questions = questions + excluded.questions,
+                        correct = correct + excluded.correct,
+                        score_sum = score_sum + excluded.score_sum
+                """, (role_id, len(question_ids), correct, correct / len(question_ids)))
+            conn.commit()
+
+    def get_question_stats(self, question_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-question attempt counts and correct rates.
+
+        Args:
+            question_ids: Optional IDs to restrict the result to
+
+        Returns:
+            Dict mapping question ID to attempts, correct and correct_rate
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if question_ids is None:
+                cursor.execute("SELECT question_id, attempts, correct FROM question_stats")
+                rows = cursor.fetchall()
+            else:
+                ids: List[str] = list(question_ids)
+                rows = []
+                # Stay below SQLite's bound parameter limit
+                for i in range(0, len(ids), 500):
+                    batch = ids[i:i + 500]
+                    cursor.execute(f"""
+                        SELECT question_id, attempts, correct
+                        FROM question_stats
+                        WHERE question_id IN ({','.join('?' * len(batch))})
+                    """, batch)
+                    rows.extend(cursor.fetchall())
+
+        return {
+            question_id: {
+                "attempts": attempts,
+                "correct": correct,
+                "correct_rate": correct / attempts if attempts else 0.0
+            }
+            for question_id, attempts, correct in rows
+        }
+
+    def get_role_stats(self, role_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-role submission counts and averages.
+
+        Args:
+            role_id: Optional role ID to restrict the result to
+
+        Returns:
+            Dict mapping role ID to submissions, average_score and correct_rate
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            query = "SELECT role_id, submissions, questions, correct, score_sum FROM role_stats"
+            if role_id is not None:
+                cursor.execute(query + " WHERE role_id = ?", (role_id,))
+            else:
+                cursor.execute(query)
+            rows = cursor.fetchall()
+
+        return {
+            row_role_id: {
+                "submissions": submissions,
+                "questions": questions,
+                "average_score": score_sum / submissions if submissions else 0.0,
+                "correct_rate": correct / questions if questions else 0.0
+            }
+            for row_role_id, submissions, questions, correct, score_sum in rows
+        }
@@ -7,16 +7,19 @@ import json
 from pathlib import Path
 import streamlit as st
 
+ROLE_QUERY_TEMPLATE = "Find important technical questions and concepts for {role_id} role"
+
 class MCQVectorStore:
-    def __init__(self, collection_name: str = "mcqs"):
+    def __init__(self, collection_name: str = "mcqs", db_path: Optional[str] = None):
         """
         Initialize the MCQ vector store.
         
         Args:
             collection_name (str): Name of the ChromaDB collection
+            db_path (Optional[str]): ChromaDB directory (default: CHROMA_DB_PATH or ./data/chroma)
         """
         self.client = chromadb.PersistentClient(
-            path=os.getenv("CHROMA_DB_PATH", "./data/chroma"),
+            path=db_path or os.getenv("CHROMA_DB_PATH", "./data/chroma"),
             settings=Settings(allow_reset=True)
         )
         
@@ -31,6 +34,12 @@ class MCQVectorStore:
             name=collection_name,
             embedding_function=self.embedding_function
         )
+        
+        # Precomputed role query embeddings, stored next to the MCQs
+        self.role_collection = self.client.get_or_create_collection(
+            name=f"{collection_name}_role_queries"
+        )
+        self._role_embeddings: Dict[str, List[float]] = {}
     
     def add_mcqs(self, mcqs: Dict) -> bool:
         """
@@ -67,13 +76,19 @@ class MCQVectorStore:
                     })
                     ids.append(question["id"])
             
-            # Add to collection
-            self.collection.add(
+            # Upsert so a reloaded bank can be re-seeded in place
+            self.collection.upsert(
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids
             )
             
+            # Drop questions that were removed from the bank since it was seeded
+            stale = set(self.collection.get(include=[])["ids"]) - set(ids)
+            if stale:
+                self.collection.delete(ids=list(stale))
+            
+            self.seed_role_embeddings(list(mcqs.keys()))
             return True
             
         except Exception as e:
@@ -92,15 +107,28 @@ class MCQVectorStore:
         Returns:
             List[Dict]: List of relevant MCQs with metadata
         """
-        try:
-            # Prepare where clause if role_id is provided
-            where = {"role_id": role_id} if role_id else None
+        # Prepare where clause if role_id is provided
+        where = {"role_id": role_id} if role_id else None
+        return self._query(where=where, n_results=n_results, query_texts=[query])
+    
+    def _query(self, where: Optional[Dict], n_results: int, **query) -> List[Dict]:
+        """
+        Query the collection and format the results.
+        
+        Args:
+            where (Optional[Dict]): Metadata filter
+            n_results (int): Number of results to return
+            **query: Either query_texts or query_embeddings
             
+        Returns:
+            List[Dict]: List of relevant MCQs with metadata
+        """
+        try:
             # Search collection
             results = self.collection.query(
-                query_texts=[query],
                 n_results=n_results,
-                where=where
+                where=where,
+                **query
             )
             
             # Format results
@@ -120,9 +148,46 @@ class MCQVectorStore:
             st.error(f"Error searching MCQs: {str(e)}")
             return []
     
+    def seed_role_embeddings(self, role_ids: List[str]) -> bool:
+        """
+        Embed the role query prompts for any roles that don't have one yet.
+        
+        All missing prompts are embedded in a single request and stored in the
+        role query collection, so retrieval never has to embed them again.
+        
+        Args:
+            role_ids (List[str]): Role IDs to seed
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            missing = [role_id for role_id in role_ids if role_id not in self._role_embeddings]
+            if missing:
+                stored = self.role_collection.get(ids=missing, include=["embeddings"])
+                for role_id, embedding in zip(stored["ids"], stored["embeddings"] or []):
+                    self._role_embeddings[role_id] = list(embedding)
+                missing = [role_id for role_id in missing if role_id not in self._role_embeddings]
+            
+            if missing:
+                prompts = [ROLE_QUERY_TEMPLATE.format(role_id=role_id) for role_id in missing]
+                embeddings = [list(e) for e in self.embedding_function(prompts)]
+                self.role_collection.upsert(
+                    ids=missing,
+                    embeddings=embeddings,
+                    documents=prompts
+                )
+                self._role_embeddings.update(zip(missing, embeddings))
+            
+            return True
+            
+        except Exception as e:
+            st.error(f"Error seeding role query embeddings: {str(e)}")
+            return False
+    
     def get_role_specific_mcqs(self, role_id: str, n_results: int = 5) -> List[Dict]:
         """
-        Get role-specific MCQs using a role-specific prompt.
+        Get role-specific MCQs using the role's precomputed prompt embedding.
         
         Args:
             role_id (str): The role ID
@@ -131,9 +196,20 @@ class MCQVectorStore:
         Returns:
             List[Dict]: List of role-specific MCQs
         """
-        # Create a role-specific prompt
-        prompt = f"Find important technical questions and concepts for {role_id} role"
-        return self.search_mcqs(prompt, role_id=role_id, n_results=n_results)
+        if role_id not in self._role_embeddings:
+            self.seed_role_embeddings([role_id])
+        
+        embedding = self._role_embeddings.get(role_id)
+        if embedding is None:
+            # Fall back to embedding the prompt at query time
+            prompt = ROLE_QUERY_TEMPLATE.format(role_id=role_id)
+            return self.search_mcqs(prompt, role_id=role_id, n_results=n_results)
+        
+        return self._query(
+            where={"role_id": role_id},
+            n_results=n_results,
+            query_embeddings=[embedding]
+        )
     
     def reset_collection(self) -> bool:
         """
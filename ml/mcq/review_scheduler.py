@@ -0,0 +1,242 @@
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from typing import Container, Dict, List, Optional, Sequence, Tuple
+
+DAY_SECONDS = 24 * 60 * 60
+
+class ReviewScheduler:
+    def __init__(self, db_path: str = "data/mcq_progress.db"):
+        """
+        Initialize the spaced-repetition scheduler with database path.
+
+        Missed questions are scheduled with SM-2 intervals. Each user's items
+        are loaded once into a heap ordered by due time, and every review is
+        written back as a single-row upsert. Since the heaps are held in
+        memory, sessions should share one scheduler per database through
+        get_review_scheduler().
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # user_id -> question_id -> (repetitions, interval_days, ease, due_at, lapses)
+        self._items: Dict[str, Dict[str, Tuple[int, float, float, float, int]]] = {}
+        # user_id -> heap of (due_at, question_id); stale entries are skipped lazily
+        self._heaps: Dict[str, List[Tuple[float, str]]] = {}
+        self._init_db()
+
+    def _init_db(self):
+        """Create the review table if it doesn't exist."""
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS review_items (
+                    user_id TEXT NOT NULL,
+                    question_id TEXT NOT NULL,
+                    repetitions INTEGER NOT NULL DEFAULT 0,
+                    interval_days REAL NOT NULL DEFAULT 0,
+                    ease REAL NOT NULL DEFAULT 2.5,
+                    due_at REAL NOT NULL,
+                    lapses INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, question_id)
+                )
+            """)
+            conn.commit()
+
+    def _load_user(self, user_id: str) -> Dict[str, Tuple[int, float, float, float, int]]:
+        """Load a user's items and build their due heap. Caller holds the lock."""
+        items = self._items.get(user_id)
+        if items is None:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT question_id, repetitions, interval_days, ease, due_at, lapses
+                    FROM review_items
+                    WHERE user_id = ?
+                """, (user_id,))
+                rows = cursor.fetchall()
+            items = {row[0]: tuple(row[1:]) for row in rows}
+            heap = [(item[3], question_id) for question_id, item in items.items()]
+            heapq.heapify(heap)
+            self._items[user_id] = items
+            self._heaps[user_id] = heap
+        return items
+
+    @staticmethod
+    def _sm2(item: Tuple[int, float, float, float, int], quality: int, now: float) -> Tuple[int, float, float, float, int]:
+        """Apply one SM-2 review with quality 0-5."""
+        repetitions, interval, ease, _, lapses = item
+        if quality < 3:
+            repetitions = 0
+            interval = 1.0
+            lapses += 1
+        else:
+            repetitions += 1
+            if repetitions == 1:
+                interval = 1.0
+            elif repetitions == 2:
+                interval = 6.0
+            else:
+                interval = round(interval * ease)
+        ease = max(1.3, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        return repetitions, interval, ease, now + interval * DAY_SECONDS, lapses
+
+    def record_answers(self, user_id: str, question_ids: Sequence[str], outcomes: Sequence[bool], now: Optional[float] = None) -> None:
+        """
+        Record answers and reschedule the affected review items.
+
+        Missed questions enter the queue; questions already in the queue are
+        rescheduled by SM-2. Correct answers to unscheduled questions are ignored.
+
+        Args:
+            user_id (str): The user ID
+            question_ids (Sequence[str]): The answered question IDs
+            outcomes (Sequence[bool]): Per-question correctness
+            now (Optional[float]): Current UNIX time
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            items = self._load_user(user_id)
+            heap = self._heaps[user_id]
+            changed = []
+            for question_id, is_correct in zip(question_ids, outcomes):
+                item = items.get(question_id)
+                if item is None:
+                    if is_correct:
+                        continue
+                    item = (0, 0.0, 2.5, now, 0)
+                item = self._sm2(item, 4 if is_correct else 1, now)
+                items[question_id] = item
+                heapq.heappush(heap, (item[3], question_id))
+                changed.append((user_id, question_id) + item)
+
+            if len(heap) > 2 * len(items) + 16:
+                # Drop superseded entries once they dominate the heap
+                heap[:] = [(item[3], question_id) for question_id, item in items.items()]
+                heapq.heapify(heap)
+
+            if changed:
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    cursor.executemany("""
+                        INSERT INTO review_items (user_id, question_id, repetitions, interval_days, ease, due_at, lapses)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(user_id, question_id) DO UPDATE SET
+                            repetitions = excluded.repetitions,
+                            interval_days = excluded.interval_days,
+                            ease = excluded.ease,
+                            due_at = excluded.due_at,
+                            lapses = excluded.lapses
+                    """, changed)
+                    conn.commit()
+
+    def get_due(self, user_id: str, n: int, now: Optional[float] = None, known_ids: Optional[Container[str]] = None) -> List[str]:
+        """
+        Get up to n questions due for review, most overdue first.
+
+        Pops at most n live entries off the user's heap and pushes them back,
+        so the cost is O(n log m) for a user with m scheduled items.
+
+        Args:
+            user_id (str): The user ID
+            n (int): Maximum number of questions
+            now (Optional[float]): Current UNIX time
+            known_ids (Optional[Container[str]]): Question IDs still in the bank;
+                due items for other questions are deleted instead of returned
+
+        Returns:
+            List[str]: Due question IDs
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            items = self._load_user(user_id)
+            heap = self._heaps[user_id]
+            due: List[Tuple[float, str]] = []
+            retired: List[str] = []
+            while heap and len(due) < n and heap[0][0] <= now:
+                due_at, question_id = heapq.heappop(heap)
+                item = items.get(question_id)
+                if item is None or item[3] != due_at:
+                    continue  # superseded by a later review
+                if known_ids is not None and question_id not in known_ids:
+                    del items[question_id]
+                    retired.append(question_id)
+                    continue
+                if due and due[-1][1] == question_id:
+                    continue
+                due.append((due_at, question_id))
+            for entry in due:
+                heapq.heappush(heap, entry)
+            self._delete(user_id, retired)
+            return [question_id for _, question_id in due]
+
+    def next_due_at(self, user_id: str, known_ids: Optional[Container[str]] = None) -> Optional[float]:
+        """
+        Get when the user's next review item falls due.
+
+        Args:
+            user_id (str): The user ID
+            known_ids (Optional[Container[str]]): Question IDs still in the bank;
+                items for other questions are deleted and not considered
+
+        Returns:
+            Optional[float]: UNIX time of the earliest due item, or None if
+                nothing is scheduled
+        """
+        with self._lock:
+            items = self._load_user(user_id)
+            heap = self._heaps[user_id]
+            retired: List[str] = []
+            # Superseded entries at the top are dropped; they'd never be served
+            while heap:
+                due_at, question_id = heap[0]
+                item = items.get(question_id)
+                if item is not None and item[3] == due_at:
+                    if known_ids is None or question_id in known_ids:
+                        break
+                    del items[question_id]
+                    retired.append(question_id)
+                heapq.heappop(heap)
+            self._delete(user_id, retired)
+            return heap[0][0] if heap else None
+
+    def _delete(self, user_id: str, question_ids: List[str]) -> None:
+        """Delete review items of questions that left the bank. Caller holds the lock."""
+        if not question_ids:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                DELETE FROM review_items
+                WHERE user_id = ? AND question_id = ?
+            """, [(user_id, question_id) for question_id in question_ids])
+            conn.commit()
+
+
+_schedulers: Dict[str, ReviewScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_review_scheduler(db_path: str = "data/mcq_progress.db") -> ReviewScheduler:
+    """
+    Get the process-wide review scheduler for a database, creating it on first use.
+
+    Args:
+        db_path (str): Path to the SQLite database
+
+    Returns:
+        ReviewScheduler: Scheduler shared by every session in this process
+    """
+    key = os.path.abspath(db_path)
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(key)
+            if scheduler is None:
+                scheduler = ReviewScheduler(db_path)
+                _schedulers[key] = scheduler
+    return scheduler
@@ -0,0 +1,227 @@
+import os
+import random
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+class SeenQuestionTracker:
+    def __init__(self, db_path: str = "data/mcq_progress.db"):
+        """
+        Initialize the seen-question tracker with database path.
+
+        Each (user, role) pair is stored as one bitmap over the role's
+        question ordinals, so a user who has seen 1,000 questions costs
+        125 bytes. A question gets its ordinal the first time its ID is seen
+        in the role, and keeps it: later ones are appended, so inserting,
+        removing or reordering questions in the bank never moves another
+        question's bit.
+
+        Bitmaps are read and written in one transaction per call, so several
+        sessions of the same user never overwrite each other's progress.
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # role_id -> question ID -> ordinal; assigned ordinals never change
+        self._ordinals: Dict[str, Dict[str, int]] = {}
+        self._init_db()
+
+    def _init_db(self):
+        """Create the seen-question tables if they don't exist."""
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS seen_questions (
+                    user_id TEXT NOT NULL,
+                    role_id TEXT NOT NULL,
+                    bitmap BLOB NOT NULL,
+                    seen_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, role_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS question_ordinals (
+                    role_id TEXT NOT NULL,
+                    question_id TEXT NOT NULL,
+                    ordinal INTEGER NOT NULL,
+                    PRIMARY KEY (role_id, question_id),
+                    UNIQUE (role_id, ordinal)
+                )
+            """)
+            conn.commit()
+
+    def _begin(self) -> sqlite3.Connection:
+        """Open a connection holding the write lock until commit."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("BEGIN IMMEDIATE")
+        return conn
+
+    def ordinals(self, role_id: str, question_ids: Sequence[str]) -> List[int]:
+        """
+        Get the ordinals of a role's questions, assigning new ones after the
+        highest ordinal the role has ever used.
+
+        Args:
+            role_id (str): The role ID
+            question_ids (Sequence[str]): Question IDs, in any order
+
+        Returns:
+            List[int]: Ordinals aligned with question_ids
+        """
+        with self._lock:
+            known = self._ordinals.setdefault(role_id, {})
+            if any(question_id not in known for question_id in question_ids):
+                conn = self._begin()
+                try:
+                    # Another process may have assigned some since they were cached
+                    stored = dict(conn.execute("""
+                        SELECT question_id, ordinal
+                        FROM question_ordinals
+                        WHERE role_id = ?
+                    """, (role_id,)).fetchall())
+                    next_ordinal = max(stored.values(), default=-1) + 1
+                    new = {}
+                    for question_id in question_ids:
+                        if question_id not in stored and question_id not in new:
+                            new[question_id] = next_ordinal
+                            next_ordinal += 1
+                    conn.executemany("""
+                        INSERT INTO question_ordinals (role_id, question_id, ordinal)
+                        VALUES (?, ?, ?)
+                    """, [(role_id, question_id, ordinal) for question_id, ordinal in new.items()])
+                    conn.commit()
+                finally:
+                    conn.close()
+                known.update(stored)
+                known.update(new)
+            return [known[question_id] for question_id in question_ids]
+
+    @staticmethod
+    def _load(conn: sqlite3.Connection, user_id: str, role_id: str, size: int) -> bytearray:
+        """Read a bitmap with room for ordinals below size."""
+        row = conn.execute("""
+            SELECT bitmap
+            FROM seen_questions
+            WHERE user_id = ? AND role_id = ?
+        """, (user_id, role_id)).fetchone()
+        bitmap = bytearray(row[0]) if row else bytearray()
+        size = (size + 7) // 8
+        if len(bitmap) < size:
+            bitmap.extend(bytes(size - len(bitmap)))
+        return bitmap
+
+    @staticmethod
+    def _save(conn: sqlite3.Connection, user_id: str, role_id: str, bitmap: bytearray) -> None:
+        """Write a bitmap and commit."""
+        seen_count = int(np.unpackbits(np.frombuffer(bytes(bitmap), dtype=np.uint8)).sum())
+        conn.execute("""
+            INSERT INTO seen_questions (user_id, role_id, bitmap, seen_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, role_id) DO UPDATE SET
+                bitmap = excluded.bitmap,
+                seen_count = excluded.seen_count
+        """, (user_id, role_id, bytes(bitmap), seen_count))
+        conn.commit()
+
+    @staticmethod
+    def _seen_mask(bitmap: bytearray, ordinals: np.ndarray) -> np.ndarray:
+        """Get whether each ordinal's bit is set, with a vectorized gather."""
+        bits = np.unpackbits(np.frombuffer(bytes(bitmap), dtype=np.uint8), bitorder="little")
+        return bits[ordinals].astype(bool)
+
+    @staticmethod
+    def _set(bitmap: bytearray, ordinal: int) -> None:
+        bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+
+    def seen_count(self, user_id: str, role_id: str, ordinals: Sequence[int]) -> int:
+        """
+        Get how many of a role's current questions a user has seen.
+
+        Args:
+            user_id (str): The user ID
+            role_id (str): The role ID
+            ordinals (Sequence[int]): Ordinals of the role's current questions
+
+        Returns:
+            int: Number of seen questions since the last reset
+        """
+        if not len(ordinals):
+            return 0
+        live = np.asarray(ordinals, dtype=np.int64)
+        with sqlite3.connect(self.db_path) as conn:
+            bitmap = self._load(conn, user_id, role_id, int(live.max()) + 1)
+        return int(self._seen_mask(bitmap, live).sum())
+
+    def mark_seen(self, user_id: str, role_id: str, ordinals: Iterable[int]) -> None:
+        """
+        Mark questions as seen.
+
+        Args:
+            user_id (str): The user ID
+            role_id (str): The role ID
+            ordinals (Iterable[int]): Question ordinals from ordinals()
+        """
+        ordinals = [ordinal for ordinal in ordinals if ordinal >= 0]
+        if not ordinals:
+            return
+        with self._lock:
+            conn = self._begin()
+            try:
+                bitmap = self._load(conn, user_id, role_id, max(ordinals) + 1)
+                for ordinal in ordinals:
+                    self._set(bitmap, ordinal)
+                self._save(conn, user_id, role_id, bitmap)
+            finally:
+                conn.close()
+
+    def sample_unseen(self, user_id: str, role_id: str, ordinals: Sequence[int], k: int, rng: Optional[random.Random] = None) -> List[int]:
+        """
+        Draw k of a role's current questions the user hasn't seen and mark
+        them as seen.
+
+        The current questions' bits are gathered from the bitmap in one
+        vectorized pass. When fewer than k questions remain unseen, the
+        remainder is taken and the role is reset for that user.
+
+        Args:
+            user_id (str): The user ID
+            role_id (str): The role ID
+            ordinals (Sequence[int]): Ordinals of the role's current questions
+            k (int): Number of questions to draw
+            rng (Optional[random.Random]): Random source
+
+        Returns:
+            List[int]: Ordinals of the drawn questions
+        """
+        rng = rng or random
+        k = min(k, len(ordinals))
+        if k <= 0:
+            return []
+
+        live = np.asarray(ordinals, dtype=np.int64)
+        with self._lock:
+            conn = self._begin()
+            try:
+                bitmap = self._load(conn, user_id, role_id, int(live.max()) + 1)
+                unseen = np.flatnonzero(~self._seen_mask(bitmap, live)).tolist()
+                picked: List[int] = []
+
+                if len(unseen) <= k:
+                    # Exhausted: take what's left, then start the role over
+                    picked = unseen
+                    rng.shuffle(picked)
+                    bitmap = bytearray(len(bitmap))
+                    chosen = set(picked)
+                    unseen = [i for i in range(len(live)) if i not in chosen]
+
+                picked.extend(rng.sample(unseen, k - len(picked)))
+                drawn = [int(live[i]) for i in picked]
+                for ordinal in drawn:
+                    self._set(bitmap, ordinal)
+                self._save(conn, user_id, role_id, bitmap)
+                return drawn
+            finally:
+                conn.close()
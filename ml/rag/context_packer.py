@@ -0,0 +1,132 @@
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Fallback when tiktoken or its encoding files are unavailable: words and
+# punctuation marks, which slightly overestimates BPE tokens for English
+_APPROX_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional[Any]:
+    """Load the tokenizer for a model once per process."""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Error loading tokenizer, approximating token counts: {str(e)}")
+        return None
+
+class ContextPacker:
+    def __init__(self, max_tokens: int = 512, model: str = "gpt-4-turbo-preview", min_chunk_tokens: int = 32, separator: str = "\n"):
+        """
+        Initialize the retrieval context packer.
+
+        Retrieved chunks are ranked by relevance and added whole while they
+        fit in max_tokens; the first one that doesn't fit is truncated to the
+        remaining budget, so the packed context stays within it.
+
+        Args:
+            max_tokens (int): Token budget for the packed context
+            model (str): Model whose tokenizer counts tokens
+            min_chunk_tokens (int): Smallest truncated chunk worth including
+            separator (str): Text placed between chunks
+        """
+        self.max_tokens = max_tokens
+        self.model = model
+        self.min_chunk_tokens = min_chunk_tokens
+        self.separator = separator
+        self._count = lru_cache(maxsize=4096)(self._count_uncached)
+
+    def _count_uncached(self, text: str) -> int:
+        encoding = _encoding(self.model)
+        if encoding is None:
+            return len(_APPROX_TOKEN_RE.findall(text))
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens in a text; counts of recent texts are cached."""
+        return self._count(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Cut a text to at most max_tokens, backing off to a word boundary.
+
+        Args:
+            text (str): Text to cut
+            max_tokens (int): Token limit
+
+        Returns:
+            str: The longest prefix within the limit that ends on whitespace
+                (or a hard cut if there is none)
+        """
+        encoding = _encoding(self.model)
+        if encoding is None:
+            matches = list(islice(_APPROX_TOKEN_RE.finditer(text), max_tokens + 1))
+            if len(matches) <= max_tokens:
+                return text
+            cut = text[:matches[max_tokens].start()]
+        else:
+            tokens = encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            cut = encoding.decode(tokens[:max_tokens])
+            # A cut inside a multi-byte character decodes to U+FFFD
+            cut = cut.rstrip("\ufffd")
+        boundary = max(cut.rfind(" "), cut.rfind("\n"))
+        return (cut[:boundary] if boundary > 0 else cut).rstrip()
+
+    def pack(self, results: Sequence[Dict[str, Any]], max_tokens: Optional[int] = None) -> Tuple[str, Dict[str, int]]:
+        """
+        Pack retrieved chunks into a token budget.
+
+        Args:
+            results: Search results with "content" and optionally "score"
+                (higher is more relevant), e.g. from VectorStoreManager.search
+            max_tokens (Optional[int]): Budget for this call (default: max_tokens)
+
+        Returns:
+            Tuple[str, Dict[str, int]]: The packed context, and chunks,
+                packed_chunks, tokens_in, tokens_packed and tokens_saved
+        """
+        budget = self.max_tokens if max_tokens is None else max_tokens
+        ranked = sorted(
+            enumerate(results),
+            key=lambda item: (-item[1].get("score", 0.0), item[0])
+        )
+
+        seen = set()
+        chunks: List[str] = []
+        tokens_in = 0
+        used = 0
+        separator_tokens = self.count_tokens(self.separator) if self.separator else 0
+        for _, result in ranked:
+            content = result["content"].strip()
+            if not content or content in seen:
+                continue
+            seen.add(content)
+            tokens = self.count_tokens(content)
+            tokens_in += tokens
+
+            available = budget - used - (separator_tokens if chunks else 0)
+            if available <= 0:
+                continue
+            if tokens <= available:
+                chunks.append(content)
+                used += tokens + (separator_tokens if len(chunks) > 1 else 0)
+            elif available >= self.min_chunk_tokens:
+                truncated = self.truncate(content, available)
+                if truncated:
+                    chunks.append(truncated)
+                    used += self.count_tokens(truncated) + (separator_tokens if len(chunks) > 1 else 0)
+
+        return self.separator.join(chunks), {
+            "chunks": len(results),
+            "packed_chunks": len(chunks),
+            "tokens_in": tokens_in,
+            "tokens_packed": used,
+            "tokens_saved": max(0, tokens_in - used)
+        }
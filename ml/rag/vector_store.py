@@ -1,7 +1,7 @@
 from langchain.embeddings import OpenAIEmbeddings
 from langchain.vectorstores import Chroma
 from langchain.schema import Document
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 from dotenv import load_dotenv
 import chromadb
@@ -32,29 +32,67 @@ class VectorStoreManager:
         """Convert chunks to LangChain documents."""
         documents = []
         for chunk in chunks:
+            metadata = {
+                "chunk_id": chunk["id"],
+                "chunk_index": chunk["chunk_index"],
+                "total_chunks": chunk["total_chunks"],
+                "source": chunk["metadata"]["source"],
+                "created_at": chunk["created_at"]
+            }
+            for key in ("page", "page_end", "content_hash"):
+                if key in chunk["metadata"]:
+                    metadata[key] = chunk["metadata"][key]
             doc = Document(
                 page_content=chunk["content"],
-                metadata={
-                    "chunk_id": chunk["id"],
-                    "chunk_index": chunk["chunk_index"],
-                    "total_chunks": chunk["total_chunks"],
-                    "source": chunk["metadata"]["source"],
-                    "created_at": chunk["created_at"]
-                }
+                metadata=metadata
             )
             documents.append(doc)
         return documents
 
-    def add_documents(self, chunks: List[Dict[str, Any]]) -> None:
-        """Add documents to the vector store."""
+    def embed_chunks(self, chunks: List[Dict[str, Any]]) -> List[List[float]]:
+        """Embed chunk contents with the same model used for search queries."""
+        return self.embeddings.embed_documents([chunk["content"] for chunk in chunks])
+
+    def add_documents(self, chunks: List[Dict[str, Any]], embeddings: Optional[List[List[float]]] = None, batch_size: int = 5000) -> None:
+        """
+        Add documents to the vector store.
+        
+        Args:
+            chunks (List[Dict[str, Any]]): Chunks from TextProcessor
+            embeddings (Optional[List[List[float]]]): Precomputed embeddings
+                aligned with chunks; computed with embed_chunks if None
+            batch_size (int): Documents per insert
+        """
+        # Chunk IDs hash the chunk and its file's content; a batch may not repeat an ID
+        seen = set()
+        keep = []
+        for i, chunk in enumerate(chunks):
+            if chunk["id"] not in seen:
+                seen.add(chunk["id"])
+                keep.append(i)
+        chunks = [chunks[i] for i in keep]
+        if embeddings is None:
+            embeddings = self.embed_chunks(chunks)
+        else:
+            embeddings = [embeddings[i] for i in keep]
         documents = self.create_documents(chunks)
         
-        # Add documents to ChromaDB
-        self.collection.add(
-            documents=[doc.page_content for doc in documents],
-            metadatas=[doc.metadata for doc in documents],
-            ids=[doc.metadata["chunk_id"] for doc in documents]
-        )
+        # Add documents to ChromaDB; upsert makes re-ingestion idempotent
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            self.collection.upsert(
+                documents=[doc.page_content for doc in batch],
+                metadatas=[doc.metadata for doc in batch],
+                embeddings=embeddings[start:start + batch_size],
+                ids=[doc.metadata["chunk_id"] for doc in batch]
+            )
+
+    def missing_ids(self, ids: List[str]) -> List[str]:
+        """Get the chunk IDs, among ids, that are not in the collection."""
+        if not ids:
+            return []
+        stored = set(self.collection.get(ids=list(ids), include=[])["ids"])
+        return [chunk_id for chunk_id in ids if chunk_id not in stored]
 
     def create_retriever(self, search_kwargs: Dict[str, Any] = None) -> Any:
         """Create a retriever from the vector store."""
@@ -76,6 +114,39 @@ class VectorStoreManager:
         
         return retriever
 
+    def search(self, query: str, n_results: int = 4, where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the chunks closest to a query.
+        
+        Args:
+            query (str): The search query
+            n_results (int): Number of results to return
+            where (Optional[Dict[str, Any]]): Metadata filter, e.g.
+                {"content_hash": ...} for one resume's chunks
+            
+        Returns:
+            List[Dict[str, Any]]: document (also as content), metadata and
+                score (1 - cosine distance), best first
+        """
+        results = self.collection.query(
+            query_embeddings=[self.embeddings.embed_query(query)],
+            n_results=n_results,
+            where=where
+        )
+        if not results["ids"] or not results["ids"][0]:
+            return []
+        return [
+            {
+                "document": document,
+                "content": document,
+                "metadata": metadata,
+                "score": 1.0 - distance
+            }
+            for document, metadata, distance in zip(
+                results["documents"][0], results["metadatas"][0], results["distances"][0]
+            )
+        ]
+
     def similarity_search(self, query: str, k: int = 4) -> List[Document]:
         """Perform similarity search on the vector store."""
         vector_store = Chroma(
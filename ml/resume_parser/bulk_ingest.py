@@ -0,0 +1,270 @@
+"""Bulk resume ingestion into the vector store.
+
+Extracts and chunks every PDF/DOCX under a directory in a process pool,
+embeds chunks from many files per request and writes them in bulk, e.g.::
+
+    python -m ml.resume_parser.bulk_ingest resumes/cohort-12
+    python -m ml.resume_parser.bulk_ingest resumes/cohort-12 --workers 8 --embed-batch-size 2000
+    python -m ml.resume_parser.bulk_ingest resumes/cohort-12 --ocr-cache /tmp/ocr_cache
+
+Ingested files are appended to a manifest (by default
+``.ingest_manifest.jsonl`` in the directory) once their chunks are stored,
+so an interrupted run picks up where it stopped.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+_text_processor = None
+_ocr_cache = None
+
+
+def find_resumes(directory: str) -> List[str]:
+    """
+    List the PDF and DOCX files under a directory.
+
+    Args:
+        directory (str): Directory to search recursively
+
+    Returns:
+        List[str]: Sorted file paths
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def file_hash(path: str) -> str:
+    """
+    Get the content hash used to recognise already-ingested files.
+
+    Streams the file; equal to resume_cache.content_hash of its bytes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path: str) -> Set[str]:
+    """
+    Get the content hashes of files recorded in a manifest.
+
+    A truncated last line from an interrupted run is ignored.
+    """
+    done = set()
+    if not os.path.exists(manifest_path):
+        return done
+    with open(manifest_path, "r") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["content_hash"])
+            except (ValueError, KeyError):
+                continue
+    return done
+
+
+def _init_worker(ocr_cache_dir: Optional[str]) -> None:
+    """Create the per-process text processor and OCR cache."""
+    global _text_processor, _ocr_cache
+    from .resume_cache import ResumeCache
+    from .text_processor import TextProcessor
+    _text_processor = TextProcessor()
+    _ocr_cache = ResumeCache(ocr_cache_dir, max_memory_items=256) if ocr_cache_dir else None
+
+
+def _process_file(path: str, directory: str, content_hash: str) -> Dict[str, Any]:
+    """Extract and chunk one file in a worker process set up by _init_worker."""
+    from .resume_processor import ResumeProcessor
+
+    source = os.path.relpath(path, directory)
+    result = {"path": source, "content_hash": content_hash, "chunks": [], "bytes": 0, "error": None}
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            file_content = f.read()
+        result["bytes"] = len(file_content)
+
+        page_offsets = None
+        if path.lower().endswith(".pdf"):
+            # Already running in a pool; extract pages serially
+            pages = ResumeProcessor.extract_pages_from_pdf(file_content, parallel_threshold=sys.maxsize)
+            if pages:
+                pages = ResumeProcessor.fill_scanned_pages(file_content, pages, cache=_ocr_cache)
+            text, page_offsets = ResumeProcessor.join_pages(pages) if pages else (None, None)
+        else:
+            text = ResumeProcessor.extract_from_docx(file_content)
+        result["extract_time"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if text:
+            result["chunks"] = _text_processor.create_chunks(
+                text, source=source, page_offsets=page_offsets, content_hash=content_hash
+            )
+        else:
+            result["error"] = "Failed to extract text"
+        result["chunk_time"] = time.perf_counter() - start
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+class _Ingestor:
+    def __init__(self, vector_store: Any, manifest_path: str, embed_batch_size: int, insert_batch_size: int):
+        self.vector_store = vector_store
+        self.manifest_path = manifest_path
+        self.embed_batch_size = embed_batch_size
+        self.insert_batch_size = insert_batch_size
+        self.pending: List[Dict[str, Any]] = []
+        self.pending_chunks = 0
+        self.timings = {"extract": 0.0, "chunk": 0.0, "embed": 0.0, "store": 0.0}
+        self.files = self.chunks = self.bytes = self.failed = 0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.timings["extract"] += result.get("extract_time", 0.0)
+        self.timings["chunk"] += result.get("chunk_time", 0.0)
+        if result["error"]:
+            self.failed += 1
+            print(f"Failed {result['path']}: {result['error']}")
+            return
+        self.pending.append(result)
+        self.pending_chunks += len(result["chunks"])
+        if self.pending_chunks >= self.embed_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Embed and store all pending files, then record them in the manifest."""
+        if not self.pending:
+            return
+        chunks = [chunk for result in self.pending for chunk in result["chunks"]]
+
+        start = time.perf_counter()
+        embeddings = self.vector_store.embed_chunks(chunks) if chunks else []
+        self.timings["embed"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        if chunks:
+            self.vector_store.add_documents(chunks, embeddings, batch_size=self.insert_batch_size)
+        self.timings["store"] += time.perf_counter() - start
+
+        with open(self.manifest_path, "a") as f:
+            for result in self.pending:
+                f.write(json.dumps({
+                    "path": result["path"],
+                    "content_hash": result["content_hash"],
+                    "chunks": len(result["chunks"])
+                }) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.files += len(self.pending)
+        self.chunks += len(chunks)
+        self.bytes += sum(result["bytes"] for result in self.pending)
+        print(f"Stored {len(self.pending)} files ({len(chunks)} chunks)")
+        self.pending = []
+        self.pending_chunks = 0
+
+
+def ingest_directory(
+    directory: str,
+    vector_store: Any,
+    manifest_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    embed_batch_size: int = 1000,
+    insert_batch_size: int = 5000,
+    ocr_cache_dir: Optional[str] = "data/ocr_cache"
+) -> Dict[str, Any]:
+    """
+    Ingest every resume under a directory.
+
+    Args:
+        directory (str): Directory of PDF/DOCX files
+        vector_store (Any): VectorStoreManager to write to
+        manifest_path (Optional[str]): Manifest of ingested files
+        workers (Optional[int]): Extraction processes (default: CPU count)
+        embed_batch_size (int): Chunks buffered across files per embedding flush
+        insert_batch_size (int): Documents per vector store insert
+        ocr_cache_dir (Optional[str]): Directory for OCR output keyed by
+            page hash; None disables caching
+
+    Returns:
+        Dict[str, Any]: Counts and per-stage timings in seconds
+    """
+    manifest_path = manifest_path or os.path.join(directory, ".ingest_manifest.jsonl")
+    started = time.perf_counter()
+
+    done = load_manifest(manifest_path)
+    todo = []
+    skipped = 0
+    for path in find_resumes(directory):
+        content_hash = file_hash(path)
+        if content_hash in done:
+            skipped += 1
+            continue
+        done.add(content_hash)  # Identical copies are ingested once
+        todo.append((path, content_hash))
+    print(f"{len(todo)} files to ingest, {skipped} already ingested or duplicates")
+
+    ingestor = _Ingestor(vector_store, manifest_path, embed_batch_size, insert_batch_size)
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ocr_cache_dir,)) as pool:
+            futures = [pool.submit(_process_file, path, directory, content_hash) for path, content_hash in todo]
+            for future in as_completed(futures):
+                ingestor.add(future.result())
+        ingestor.flush()
+
+    return {
+        "files": ingestor.files,
+        "skipped": skipped,
+        "failed": ingestor.failed,
+        "chunks": ingestor.chunks,
+        "bytes": ingestor.bytes,
+        "timings": dict(ingestor.timings, wall=time.perf_counter() - started)
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ingest a directory of resumes into the vector store.")
+    parser.add_argument("directory", help="Directory of PDF/DOCX resumes")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument("--embed-batch-size", type=int, default=1000, help="Chunks per embedding flush")
+    parser.add_argument("--insert-batch-size", type=int, default=5000, help="Documents per vector store insert")
+    parser.add_argument("--manifest", help="Manifest path (default: <directory>/.ingest_manifest.jsonl)")
+    parser.add_argument("--collection", default="resume_chunks", help="Vector store collection")
+    parser.add_argument("--ocr-cache", default="data/ocr_cache", help="OCR cache directory (default: data/ocr_cache)")
+    parser.add_argument("--no-ocr-cache", action="store_true", help="Don't cache OCR output")
+    args = parser.parse_args(argv)
+
+    from ..rag.vector_store import VectorStoreManager
+    stats = ingest_directory(
+        args.directory,
+        VectorStoreManager(collection_name=args.collection),
+        manifest_path=args.manifest,
+        workers=args.workers,
+        embed_batch_size=args.embed_batch_size,
+        insert_batch_size=args.insert_batch_size,
+        ocr_cache_dir=None if args.no_ocr_cache else args.ocr_cache
+    )
+
+    timings = stats["timings"]
+    wall = timings["wall"] or 1e-9
+    print(f"Ingested {stats['files']} files ({stats['chunks']} chunks, {stats['bytes'] / 1e6:.1f} MB), "
+          f"skipped {stats['skipped']}, failed {stats['failed']}")
+    print(f"Wall time {wall:.2f}s: {stats['files'] / wall:.1f} files/s, {stats['chunks'] / wall:.1f} chunks/s")
+    print("Stage time (s, extract and chunk summed over workers): " + ", ".join(f"{stage} {timings[stage]:.2f}" for stage in ("extract", "chunk", "embed", "store")))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+import io
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, List, Union
+
+# Cap on decompressed XML read from one DOCX (all parts together)
+MAX_DOCX_XML_BYTES = 20 * 1024 * 1024
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH = _W + "p"
+_TEXT = _W + "t"
+_TAB = _W + "tab"
+_BREAKS = (_W + "br", _W + "cr")
+
+_PART_RE = re.compile(r"word/(header\d*|document|footer\d*)\.xml")
+
+class _CappedReader(io.RawIOBase):
+    """File wrapper that fails once more than a shared byte budget is read."""
+
+    def __init__(self, stream: IO[bytes], budget: List[int]):
+        self.stream = stream
+        self.budget = budget
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.stream.read(min(len(buffer), self.budget[0] + 1))
+        self.budget[0] -= len(data)
+        if self.budget[0] < 0:
+            raise ValueError("DOCX expands beyond the allowed size")
+        buffer[:len(data)] = data
+        return len(data)
+
+def _part_order(name: str) -> int:
+    # Headers (often contact details) first, then the body, then footers
+    return 0 if "header" in name else 1 if name.endswith("document.xml") else 2
+
+def iter_docx_paragraphs(file_content: Union[bytes, IO[bytes]], max_xml_bytes: int = MAX_DOCX_XML_BYTES) -> Iterator[str]:
+    """
+    Stream the paragraphs of a DOCX without loading its XML into memory.
+
+    Parts are decompressed incrementally and parsed with iterparse; each
+    paragraph is yielded as soon as it closes and then discarded. Reading
+    stops with ValueError once the decompressed XML exceeds max_xml_bytes,
+    whatever sizes the archive declares.
+
+    Args:
+        file_content: The DOCX content or a seekable binary file
+        max_xml_bytes: Budget for decompressed XML across all parts
+
+    Yields:
+        str: Paragraph text, with tabs and line breaks kept
+    """
+    source = io.BytesIO(file_content) if isinstance(file_content, (bytes, bytearray, memoryview)) else file_content
+    with zipfile.ZipFile(source) as archive:
+        parts = sorted(
+            (info for info in archive.infolist() if _PART_RE.fullmatch(info.filename)),
+            key=lambda info: (_part_order(info.filename), info.filename)
+        )
+        if not any(info.filename == "word/document.xml" for info in parts):
+            raise ValueError("Not a DOCX file: word/document.xml is missing")
+        if sum(info.file_size for info in parts) > max_xml_bytes:
+            raise ValueError("DOCX expands beyond the allowed size")
+
+        budget = [max_xml_bytes]
+        for info in parts:
+            with archive.open(info) as raw:
+                stream = io.BufferedReader(_CappedReader(raw, budget))
+                yield from _iter_part_paragraphs(stream)
+
+def _iter_part_paragraphs(stream: IO[bytes]) -> Iterator[str]:
+    pieces: List[str] = []
+    depth = 0  # Nesting of open paragraphs (text boxes can nest them)
+    parents: List[ET.Element] = []
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            if element.tag == _PARAGRAPH:
+                depth += 1
+            continue
+
+        parents.pop()
+        tag = element.tag
+        if tag == _TEXT:
+            pieces.append(element.text or "")
+        elif tag == _TAB:
+            pieces.append("\t")
+        elif tag in _BREAKS:
+            pieces.append("\n")
+        elif tag == _PARAGRAPH:
+            depth -= 1
+            if depth == 0:
+                yield "".join(pieces)
+                pieces = []
+
+        # Drop finished elements so memory stays bounded by one paragraph
+        if depth == 0 and parents:
+            parents[-1].remove(element)
+        else:
+            element.clear()
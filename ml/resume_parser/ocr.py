@@ -0,0 +1,111 @@
+import hashlib
+import fitz  # PyMuPDF
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence
+from .resume_cache import ResumeCache
+
+# Rendering resolution for OCR; 300 DPI is Tesseract's recommended minimum
+OCR_DPI = 300
+
+def image_only_pages(pdf_document: fitz.Document, pages: Sequence[str]) -> List[int]:
+    """
+    Find pages that have no text layer but contain images.
+
+    Args:
+        pdf_document (fitz.Document): The open PDF
+        pages (Sequence[str]): Text extracted from each page
+
+    Returns:
+        List[int]: Indices of pages that need OCR
+    """
+    return [i for i, text in enumerate(pages) if not text.strip() and pdf_document[i].get_images()]
+
+def page_fingerprint(pdf_document: fitz.Document, index: int, dpi: int, lang: str) -> str:
+    """
+    Hash what determines a page's OCR output without rendering it.
+
+    The key covers the page's content stream, the raw streams of its
+    images and the OCR settings, so the same scan in another file hits.
+    """
+    page = pdf_document[index]
+    digest = hashlib.blake2b(f"{dpi}:{lang}".encode("utf-8"), digest_size=16)
+    digest.update(page.read_contents())
+    for image in page.get_images(full=True):
+        digest.update(pdf_document.xref_stream_raw(image[0]) or b"")
+    return digest.hexdigest()
+
+def _ocr_page_group(file_content: bytes, indices: List[int], dpi: int, lang: str) -> List[str]:
+    """Rasterize and OCR a group of pages in a worker process."""
+    import pytesseract
+    from PIL import Image
+
+    texts = []
+    with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
+        for i in indices:
+            pixmap = pdf_document[i].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            image = Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+            texts.append(pytesseract.image_to_string(image, lang=lang))
+    return texts
+
+def ocr_image_pages(
+    file_content: bytes,
+    pages: Sequence[str],
+    dpi: int = OCR_DPI,
+    lang: str = "eng",
+    cache: Optional[ResumeCache] = None,
+    executor: Optional[Executor] = None,
+    workers: int = 1
+) -> Dict[int, str]:
+    """
+    OCR the image-only pages of a PDF.
+
+    Pages with a text layer are never reopened or rendered, so text PDFs
+    only pay for one strip() per page. Uncached pages are split into
+    ``workers`` groups and OCRed on ``executor`` when one is given.
+
+    Args:
+        file_content (bytes): The PDF content
+        pages (Sequence[str]): Text extracted from each page
+        dpi (int): Rendering resolution
+        lang (str): Tesseract language
+        cache (Optional[ResumeCache]): OCR results keyed by page fingerprint
+        executor (Optional[Executor]): Pool to OCR pages in
+        workers (int): Number of page groups to submit
+
+    Returns:
+        Dict[int, str]: Raw OCR text by page index
+    """
+    if all(text.strip() for text in pages):
+        return {}
+
+    with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
+        keys = {
+            i: page_fingerprint(pdf_document, i, dpi, lang)
+            for i in image_only_pages(pdf_document, pages)
+        }
+
+    results: Dict[int, str] = {}
+    todo = []
+    for i, key in keys.items():
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[i] = cached["text"]
+        else:
+            todo.append(i)
+    if not todo:
+        return results
+
+    if executor is None or len(todo) == 1:
+        groups = [todo]
+        outputs = [_ocr_page_group(file_content, todo, dpi, lang)]
+    else:
+        groups = [todo[g::workers] for g in range(min(workers, len(todo)))]
+        futures = [executor.submit(_ocr_page_group, file_content, group, dpi, lang) for group in groups]
+        outputs = [future.result() for future in futures]
+
+    for group, texts in zip(groups, outputs):
+        for i, text in zip(group, texts):
+            results[i] = text
+            if cache is not None:
+                cache.put(keys[i], {"text": text})
+    return results
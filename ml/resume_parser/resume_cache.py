@@ -0,0 +1,91 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Bump when extraction or chunking changes so stale entries are not served
+CACHE_VERSION = 3
+
+def content_hash(file_content: bytes) -> str:
+    """Get the hash identifying a file's content, as recorded in chunk metadata."""
+    return hashlib.blake2b(file_content, digest_size=16).hexdigest()
+
+class ResumeCache:
+    def __init__(self, cache_dir: str = "data/resume_cache", max_memory_items: int = 32):
+        """
+        Initialize the processed-resume cache.
+
+        Results are stored as one JSON file per content key under cache_dir,
+        with the most recently used entries also kept in memory. Callers get
+        their own copy of a result, so changing it doesn't change the cache.
+
+        Args:
+            cache_dir (str): Directory for cached results
+            max_memory_items (int): Number of results kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def content_key(file_content: bytes, *params: Any) -> str:
+        """
+        Get the cache key for a file and the settings used to process it.
+
+        Args:
+            file_content (bytes): The file content
+            *params: Settings that change the result, e.g. chunk size
+
+        Returns:
+            str: Hex digest identifying the result
+        """
+        digest = hashlib.blake2b(file_content, digest_size=16)
+        digest.update(repr((CACHE_VERSION,) + params).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached result, or None if the key hasn't been seen."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+        if result is not None:
+            return copy.deepcopy(result)
+
+        try:
+            with open(self._path(key), "r") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, copy.deepcopy(result))
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result in memory and on disk."""
+        self._remember(key, copy.deepcopy(result))
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Error writing resume cache: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
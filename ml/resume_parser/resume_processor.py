@@ -1,86 +1,303 @@
 import fitz  # PyMuPDF
-import docx2txt
+import os
 import re
-from typing import Optional, Dict, Any, List
-import io
+import threading
+import unicodedata
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Union
+from .docx_reader import iter_docx_paragraphs
+from .ocr import OCR_DPI, ocr_image_pages
+from .resume_cache import ResumeCache, content_hash
+from .skill_extractor import get_skill_extractor
 from .text_processor import TextProcessor
 from ..rag.vector_store import VectorStoreManager
 
+# Punctuation that carries meaning in resumes; clean_text keeps it along
+# with letters and digits in any script, and drops other symbols
+_KEPT = r".,;:!?()'+#/&@%-"
+# Runs of whitespace and dropped characters that need rewriting: a run
+# starts with anything but a plain space, or with a space followed by more
+# of the run. A lone space between words never starts a match.
+_DIRTY_RUN_RE = re.compile(rf"(?:[^\w {_KEPT}]| [^\w{_KEPT}])[^\w{_KEPT}]*")
+_SPACE_RE = re.compile(r"\s")
+_DASH_RE = re.compile(r"[\u2010-\u2015\u2212]+")
+_SPACED_DASH_RE = re.compile(r"[^\S\n]*[\u2010-\u2015\u2212]+[^\S\n]*")
+
+class _RunReplacements(dict):
+    """Replacement for each distinct dirty run; a resume repeats only a few."""
+
+    def __missing__(self, run: str) -> str:
+        if "\n" in run:
+            # Keep blank lines as paragraph breaks for the chunker
+            value = "\n\n" if run.count("\n") > 1 else "\n"
+        elif _DASH_RE.fullmatch(run):
+            # Keep en-dash date ranges readable, spaced or not
+            value = "-"
+        elif _SPACED_DASH_RE.fullmatch(run):
+            value = " - "
+        elif _SPACE_RE.search(run):
+            value = " "
+        else:
+            value = ""
+        self[run] = value
+        return value
+
+# Largest resume upload accepted by process_resume
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+
+FileContent = Union[bytes, bytearray, memoryview]
+
+def _as_bytes(file_content: FileContent) -> bytes:
+    """Get file content as bytes, reusing the underlying object when possible."""
+    if isinstance(file_content, memoryview):
+        # A view over a whole bytes object (e.g. BytesIO.getbuffer) needs no copy
+        if isinstance(file_content.obj, bytes) and file_content.nbytes == len(file_content.obj):
+            return file_content.obj
+    return file_content if isinstance(file_content, bytes) else bytes(file_content)
+
+# Documents with at least this many pages are extracted in parallel
+PARALLEL_PAGE_THRESHOLD = 16
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Get the process pool shared by all PDF extractions."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _page_pool
+
+def _extract_page_range(file_content: bytes, first: int, last: int) -> List[str]:
+    """Extract the text of pages [first, last) of a PDF."""
+    with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
+        return [pdf_document[i].get_text() for i in range(first, last)]
+
 class ResumeProcessor:
-    def __init__(self):
-        """Initialize the resume processor with text processor and vector store."""
+    def __init__(
+        self,
+        vector_store: Optional[VectorStoreManager] = None,
+        cache_dir: Optional[str] = "data/resume_cache",
+        ocr_dpi: Optional[int] = OCR_DPI,
+        ocr_cache_dir: Optional[str] = "data/ocr_cache"
+    ):
+        """
+        Initialize the resume processor with text processor and vector store.
+        
+        Args:
+            vector_store (Optional[VectorStoreManager]): Store for resume chunks
+            cache_dir (Optional[str]): Directory for processed-resume results,
+                keyed by file content; None disables caching
+            ocr_dpi (Optional[int]): Resolution for OCR of scanned pages;
+                None disables OCR
+            ocr_cache_dir (Optional[str]): Directory for OCR output keyed by
+                page hash; None disables caching
+        """
         self.text_processor = TextProcessor()
-        self.vector_store = VectorStoreManager()
+        self.vector_store = vector_store or VectorStoreManager()
+        self.cache = ResumeCache(cache_dir) if cache_dir else None
+        self.ocr_dpi = ocr_dpi
+        self.ocr_cache = ResumeCache(ocr_cache_dir, max_memory_items=256) if ocr_cache_dir else None
 
     @staticmethod
     def clean_text(text: str) -> str:
-        """Clean and normalize extracted text."""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,;:!?()-]', '', text)
-        # Remove multiple newlines
-        text = re.sub(r'\n+', '\n', text)
-        return text.strip()
+        """
+        Clean and normalize extracted text.
+        
+        Compatibility forms (ligatures, full-width letters, non-breaking
+        spaces) are folded with NFKC unless the text is plain ASCII, then a
+        single regex scan collapses whitespace, keeping line and paragraph
+        breaks, and drops symbols.
+        """
+        if not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
+        replacements = _RunReplacements()
+        return _DIRTY_RUN_RE.sub(lambda match: replacements[match.group()], text).strip()
 
     @staticmethod
-    def extract_from_pdf(file_content: bytes) -> Optional[str]:
-        """Extract text from PDF file content."""
+    def extract_pages_from_pdf(file_content: bytes, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD) -> Optional[List[str]]:
+        """
+        Extract the cleaned text of each page of a PDF.
+        
+        Documents with at least ``parallel_threshold`` pages are split into
+        contiguous page ranges extracted in a shared process pool.
+        """
         try:
-            # Create a PDF document object
-            pdf_document = fitz.open(stream=file_content, filetype="pdf")
-            text = ""
+            with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
+                page_count = pdf_document.page_count
+                # At least parallel_threshold / 2 pages per worker
+                workers = min(os.cpu_count() or 1, page_count // max(1, parallel_threshold // 2))
+                parallel = page_count >= parallel_threshold and workers > 1
+                if not parallel:
+                    pages = [page.get_text() for page in pdf_document]
             
-            # Extract text from each page
-            for page in pdf_document:
-                text += page.get_text()
+            if parallel:
+                step = -(-page_count // workers)
+                futures = [
+                    _get_page_pool().submit(_extract_page_range, file_content, first, min(first + step, page_count))
+                    for first in range(0, page_count, step)
+                ]
+                pages = [text for future in futures for text in future.result()]
             
-            pdf_document.close()
-            return ResumeProcessor.clean_text(text)
+            return [ResumeProcessor.clean_text(text) for text in pages]
         except Exception as e:
             print(f"Error processing PDF: {str(e)}")
             return None
 
     @staticmethod
-    def extract_from_docx(file_content: bytes) -> Optional[str]:
-        """Extract text from DOCX file content."""
+    def fill_scanned_pages(
+        file_content: bytes,
+        pages: List[str],
+        dpi: int = OCR_DPI,
+        cache: Optional[ResumeCache] = None,
+        executor: Optional[Executor] = None
+    ) -> List[str]:
+        """
+        Replace the text of image-only pages with cleaned OCR output.
+        
+        Args:
+            file_content (bytes): The PDF content
+            pages (List[str]): Cleaned text of each page
+            dpi (int): OCR rendering resolution
+            cache (Optional[ResumeCache]): OCR output keyed by page hash
+            executor (Optional[Executor]): Pool to OCR pages in
+            
+        Returns:
+            List[str]: Page texts with scanned pages filled in
+        """
         try:
-            # Create a BytesIO object from the file content
-            docx_file = io.BytesIO(file_content)
-            # Extract text using docx2txt
-            text = docx2txt.process(docx_file)
+            ocr_texts = ocr_image_pages(file_content, pages, dpi, cache=cache, executor=executor, workers=os.cpu_count() or 1)
+        except Exception as e:
+            print(f"Error running OCR: {str(e)}")
+            return pages
+        if not ocr_texts:
+            return pages
+        
+        pages = list(pages)
+        for i, text in ocr_texts.items():
+            pages[i] = ResumeProcessor.clean_text(text)
+        return pages
+
+    @staticmethod
+    def join_pages(pages: List[str]) -> Tuple[str, List[int]]:
+        """Join page texts with paragraph breaks and return each page's start offset."""
+        offsets = []
+        position = 0
+        for text in pages:
+            offsets.append(position)
+            position += len(text) + 2
+        return "\n\n".join(pages), offsets
+
+    @staticmethod
+    def extract_from_pdf(file_content: bytes) -> Optional[str]:
+        """Extract text from PDF file content."""
+        pages = ResumeProcessor.extract_pages_from_pdf(file_content)
+        if pages is None:
+            return None
+        return ResumeProcessor.join_pages(pages)[0]
+
+    @staticmethod
+    def extract_from_docx(file_content: FileContent) -> Optional[str]:
+        """
+        Extract text from DOCX file content.
+        
+        The document XML is streamed paragraph by paragraph with a cap on
+        decompressed size, so only the extracted text is held in memory.
+        """
+        try:
+            # One line per paragraph; empty paragraphs become paragraph breaks
+            text = "\n".join(iter_docx_paragraphs(_as_bytes(file_content)))
             return ResumeProcessor.clean_text(text)
         except Exception as e:
             print(f"Error processing DOCX: {str(e)}")
             return None
 
-    def process_resume(self, file_content: bytes, file_type: str) -> Dict[str, Any]:
+    @staticmethod
+    def extract_skills(text: str) -> List[Dict[str, Any]]:
+        """
+        Find known skills and technologies in resume text without an LLM call.
+        
+        Args:
+            text (str): Resume text
+            
+        Returns:
+            List[Dict[str, Any]]: skill, category, count and character
+                positions for each skill, in order of first mention
+        """
+        return get_skill_extractor().extract(text)
+
+    def _extract_skills(self, text: str) -> List[str]:
+        """Get the normalized names of the skills mentioned in text."""
+        return [entry["skill"] for entry in self.extract_skills(text)]
+
+    def process_resume(self, file_content: FileContent, file_type: str, max_bytes: int = MAX_RESUME_BYTES) -> Dict[str, Any]:
         """
         Process resume file and return extracted text and chunks.
         
+        The upload is processed in memory; nothing is written to disk except
+        the cached result.
+        
         Args:
-            file_content (bytes): The file content
+            file_content (FileContent): The file content as bytes or a buffer
             file_type (str): The type of file ('pdf' or 'docx')
+            max_bytes (int): Largest accepted file size
             
         Returns:
             Dict[str, Any]: Dictionary containing extracted text and chunks
         """
+        size = file_content.nbytes if isinstance(file_content, memoryview) else len(file_content)
+        if size > max_bytes:
+            return {
+                "success": False,
+                "error": f"Resume is too large ({size / 1e6:.1f} MB, limit {max_bytes / 1e6:.1f} MB)"
+            }
+        if not size:
+            return {
+                "success": False,
+                "error": "The uploaded file is empty"
+            }
+        file_content = _as_bytes(file_content)
+        file_hash = content_hash(file_content)
+        
+        # Files seen before were already chunked; the cache may be shared
+        # with other stores, so only chunks this store lacks are embedded
+        cache_key = None
+        if self.cache is not None:
+            tp = self.text_processor
+            cache_key = self.cache.content_key(file_content, file_type.lower(), tp.chunk_size, tp.chunk_overlap, tp.unit, self.ocr_dpi)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                try:
+                    missing = set(self.vector_store.missing_ids([chunk["id"] for chunk in cached["chunks"]]))
+                    if missing:
+                        self.vector_store.add_documents([chunk for chunk in cached["chunks"] if chunk["id"] in missing])
+                    cached["vector_store_status"] = "success"
+                except Exception as e:
+                    print(f"Error adding documents to vector store: {str(e)}")
+                    cached["vector_store_status"] = "error"
+                return dict(cached, cached=True)
+        
         # Extract text from file
+        page_offsets = None
         if file_type.lower() == 'pdf':
-            extracted_text = self.extract_from_pdf(file_content)
+            pages = self.extract_pages_from_pdf(file_content)
+            if pages and self.ocr_dpi:
+                pages = self.fill_scanned_pages(file_content, pages, self.ocr_dpi, self.ocr_cache, _get_page_pool())
+            extracted_text, page_offsets = self.join_pages(pages) if pages else (None, None)
         elif file_type.lower() == 'docx':
             extracted_text = self.extract_from_docx(file_content)
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
         
-        if not extracted_text:
+        if not extracted_text or extracted_text.isspace():
             return {
                 "success": False,
                 "error": "Failed to extract text from the resume"
             }
         
         # Create chunks from extracted text
-        chunks = self.text_processor.create_chunks(extracted_text)
+        chunks = self.text_processor.create_chunks(extracted_text, page_offsets=page_offsets, content_hash=file_hash)
         chunk_stats = self.text_processor.get_chunk_statistics(chunks)
         
         # Add chunks to vector store
@@ -91,13 +308,19 @@ class ResumeProcessor:
             print(f"Error adding documents to vector store: {str(e)}")
             vector_store_status = "error"
         
-        return {
+        result = {
             "success": True,
+            "content_hash": file_hash,
             "extracted_text": extracted_text,
             "chunks": chunks,
+            "skills": self.extract_skills(extracted_text),
             "statistics": chunk_stats,
             "vector_store_status": vector_store_status
         }
+        # Only cache results whose chunks made it into the vector store
+        if cache_key is not None and vector_store_status == "success":
+            self.cache.put(cache_key, result)
+        return dict(result, cached=False)
 
     def search_resume(self, query: str, k: int = 4) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,190 @@
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .skill_gazetteer import SKILL_GAZETTEER
+
+# Role profiles for the mock interview roles. Every skill in a listed
+# category gets the category weight; named skills override it.
+ROLE_PROFILES = {
+    "Software Engineer": {
+        "categories": {
+            "Programming Languages": 0.6, "Web Development": 0.5, "Mobile Development": 0.4,
+            "Databases": 0.4, "Testing": 0.5, "Architecture": 0.7, "Cloud": 0.2, "DevOps": 0.2,
+            "Embedded & Systems": 0.3, "Game & Graphics": 0.2, "Methodologies": 0.2,
+        },
+        "skills": {
+            "Python": 1.0, "Java": 1.0, "JavaScript": 1.0, "TypeScript": 1.0, "C++": 1.0, "C#": 0.9,
+            "Go": 0.9, "Rust": 0.8, "SQL": 0.7, "Data Structures": 1.0, "Algorithms": 1.0,
+            "System Design": 1.0, "Object-Oriented Programming": 0.8, "Microservices": 0.8,
+            "Distributed Systems": 0.8, "REST": 0.7, "Git": 0.6, "Unit Testing": 0.7,
+            "Code Review": 0.5, "React": 0.7, "Node.js": 0.7, "Spring Boot": 0.7, "Django": 0.6,
+        },
+    },
+    "Data Scientist": {
+        "categories": {
+            "Data Science": 0.8, "Data Engineering": 0.4, "Databases": 0.2, "Programming Languages": 0.2,
+        },
+        "skills": {
+            "Python": 1.0, "R": 0.9, "SQL": 0.9, "Machine Learning": 1.0, "Deep Learning": 0.8,
+            "Statistics": 1.0, "A/B Testing": 0.8, "Data Analysis": 0.9, "Data Visualization": 0.7,
+            "Pandas": 0.9, "NumPy": 0.8, "scikit-learn": 0.9, "TensorFlow": 0.7, "PyTorch": 0.8,
+            "Natural Language Processing": 0.7, "Computer Vision": 0.6, "Large Language Models": 0.6,
+            "Feature Engineering": 0.8, "Jupyter": 0.5, "Apache Spark": 0.6, "Tableau": 0.4,
+            "Excel": 0.3, "MLOps": 0.5, "Time Series Analysis": 0.7, "Java": 0.1, "JavaScript": 0.1,
+        },
+    },
+    "Product Manager": {
+        "categories": {
+            "Product Management": 0.9, "Design": 0.5, "Methodologies": 0.5, "Soft Skills": 0.4,
+        },
+        "skills": {
+            "Product Strategy": 1.0, "Roadmapping": 1.0, "User Research": 0.9, "Requirements Gathering": 0.9,
+            "Product Analytics": 0.8, "Prioritization": 0.9, "KPIs": 0.8, "Stakeholder Management": 1.0,
+            "A/B Testing": 0.7, "Agile": 0.7, "Scrum": 0.6, "Jira": 0.5, "SQL": 0.4,
+            "Data Analysis": 0.5, "Market Research": 0.8, "Communication": 0.8, "Leadership": 0.7,
+            "UX Design": 0.5, "Wireframing": 0.5, "Figma": 0.4, "Growth": 0.6, "Pricing Strategy": 0.5,
+        },
+    },
+    "DevOps Engineer": {
+        "categories": {
+            "DevOps": 0.8, "Cloud": 0.8, "Networking": 0.5, "Security": 0.4, "Databases": 0.2,
+        },
+        "skills": {
+            "Docker": 1.0, "Kubernetes": 1.0, "Terraform": 1.0, "AWS": 1.0, "Azure": 0.8,
+            "Google Cloud": 0.8, "CI/CD": 1.0, "Jenkins": 0.7, "GitHub Actions": 0.7, "GitLab CI": 0.7,
+            "Ansible": 0.8, "Helm": 0.7, "Linux": 1.0, "Bash": 0.9, "Python": 0.6, "Go": 0.5,
+            "Prometheus": 0.7, "Grafana": 0.6, "Monitoring": 0.8, "Site Reliability Engineering": 0.9,
+            "Infrastructure as Code": 0.9, "Nginx": 0.5, "Git": 0.5, "DevSecOps": 0.6,
+        },
+    },
+}
+
+SkillList = Sequence[Union[str, Dict[str, Any]]]
+
+class RoleFitScorer:
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None, gazetteer: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        """
+        Build role weight vectors over the skill vocabulary.
+
+        Roles are rows of an L2-normalized (roles x skills) matrix and resumes
+        are L2-normalized skill vectors, so one matrix product gives the
+        cosine fit of any number of resumes against every role.
+
+        Args:
+            profiles: role -> {"categories": {...}, "skills": {...}} weights
+            gazetteer: Skill gazetteer defining the vocabulary
+        """
+        profiles = ROLE_PROFILES if profiles is None else profiles
+        gazetteer = SKILL_GAZETTEER if gazetteer is None else gazetteer
+
+        self.skills: List[str] = []
+        categories: List[str] = []
+        for category, skills in gazetteer.items():
+            for skill in skills:
+                self.skills.append(skill)
+                categories.append(category)
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+
+        self.roles: List[str] = list(profiles)
+        weights = np.zeros((len(self.roles), len(self.skills)), dtype=np.float32)
+        for r, role in enumerate(self.roles):
+            category_weights = profiles[role].get("categories", {})
+            weights[r] = [category_weights.get(category, 0.0) for category in categories]
+            for skill, weight in profiles[role].get("skills", {}).items():
+                column = self.skill_index.get(skill)
+                if column is not None:
+                    weights[r, column] = weight
+        self.raw_weights = weights
+        self.weights = weights / np.maximum(np.linalg.norm(weights, axis=1, keepdims=True), 1e-12)
+
+    def _entries(self, skills: SkillList) -> Tuple[List[int], List[float]]:
+        """Get vocabulary columns and log-count values for one resume."""
+        values: Dict[int, float] = {}
+        for entry in skills:
+            if isinstance(entry, dict):
+                name, count = entry["skill"], entry.get("count", 1)
+            else:
+                name, count = entry, 1
+            column = self.skill_index.get(name)
+            if column is not None:
+                values[column] = values.get(column, 0.0) + count
+        columns = list(values)
+        return columns, [1.0 + math.log(values[c]) for c in columns]
+
+    def resume_matrix(self, resumes: Sequence[SkillList]) -> np.ndarray:
+        """
+        Encode resumes as L2-normalized skill vectors.
+
+        Args:
+            resumes: Per resume, skill names or ResumeProcessor skill entries
+
+        Returns:
+            np.ndarray: (len(resumes), len(skills)) float32 matrix
+        """
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+        for i, skills in enumerate(resumes):
+            resume_columns, resume_values = self._entries(skills)
+            rows.extend([i] * len(resume_columns))
+            columns.extend(resume_columns)
+            values.extend(resume_values)
+
+        matrix = np.zeros((len(resumes), len(self.skills)), dtype=np.float32)
+        matrix[rows, columns] = values
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        return matrix
+
+    def score_batch(self, resumes: Sequence[SkillList], role: Optional[str] = None) -> np.ndarray:
+        """
+        Score many resumes with one matrix product.
+
+        Args:
+            resumes: Per resume, skill names or ResumeProcessor skill entries
+            role: Restrict scoring to one role
+
+        Returns:
+            np.ndarray: (n, roles) fit scores in [0, 1], or (n,) for one role
+        """
+        matrix = self.resume_matrix(resumes)
+        if role is not None:
+            return matrix @ self.weights[self.roles.index(role)]
+        return matrix @ self.weights.T
+
+    def rank_roles(self, skills: SkillList, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rank roles for one resume.
+
+        Args:
+            skills: Skill names or ResumeProcessor skill entries
+            top_k: Number of roles to return (default: all)
+
+        Returns:
+            List[Dict[str, Any]]: role, score and the skills contributing most, best first
+        """
+        scores = self.score_batch([skills])[0]
+        columns, _ = self._entries(skills)
+        ranking = []
+        for r in np.argsort(-scores, kind="stable")[:top_k]:
+            contributing = sorted(
+                (c for c in columns if self.raw_weights[r, c] > 0),
+                key=lambda c: -self.raw_weights[r, c]
+            )
+            ranking.append({
+                "role": self.roles[r],
+                "score": float(scores[r]),
+                "matched_skills": [self.skills[c] for c in contributing[:5]]
+            })
+        return ranking
+
+_default_scorer: Optional[RoleFitScorer] = None
+_default_scorer_lock = threading.Lock()
+
+def get_role_fit_scorer() -> RoleFitScorer:
+    """Get the process-wide scorer for the built-in role profiles, building it once."""
+    global _default_scorer
+    with _default_scorer_lock:
+        if _default_scorer is None:
+            _default_scorer = RoleFitScorer()
+        return _default_scorer
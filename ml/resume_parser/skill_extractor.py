@@ -0,0 +1,220 @@
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from .skill_gazetteer import CASE_SENSITIVE_TERMS, CONTEXT_CUES, CONTEXT_TERMS, SKILL_GAZETTEER
+
+class SkillExtractor:
+    def __init__(
+        self,
+        gazetteer: Optional[Dict[str, Dict[str, List[str]]]] = None,
+        case_sensitive_terms: Optional[Iterable[str]] = None,
+        context_terms: Optional[Iterable[str]] = None,
+        context_window: int = 40
+    ):
+        """
+        Build an Aho-Corasick automaton over a skill gazetteer.
+
+        All terms are matched in one left-to-right pass over the lowercased
+        text, so extraction time depends on the text length, not on the
+        number of terms.
+
+        Args:
+            gazetteer: category -> canonical skill -> aliases
+            case_sensitive_terms: Terms that only match with this exact capitalisation
+            context_terms: Ambiguous terms that only match within context_window
+                characters of another skill of the same category or a context cue
+            context_window: Characters searched on each side of a context term
+        """
+        gazetteer = SKILL_GAZETTEER if gazetteer is None else gazetteer
+        case_sensitive = CASE_SENSITIVE_TERMS if case_sensitive_terms is None else case_sensitive_terms
+        self._exact = {term.lower(): term for term in case_sensitive}
+        self._contextual = {term.lower() for term in (CONTEXT_TERMS if context_terms is None else context_terms)}
+        self.context_window = context_window
+
+        # Trie as parallel arrays: goto transitions, failure links, outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        # term index -> (canonical skill, category, term length, exact surface or None, needs context)
+        self._terms: List[Tuple[str, str, int, Optional[str], bool]] = []
+
+        seen: Set[str] = set()
+        for category, skills in gazetteer.items():
+            for skill, aliases in skills.items():
+                for term in [skill] + list(aliases):
+                    key = term.lower().strip()
+                    if not key or key in seen:
+                        continue
+                    seen.add(key)
+                    self._add_term(key, skill, category)
+        self._build_failure_links()
+
+    @classmethod
+    def from_json(cls, path: str) -> "SkillExtractor":
+        """Build an extractor from a JSON gazetteer in the SKILL_GAZETTEER shape."""
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def _add_term(self, key: str, skill: str, category: str) -> None:
+        node = 0
+        for ch in key:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append(len(self._terms))
+        self._terms.append((skill, category, len(key), self._exact.get(key), key in self._contextual))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                # Inherit the matches of the longest proper suffix
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    @staticmethod
+    def _is_word_char(ch: str) -> bool:
+        return ch.isalnum() or ch == "_"
+
+    def find(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Find skill mentions in text.
+
+        Matches must start and end on word boundaries; overlapping matches are
+        resolved leftmost-longest, so "React Native" wins over "React".
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            List[Dict[str, Any]]: skill, category, start, end and matched text, in order
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to several; keep offsets aligned
+            lowered = "".join(ch.lower()[0] for ch in text)
+
+        goto, fail, out, terms = self._goto, self._fail, self._out, self._terms
+        is_word = self._is_word_char
+        n = len(text)
+        candidates = []
+        node = 0
+        for end, ch in enumerate(lowered, 1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            if end < n and is_word(text[end]) and is_word(text[end - 1]):
+                continue
+            for term in out[node]:
+                skill, category, length, exact, contextual = terms[term]
+                start = end - length
+                if start > 0 and is_word(text[start - 1]) and is_word(text[start]):
+                    continue
+                if exact is not None and text[start:end] != exact:
+                    continue
+                if length == 1 and ((start > 0 and text[start - 1] == "&") or (end < n and text[end] == "&")):
+                    continue  # "R&D", "AT&T"
+                candidates.append((start, end, skill, category, contextual))
+
+        matches = []
+        contextual_matches = []
+        last_end = 0
+        for start, end, skill, category, contextual in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if start >= last_end:
+                matches.append({
+                    "skill": skill,
+                    "category": category,
+                    "start": start,
+                    "end": end,
+                    "text": text[start:end]
+                })
+                if contextual:
+                    contextual_matches.append(len(matches) - 1)
+                last_end = end
+
+        if contextual_matches:
+            contextual_set = set(contextual_matches)
+            dropped = {i for i in contextual_matches if not self._in_context(text, lowered, matches, i, contextual_set)}
+            matches = [match for i, match in enumerate(matches) if i not in dropped]
+        return matches
+
+    def _in_context(self, text: str, lowered: str, matches: List[Dict[str, Any]], index: int, contextual: Set[int]) -> bool:
+        """
+        Check if a context term match reads as a skill rather than a grade or initial.
+
+        Args:
+            text (str): Resume text
+            lowered (str): Lowercased text with the same offsets
+            matches (List[Dict[str, Any]]): All resolved matches, in order
+            index (int): Index of the match to check
+            contextual (Set[int]): Indexes of all context term matches
+
+        Returns:
+            bool: True if the match should be kept
+        """
+        match = matches[index]
+        start, end = match["start"], match["end"]
+        if text[end:end + 2] == ". " and text[end + 2:end + 3].isupper():
+            return False  # "John C. Smith"
+
+        low, high = start - self.context_window, end + self.context_window
+        for i, other in enumerate(matches):
+            if other["start"] >= high:
+                break
+            if (
+                other["end"] > low
+                and other["category"] == match["category"]
+                and i not in contextual
+            ):
+                return True
+        window = lowered[max(low, 0):high]
+        return any(cue in window for cue in CONTEXT_CUES)
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Summarize the skills mentioned in text.
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            List[Dict[str, Any]]: skill, category, count and positions for each
+                distinct skill, in order of first mention
+        """
+        skills: Dict[str, Dict[str, Any]] = {}
+        for match in self.find(text):
+            entry = skills.get(match["skill"])
+            if entry is None:
+                entry = skills[match["skill"]] = {
+                    "skill": match["skill"],
+                    "category": match["category"],
+                    "count": 0,
+                    "positions": []
+                }
+            entry["count"] += 1
+            entry["positions"].append([match["start"], match["end"]])
+        return list(skills.values())
+
+_default_extractor: Optional[SkillExtractor] = None
+_default_extractor_lock = threading.Lock()
+
+def get_skill_extractor() -> SkillExtractor:
+    """Get the process-wide extractor for the built-in gazetteer, building it once."""
+    global _default_extractor
+    with _default_extractor_lock:
+        if _default_extractor is None:
+            _default_extractor = SkillExtractor()
+        return _default_extractor
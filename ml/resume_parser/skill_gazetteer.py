@@ -0,0 +1,378 @@
+# Built-in skill gazetteer: category -> canonical skill -> aliases.
+# Matching is case-insensitive on word boundaries; the canonical name is
+# always matched as well. Larger gazetteers can be loaded from JSON in the
+# same shape with SkillExtractor.from_json.
+SKILL_GAZETTEER = {
+    "Programming Languages": {
+        "Python": ["python3", "python 3", "cpython"],
+        "Java": ["java 8", "java 11", "java 17", "core java"],
+        "JavaScript": ["javascript", "js", "ecmascript", "es6", "es2015", "vanilla js"],
+        "TypeScript": [],
+        "C": ["ansi c", "c99", "c11"],
+        "C++": ["cpp", "c plus plus", "c++11", "c++14", "c++17", "c++20", "modern c++"],
+        "C#": ["c sharp", "csharp"],
+        "Go": ["golang"],
+        "Rust": ["rustlang"],
+        "Kotlin": [],
+        "Swift": [],
+        "Objective-C": ["objective c", "objc"],
+        "Ruby": [],
+        "PHP": [],
+        "Scala": [],
+        "R": ["r programming", "rstats", "r language"],
+        "MATLAB": ["matlab"],
+        "Julia": [],
+        "Perl": [],
+        "Haskell": [],
+        "Elixir": [],
+        "Erlang": [],
+        "Clojure": [],
+        "F#": ["fsharp", "f sharp"],
+        "Dart": [],
+        "Lua": [],
+        "Groovy": [],
+        "Bash": ["shell scripting", "bash scripting", "shell script"],
+        "PowerShell": ["powershell"],
+        "SQL": ["structured query language", "t-sql", "tsql", "pl/sql", "plsql"],
+        "Solidity": [],
+        "Assembly": ["x86 assembly", "arm assembly", "asm"],
+        "Fortran": [],
+        "COBOL": [],
+        "VBA": ["visual basic for applications"],
+        "Visual Basic": ["vb.net"],
+        "Zig": [],
+        "OCaml": [],
+    },
+    "Web Development": {
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "Sass": ["scss"],
+        "Less": [],
+        "Tailwind CSS": ["tailwind", "tailwindcss"],
+        "Bootstrap": [],
+        "React": ["react.js", "reactjs", "react js"],
+        "React Native": ["react-native"],
+        "Angular": ["angular.js", "angularjs", "angular 2+"],
+        "Vue.js": ["vue", "vuejs", "vue js", "vue 3"],
+        "Svelte": ["sveltekit"],
+        "Next.js": ["nextjs", "next js"],
+        "Nuxt.js": ["nuxt", "nuxtjs"],
+        "Redux": ["redux toolkit"],
+        "jQuery": ["jquery"],
+        "Node.js": ["node", "nodejs", "node js"],
+        "Express": ["express.js", "expressjs"],
+        "NestJS": ["nest.js"],
+        "Deno": [],
+        "Django": ["django rest framework", "drf"],
+        "Flask": [],
+        "FastAPI": ["fast api"],
+        "Spring": ["spring framework", "spring mvc"],
+        "Spring Boot": ["springboot"],
+        "Ruby on Rails": ["rails", "ror"],
+        "Laravel": [],
+        "Symfony": [],
+        "ASP.NET": ["asp.net core", "asp.net mvc"],
+        ".NET": ["dotnet", ".net core", ".net framework", "dot net"],
+        "GraphQL": ["apollo graphql"],
+        "REST": ["rest api", "rest apis", "restful", "restful apis", "restful services"],
+        "gRPC": ["grpc"],
+        "WebSockets": ["websocket", "socket.io"],
+        "Webpack": [],
+        "Vite": [],
+        "Babel": [],
+        "OAuth": ["oauth2", "oauth 2.0"],
+        "JWT": ["json web tokens", "json web token"],
+        "WordPress": ["wordpress"],
+        "Web Accessibility": ["wcag", "a11y", "accessibility"],
+        "Progressive Web Apps": ["pwa", "pwas"],
+    },
+    "Mobile Development": {
+        "Android": ["android sdk", "android development"],
+        "iOS": ["ios development", "ios sdk"],
+        "Flutter": [],
+        "SwiftUI": [],
+        "Jetpack Compose": [],
+        "Xamarin": [],
+        "Ionic": [],
+    },
+    "Databases": {
+        "PostgreSQL": ["postgres", "postgresql", "psql"],
+        "MySQL": ["mysql", "mariadb"],
+        "SQLite": ["sqlite3"],
+        "Oracle Database": ["oracle db", "oracle"],
+        "Microsoft SQL Server": ["sql server", "mssql", "ms sql"],
+        "MongoDB": ["mongo", "mongodb atlas"],
+        "Redis": [],
+        "Cassandra": ["apache cassandra"],
+        "DynamoDB": ["amazon dynamodb", "dynamo db"],
+        "Elasticsearch": ["elastic search", "elk", "elk stack", "opensearch"],
+        "Neo4j": [],
+        "CouchDB": [],
+        "Firebase": ["firestore", "firebase realtime database"],
+        "Snowflake": [],
+        "BigQuery": ["google bigquery", "big query"],
+        "Amazon Redshift": ["redshift"],
+        "ClickHouse": [],
+        "Memcached": [],
+        "InfluxDB": [],
+        "TimescaleDB": [],
+        "Pinecone": [],
+        "ChromaDB": [],
+        "FAISS": ["faiss"],
+        "Database Design": ["data modeling", "data modelling", "schema design", "database normalization"],
+        "ORM": ["sqlalchemy", "hibernate", "prisma", "sequelize", "entity framework"],
+    },
+    "Cloud": {
+        "AWS": ["amazon web services", "aws cloud"],
+        "Amazon EC2": ["ec2"],
+        "Amazon S3": ["s3"],
+        "AWS Lambda": ["lambda functions", "aws lambda"],
+        "Amazon ECS": ["ecs", "fargate"],
+        "Amazon EKS": ["eks"],
+        "Amazon SQS": ["sqs"],
+        "Amazon SNS": [],
+        "AWS CloudFormation": ["cloudformation"],
+        "Azure": ["microsoft azure", "azure cloud"],
+        "Azure DevOps": ["vsts"],
+        "Google Cloud": ["gcp", "google cloud platform"],
+        "Google Kubernetes Engine": ["gke"],
+        "Cloud Run": ["google cloud run"],
+        "Heroku": [],
+        "DigitalOcean": ["digital ocean"],
+        "Vercel": [],
+        "Netlify": [],
+        "Cloudflare": ["cloudflare workers"],
+        "Serverless": ["serverless architecture", "serverless framework"],
+    },
+    "DevOps": {
+        "Docker": ["docker compose", "docker-compose", "dockerfile", "containerization"],
+        "Kubernetes": ["k8s", "kubectl"],
+        "Helm": ["helm charts"],
+        "Terraform": ["hcl"],
+        "Ansible": [],
+        "Puppet": [],
+        "Chef": [],
+        "Jenkins": [],
+        "GitHub Actions": ["github actions"],
+        "GitLab CI": ["gitlab ci/cd", "gitlab-ci"],
+        "CircleCI": ["circle ci"],
+        "Travis CI": [],
+        "Argo CD": ["argocd"],
+        "CI/CD": ["ci cd", "continuous integration", "continuous delivery", "continuous deployment", "ci/cd pipelines"],
+        "Git": ["github", "gitlab", "bitbucket", "version control"],
+        "Linux": ["unix", "ubuntu", "centos", "red hat", "rhel", "debian"],
+        "Nginx": [],
+        "Apache HTTP Server": ["apache httpd", "apache2"],
+        "Prometheus": [],
+        "Grafana": [],
+        "Datadog": [],
+        "New Relic": [],
+        "Splunk": [],
+        "OpenTelemetry": ["otel"],
+        "Monitoring": ["observability", "alerting"],
+        "Site Reliability Engineering": ["sre"],
+        "Infrastructure as Code": ["iac"],
+        "Istio": ["service mesh"],
+        "Vagrant": [],
+        "Packer": [],
+    },
+    "Data Engineering": {
+        "Apache Spark": ["spark", "pyspark", "spark sql"],
+        "Apache Kafka": ["kafka", "kafka streams"],
+        "Apache Airflow": ["airflow"],
+        "Apache Flink": ["flink"],
+        "Apache Beam": ["google dataflow"],
+        "Hadoop": ["hdfs", "mapreduce", "hive", "apache hive"],
+        "dbt": ["data build tool"],
+        "ETL": ["elt", "etl pipelines", "data pipelines", "data pipeline"],
+        "Data Warehousing": ["data warehouse", "data warehouses"],
+        "Data Lake": ["data lakes", "delta lake", "lakehouse"],
+        "Databricks": [],
+        "RabbitMQ": [],
+        "Apache Pulsar": ["pulsar"],
+        "Presto": ["trino"],
+        "Parquet": ["apache parquet"],
+    },
+    "Data Science": {
+        "Machine Learning": ["ml", "machine-learning"],
+        "Deep Learning": ["deep neural networks", "neural networks", "neural network"],
+        "Natural Language Processing": ["nlp", "text mining"],
+        "Computer Vision": ["image processing", "object detection", "image classification"],
+        "Large Language Models": ["llm", "llms", "generative ai", "genai"],
+        "Retrieval-Augmented Generation": ["rag"],
+        "Prompt Engineering": [],
+        "Reinforcement Learning": [],
+        "Statistics": ["statistical analysis", "statistical modeling", "hypothesis testing"],
+        "A/B Testing": ["ab testing", "a/b tests", "experimentation", "split testing"],
+        "Data Analysis": ["data analytics", "exploratory data analysis", "eda"],
+        "Data Visualization": ["data viz", "dashboards", "dashboarding"],
+        "Time Series Analysis": ["time series", "forecasting"],
+        "Recommender Systems": ["recommendation systems", "recommendation engines"],
+        "Feature Engineering": [],
+        "MLOps": ["ml ops", "model deployment", "model serving"],
+        "Pandas": [],
+        "NumPy": ["numpy"],
+        "SciPy": ["scipy"],
+        "scikit-learn": ["sklearn", "scikit learn"],
+        "TensorFlow": ["tensorflow 2", "tf.keras"],
+        "Keras": [],
+        "PyTorch": ["torch"],
+        "JAX": [],
+        "XGBoost": [],
+        "LightGBM": [],
+        "CatBoost": [],
+        "Hugging Face": ["huggingface", "transformers library", "hugging face transformers"],
+        "LangChain": ["langchain"],
+        "OpenAI API": ["openai", "gpt-4", "gpt-3.5", "chatgpt"],
+        "spaCy": ["spacy"],
+        "NLTK": [],
+        "OpenCV": ["opencv"],
+        "Matplotlib": [],
+        "Seaborn": [],
+        "Plotly": [],
+        "Jupyter": ["jupyter notebook", "jupyter notebooks", "jupyterlab"],
+        "MLflow": [],
+        "Kubeflow": [],
+        "Tableau": [],
+        "Power BI": ["powerbi"],
+        "Looker": [],
+        "Excel": ["microsoft excel", "advanced excel", "pivot tables", "vlookup"],
+        "SAS": [],
+        "SPSS": [],
+        "Stata": [],
+    },
+    "Testing": {
+        "Unit Testing": ["unit tests", "unit test"],
+        "Integration Testing": ["integration tests"],
+        "Test-Driven Development": ["tdd", "test driven development"],
+        "Behavior-Driven Development": ["bdd", "cucumber", "gherkin"],
+        "pytest": [],
+        "unittest": [],
+        "JUnit": [],
+        "TestNG": [],
+        "Mockito": [],
+        "Jest": [],
+        "Mocha": [],
+        "Cypress": [],
+        "Playwright": [],
+        "Selenium": ["selenium webdriver"],
+        "Postman": [],
+        "Load Testing": ["performance testing", "jmeter", "locust", "k6", "gatling"],
+        "Test Automation": ["automated testing", "qa automation"],
+    },
+    "Architecture": {
+        "Microservices": ["microservice", "microservices architecture", "micro-services"],
+        "Distributed Systems": ["distributed computing"],
+        "System Design": ["systems design", "software architecture", "solution architecture"],
+        "Event-Driven Architecture": ["event driven", "event sourcing", "cqrs"],
+        "Domain-Driven Design": ["ddd", "domain driven design"],
+        "Design Patterns": ["gang of four", "solid principles"],
+        "Object-Oriented Programming": ["oop", "object oriented programming", "object-oriented design", "ood"],
+        "Functional Programming": [],
+        "API Design": ["api development", "openapi", "swagger"],
+        "Caching": ["cdn"],
+        "Message Queues": ["message queue", "message broker", "pub/sub", "pubsub"],
+        "Scalability": ["high availability", "horizontal scaling", "load balancing", "fault tolerance"],
+        "Concurrency": ["multithreading", "multi-threading", "parallel programming", "async programming", "asyncio"],
+        "Data Structures": ["data structures and algorithms", "dsa"],
+        "Algorithms": [],
+        "Performance Optimization": ["performance tuning", "profiling", "latency optimization"],
+    },
+    "Security": {
+        "Cybersecurity": ["cyber security", "information security", "infosec"],
+        "Application Security": ["appsec", "secure coding", "owasp"],
+        "Penetration Testing": ["pen testing", "pentesting", "ethical hacking"],
+        "Identity and Access Management": ["iam", "rbac", "sso", "single sign-on", "saml"],
+        "Encryption": ["cryptography", "tls", "ssl", "pki"],
+        "Network Security": ["firewalls", "vpn", "ids/ips"],
+        "Security Compliance": ["soc 2", "soc2", "iso 27001", "gdpr", "hipaa", "pci dss", "pci-dss"],
+        "Vulnerability Management": ["vulnerability scanning", "threat modeling"],
+    },
+    "Networking": {
+        "TCP/IP": ["tcp", "udp", "networking protocols"],
+        "HTTP": ["http/2", "https"],
+        "DNS": [],
+        "Computer Networking": ["computer networks", "ccna", "routing and switching"],
+    },
+    "Embedded & Systems": {
+        "Embedded Systems": ["embedded software", "firmware", "microcontrollers", "rtos"],
+        "Operating Systems": ["os internals", "kernel development", "linux kernel"],
+        "FPGA": ["verilog", "vhdl"],
+        "IoT": ["internet of things"],
+        "Robotics": ["robot operating system"],
+        "CUDA": ["gpu programming"],
+    },
+    "Game & Graphics": {
+        "Unity": ["unity3d"],
+        "Unreal Engine": ["unreal", "ue4", "ue5"],
+        "OpenGL": [],
+        "Vulkan": [],
+        "WebGL": ["three.js", "threejs"],
+        "Game Development": ["gamedev", "game design"],
+    },
+    "Product Management": {
+        "Product Management": ["product manager", "product ownership", "product owner"],
+        "Product Strategy": ["product vision", "go-to-market", "gtm strategy"],
+        "Roadmapping": ["product roadmap", "roadmaps", "roadmap planning"],
+        "User Research": ["customer research", "user interviews", "customer discovery", "usability testing"],
+        "Requirements Gathering": ["requirements analysis", "prd", "prds", "product requirements", "user stories"],
+        "Product Analytics": ["mixpanel", "amplitude", "google analytics", "funnel analysis"],
+        "Prioritization": ["backlog prioritization", "backlog grooming", "backlog management"],
+        "Market Research": ["competitive analysis", "market analysis"],
+        "KPIs": ["okrs", "okr", "metrics definition", "north star metric"],
+        "Stakeholder Management": ["stakeholder communication", "cross-functional collaboration", "cross functional teams"],
+        "Pricing Strategy": ["monetization"],
+        "Growth": ["growth hacking", "user acquisition", "growth marketing"],
+    },
+    "Design": {
+        "UX Design": ["ux", "user experience", "interaction design"],
+        "UI Design": ["ui", "user interface design", "visual design"],
+        "Figma": [],
+        "Sketch": [],
+        "Adobe XD": [],
+        "Wireframing": ["wireframes", "prototyping", "mockups"],
+        "Design Systems": ["design system", "component library"],
+    },
+    "Methodologies": {
+        "Agile": ["agile methodologies", "agile development"],
+        "Scrum": ["scrum master", "sprint planning", "sprints"],
+        "Kanban": [],
+        "Lean": ["lean startup", "six sigma"],
+        "Waterfall": [],
+        "Jira": ["atlassian jira"],
+        "Confluence": [],
+        "Code Review": ["code reviews", "peer review"],
+        "Pair Programming": ["mob programming"],
+        "DevSecOps": [],
+    },
+    "Soft Skills": {
+        "Leadership": ["led a team", "team lead", "tech lead", "technical leadership", "people management"],
+        "Mentoring": ["mentored", "mentorship", "coaching"],
+        "Communication": ["written communication", "verbal communication", "presentation skills", "public speaking"],
+        "Problem Solving": ["problem-solving", "troubleshooting", "debugging"],
+        "Project Management": ["project planning", "pmp", "program management"],
+        "Teamwork": ["team player"],
+        "Time Management": ["prioritisation", "multitasking"],
+        "Negotiation": [],
+        "Critical Thinking": ["analytical skills", "analytical thinking"],
+    },
+}
+
+# Terms that are also everyday words or abbreviations only match with this
+# exact capitalisation (e.g. "Go" but not "go", "ML" but not "ml").
+CASE_SENSITIVE_TERMS = {
+    "C", "R", "Go", "ML", "UI", "UX", "RAG", "SRE", "IAM", "ETL", "ELT", "EDA", "LLM", "PRD",
+    "Rust", "Swift", "Ruby", "Julia", "Dart", "Less", "Chef", "Puppet", "Spring", "Sketch",
+    "Lean", "Growth", "Unity", "Jest", "Mocha", "Express", "Ionic", "Looker", "Oracle", "Spark",
+    "Hive", "Rails", "Node", "Vite", "Babel", "Helm", "Presto", "Pulsar", "Flask", "Vue", "SAS",
+    "Excel", "Pandas", "Keras", "Scala", "Perl", "Lua", "Assembly", "Agile", "Kanban", "Waterfall",
+    "Serverless", "Monitoring", "Caching", "Algorithms", "Statistics", "Negotiation", "Leadership",
+    "Communication", "Mentoring", "Teamwork", "Accessibility", "Forecasting", "Pricing",
+    "Prototyping", "Dashboards", "Redis", "Torch", "Unreal", "Embedded", "Lambda", "Firebase",
+}
+
+# Single-letter terms that are also grades and initials ("Grade C", "John C. Smith")
+# only count near another skill of the same category or one of CONTEXT_CUES.
+CONTEXT_TERMS = {"C", "R"}
+
+CONTEXT_CUES = ("language", "programming", "coding", "compiler", "skills")
@@ -1 +1,229 @@
- 
\ No newline at end of file
+import bisect
+import hashlib
+import re
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Split points, strongest first. A chunk ends right after the match.
+_BOUNDARY_RE = re.compile(
+    r"(?P<section>\n[ \t]*\n\s*|\n(?=[ \t]*[A-Z][A-Z0-9 &/]{2,}:?[ \t]*(?:\n|$)))"
+    r"|(?P<sentence>[.!?][\"')\]]*(?:[ \t]+|(?=\n)))"
+    r"|(?P<line>\n)"
+)
+_BOUNDARY_RANKS = {"section": 3, "sentence": 2, "line": 1}
+
+# Approximate tokens: words and individual punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+class TextProcessor:
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, unit: str = "chars"):
+        """
+        Initialize the text processor.
+
+        Args:
+            chunk_size (int): Maximum chunk size, in ``unit``
+            chunk_overlap (int): Overlap between consecutive chunks, in ``unit``
+            unit (str): "chars" or "tokens" (words and punctuation marks)
+        """
+        if unit not in ("chars", "tokens"):
+            raise ValueError(f"Unsupported chunk unit: {unit}")
+        if chunk_size <= 0 or not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be non-negative and smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.unit = unit
+
+    @staticmethod
+    def chunk_id(content: str, content_hash: Optional[str] = None) -> str:
+        """
+        Get a stable, content-derived ID for a chunk.
+
+        With the content hash of the file the chunk came from, the same text
+        in two files gets two IDs, so neither overwrites the other in a
+        shared collection.
+        """
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8)
+        if content_hash:
+            digest.update(b"\0" + content_hash.encode("utf-8"))
+        return digest.hexdigest()
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Split text into (start, end) character spans in a single pass.
+
+        Chunks end at the strongest boundary (section, then sentence, then
+        line) in the second half of the size window, falling back to the last
+        space there and then to a hard cut at the window end, so no chunk is
+        shorter than half the window except the last. The next chunk starts ``chunk_overlap`` units earlier,
+        snapped forward to a boundary. Boundaries and tokens are only buffered
+        for the current window, so memory does not grow with the text.
+
+        Args:
+            text (str): Text to split
+
+        Yields:
+            Tuple[int, int]: Character span of each chunk
+        """
+        n = len(text)
+        boundaries: Deque[Tuple[int, int]] = deque()
+        matches = _BOUNDARY_RE.finditer(text)
+        pending = next(matches, None)
+
+        tokens: Deque[Tuple[int, int]] = deque()
+        token_matches = _TOKEN_RE.finditer(text) if self.unit == "tokens" else None
+
+        start = 0
+        while start < n:
+            limit = self._window_end(start, n, tokens, token_matches)
+            if limit >= n:
+                if text[start:].strip():
+                    yield start, n
+                return
+
+            while pending is not None and pending.end() <= limit:
+                boundaries.append((pending.end(), _BOUNDARY_RANKS[pending.lastgroup]))
+                pending = next(matches, None)
+            while boundaries and boundaries[0][0] <= start:
+                boundaries.popleft()
+
+            cut, best_rank = None, 0
+            min_cut = start + (limit - start) // 2
+            for pos, rank in boundaries:
+                if pos >= min_cut and rank >= best_rank:
+                    cut, best_rank = pos, rank
+            if cut is None:
+                space = text.rfind(" ", min_cut, limit)
+                cut = space + 1 if space > start else limit
+
+            yield start, cut
+
+            next_start = self._overlap_start(text, start, cut, boundaries, tokens)
+            start = max(next_start, start + 1)
+
+    def _window_end(self, start: int, n: int, tokens: Deque[Tuple[int, int]], token_matches: Optional[Iterator[re.Match]]) -> int:
+        """Get the character position where a chunk starting at ``start`` must end."""
+        if token_matches is None:
+            return start + self.chunk_size
+
+        while tokens and tokens[0][1] <= start:
+            tokens.popleft()
+        while len(tokens) < self.chunk_size:
+            match = next(token_matches, None)
+            if match is None:
+                return n
+            if match.end() > start:
+                tokens.append(match.span())
+        return tokens[self.chunk_size - 1][1]
+
+    def _overlap_start(self, text: str, start: int, cut: int, boundaries: Deque[Tuple[int, int]], tokens: Deque[Tuple[int, int]]) -> int:
+        """Get where the next chunk starts so it overlaps the previous one."""
+        if self.chunk_overlap == 0:
+            return cut
+
+        if self.unit == "chars":
+            target = cut - self.chunk_overlap
+        else:
+            ends_before_cut = [span for span in tokens if span[1] <= cut]
+            if not ends_before_cut:
+                return cut
+            target = ends_before_cut[max(0, len(ends_before_cut) - self.chunk_overlap)][0]
+
+        if target <= start:
+            return cut
+        for pos, _ in boundaries:
+            if target <= pos < cut:
+                return pos
+        space = text.find(" ", target, cut)
+        return space + 1 if space != -1 else target
+
+    def iter_chunks(self, text: str, source: str = "resume", metadata: Optional[Dict[str, Any]] = None, page_offsets: Optional[List[int]] = None, content_hash: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily split text into chunk dictionaries.
+
+        ``total_chunks`` is not known while streaming and is left as None;
+        use create_chunks when the full list is needed.
+
+        Args:
+            text (str): Text to split
+            source (str): Source name stored in chunk metadata
+            metadata (Optional[Dict[str, Any]]): Extra metadata for every chunk
+            page_offsets (Optional[List[int]]): Start offset of each page; adds
+                1-based "page" and "page_end" to chunk metadata
+            content_hash (Optional[str]): Content hash of the source file;
+                scopes chunk IDs to it and is stored in chunk metadata
+
+        Yields:
+            Dict[str, Any]: Chunk with id, content, chunk_index and metadata
+        """
+        created_at = datetime.now().isoformat()
+        seen = set()
+        index = 0
+        for start, end in self.iter_spans(text):
+            content = text[start:end].strip()
+            if not content:
+                continue
+            chunk_id = self.chunk_id(content, content_hash)
+            if chunk_id in seen:
+                continue
+            seen.add(chunk_id)
+            chunk_metadata = dict(metadata or {}, source=source, start=start, end=end)
+            if content_hash:
+                chunk_metadata["content_hash"] = content_hash
+            if page_offsets:
+                chunk_metadata["page"] = bisect.bisect_right(page_offsets, start)
+                chunk_metadata["page_end"] = bisect.bisect_right(page_offsets, end - 1)
+            yield {
+                "id": chunk_id,
+                "content": content,
+                "chunk_index": index,
+                "total_chunks": None,
+                "metadata": chunk_metadata,
+                "created_at": created_at
+            }
+            index += 1
+
+    def create_chunks(self, text: str, source: str = "resume", metadata: Optional[Dict[str, Any]] = None, page_offsets: Optional[List[int]] = None, content_hash: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Split text into a list of chunk dictionaries.
+
+        Args:
+            text (str): Text to split
+            source (str): Source name stored in chunk metadata
+            metadata (Optional[Dict[str, Any]]): Extra metadata for every chunk
+            page_offsets (Optional[List[int]]): Start offset of each page
+            content_hash (Optional[str]): Content hash of the source file
+
+        Returns:
+            List[Dict[str, Any]]: Chunks with total_chunks filled in
+        """
+        chunks = list(self.iter_chunks(text, source, metadata, page_offsets, content_hash))
+        for chunk in chunks:
+            chunk["total_chunks"] = len(chunks)
+        return chunks
+
+    @staticmethod
+    def get_chunk_statistics(chunks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute chunk size statistics in a single pass.
+
+        Args:
+            chunks (Iterable[Dict[str, Any]]): Chunks (a list or a generator)
+
+        Returns:
+            Dict[str, Any]: total_chunks, avg/min/max chunk size in characters
+        """
+        count = total = 0
+        smallest = largest = None
+        for chunk in chunks:
+            size = len(chunk["content"])
+            count += 1
+            total += size
+            smallest = size if smallest is None else min(smallest, size)
+            largest = size if largest is None else max(largest, size)
+        return {
+            "total_chunks": count,
+            "avg_chunk_size": total / count if count else 0.0,
+            "min_chunk_size": smallest or 0,
+            "max_chunk_size": largest or 0
+        }
@@ -17,6 +17,7 @@ CORE_DEPS = [
     "chromadb>=0.3.29",
     "langchain>=0.1.9",
     "openai>=1.12.0",
+    "tiktoken>=0.6.0",
     "numpy>=1.24.3",
     "python-dotenv>=1.0.1",
     "tenacity>=8.2.3",
@@ -34,8 +35,7 @@ EXTRA_DEPS = {
         "python-docx>=1.1.0",
         "pdf2image>=1.17.0",
         "pytesseract>=0.3.10",
-        "PyMuPDF>=1.23.8",
-        "docx2txt>=0.8"
+        "PyMuPDF>=1.23.8"
     ],
     "speech": [
         "SpeechRecognition>=3.10.0",
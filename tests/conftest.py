@@ -20,9 +20,13 @@ def vector_store(temp_dir):
     return VectorStoreManager(db_path=db_path)
 
 @pytest.fixture
-def resume_processor(vector_store):
-    """Create a ResumeProcessor instance with the test vector store."""
-    return ResumeProcessor(vector_store)
+def resume_processor(vector_store, temp_dir):
+    """Create a ResumeProcessor instance with the test vector store and private caches."""
+    return ResumeProcessor(
+        vector_store,
+        cache_dir=os.path.join(temp_dir, "resume_cache"),
+        ocr_cache_dir=os.path.join(temp_dir, "ocr_cache")
+    )
 
 @pytest.fixture
 def interview_manager(vector_store):
@@ -1,6 +1,9 @@
 import pytest
 from ml.interview.interview_manager import InterviewManager
 from ml.interview.answer_evaluator import AnswerEvaluator
+from ml.interview.interview_session import InterviewSession
+from ml.interview.session_store import SessionStore
+from ml.rag.context_packer import ContextPacker
 
 def test_interview_manager_initialization(interview_manager):
     """Test InterviewManager initialization."""
@@ -120,4 +123,407 @@ def test_very_short_answer_evaluation(interview_manager, sample_question):
     assert "score" in result
     assert result["score"] < 0.5  # Should be low score
     assert "feedback" in result
-    assert len(result["feedback"]) > 0 
\ No newline at end of file
+    assert len(result["feedback"]) > 0 
+
+def test_generate_questions_concurrently_stops_at_count(interview_manager, monkeypatch):
+    """Test bounded concurrent generation with constraints passed to each request."""
+    import threading
+    import time
+    
+    monkeypatch.setattr(
+        interview_manager.vector_store,
+        "search",
+        lambda query, n_results=4, where=None: [{"document": f"chunk {i}"} for i in range(n_results)]
+    )
+    lock = threading.Lock()
+    calls = []
+    active = [0, 0]  # current, peak
+    
+    def fake_generate(chunk, category=None, difficulty=None):
+        with lock:
+            calls.append((chunk, category, difficulty))
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        if chunk == "chunk 1":
+            return None
+        return {"question": chunk, "expected_answer": "", "category": category, "difficulty": difficulty}
+    
+    monkeypatch.setattr(interview_manager, "_generate_question_from_chunk", fake_generate)
+    questions = interview_manager.generate_questions(
+        "resume",
+        categories=["Technical", "Problem Solving"],
+        difficulty="Advanced",
+        num_questions=4,
+        max_workers=2
+    )
+    
+    assert [q["question"] for q in questions] == ["chunk 0", "chunk 2", "chunk 3", "chunk 4"]
+    assert [q["category"] for q in questions] == ["Technical", "Technical", "Problem Solving", "Technical"]
+    assert all(difficulty == "Advanced" for _, _, difficulty in calls)
+    assert len(calls) == 5
+    assert active[1] <= 2
+
+def test_generate_questions_replaces_failed_generation(interview_manager, monkeypatch):
+    """Test that a chunk whose request fails is replaced by a spare chunk."""
+    import json
+    import types
+    
+    monkeypatch.setattr(
+        interview_manager.vector_store,
+        "search",
+        lambda query, n_results=4, where=None: [{"document": f"chunk {i}"} for i in range(n_results)]
+    )
+    
+    def create(messages, **kwargs):
+        chunk = messages[-1]["content"].split("resume:")[1].split()[:2]
+        if chunk == ["chunk", "1"]:
+            raise RuntimeError("API error")
+        message = types.SimpleNamespace(content=json.dumps({"question": " ".join(chunk)}))
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+    
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    monkeypatch.setattr(interview_manager, "client", client)
+    questions = interview_manager.generate_questions("resume", num_questions=2, max_workers=1)
+    
+    assert [q["question"] for q in questions] == ["chunk 0", "chunk 2"]
+
+def test_interview_session_round_trip_and_bounded_history():
+    """Test that session state serializes and keeps only recent turns."""
+    session = InterviewSession("Data Scientist", "Mid Level", skills=["Python", "SQL"], max_history_items=4)
+    for i in range(10):
+        session.add_turn("assistant", f"Question {i}?", "question")
+        session.add_turn("user", f"Answer {i}", "answer", score=i / 10)
+    
+    assert len(session.history) == 4
+    assert session.last_question == "Question 9?"
+    assert session.last_score == 0.9
+    
+    restored = InterviewSession.from_json(session.to_json())
+    assert restored.to_dict() == session.to_dict()
+    assert len(session.to_json()) < 2048
+
+def test_session_store_rehydrates_after_restart(temp_dir):
+    """Test that logged turns survive a new store on the same database."""
+    import os
+    
+    db_path = os.path.join(temp_dir, "sessions.db")
+    store = SessionStore(db_path)
+    session = InterviewSession("DevOps Engineer", "Senior Level", skills=["Kubernetes"], resume_hash="abc123", max_history_items=4)
+    for i in range(3):
+        question = session.add_turn("assistant", f"Question {i}?", "question")
+        answer = session.add_turn("user", f"Answer {i}", "answer", score=0.5)
+        store.append(session, [question, answer])
+    store.append(session, session.history)  # Replays are ignored
+    store.close()
+    
+    restored = SessionStore(db_path).load(session.session_id)
+    assert restored is not None
+    assert restored.to_dict() == session.to_dict()
+    
+    restored.add_turn("assistant", "Question 3?", "question")
+    assert restored.history[-1]["seq"] == 6
+    assert SessionStore(db_path).load("missing") is None
+
+def test_session_store_retries_failed_writes(temp_dir, monkeypatch):
+    """Test that a batch that fails to commit is reported and written later."""
+    import os
+    import sqlite3
+    
+    store = SessionStore(os.path.join(temp_dir, "sessions.db"), retry_interval=0.05)
+    write_batch = store._write_batch
+    failing = [True]
+    
+    def flaky_write_batch(conn, batch):
+        if failing[0]:
+            raise sqlite3.OperationalError("database is locked")
+        write_batch(conn, batch)
+    
+    monkeypatch.setattr(store, "_write_batch", flaky_write_batch)
+    session = InterviewSession("Data Scientist", "Mid Level")
+    store.append(session, [session.add_turn("assistant", "Question 0?", "question")])
+    assert store.flush() is False
+    assert isinstance(store.last_error, sqlite3.OperationalError)
+    
+    failing[0] = False
+    store.append(session, [session.add_turn("user", "Answer 0", "answer")])
+    assert store.flush() is True
+    assert store.last_error is None
+    assert store.load(session.session_id).to_dict() == session.to_dict()
+    store.close()
+
+def test_get_response_falls_back_when_stages_exceed_budget(interview_manager, monkeypatch):
+    """Test that slow stages are bounded by their budgets and fall back by tier."""
+    import time
+    
+    def slow(result):
+        def call(*args, **kwargs):
+            time.sleep(0.5)
+            return result
+        return call
+    
+    interview_manager.stage_budgets.update(embedding=0.05, retrieval=0.05, generation=0.05)
+    monkeypatch.setattr(interview_manager.answer_evaluator, "evaluate_answer", slow((0.9, True)))
+    monkeypatch.setattr(interview_manager.vector_store, "search", slow([]))
+    monkeypatch.setattr(interview_manager, "_generate_next_question", slow("Late question?"))
+    
+    session = InterviewSession("Software Engineer", "Mid Level", skills=["Kafka"])
+    session.add_turn("assistant", "Tell me about yourself.", "question")
+    
+    start = time.perf_counter()
+    response = interview_manager.get_response(session, "I build data pipelines.")
+    assert time.perf_counter() - start < 0.4
+    assert "Kafka" in response
+    assert session.last_score is None
+    
+    # The late generation is kept and served on the next slow turn, but only to this session
+    time.sleep(0.6)
+    other = InterviewSession("Software Engineer", "Mid Level", skills=["Kafka"])
+    assert interview_manager._fallback_question(other)[1] == "template"
+    response = interview_manager.get_response(session, "Mostly with Kafka.")
+    assert "Late question?" in response
+    
+    metrics = interview_manager.metrics.snapshot()
+    assert metrics["tiers"] == {"generated": 0, "cached": 1, "template": 1}
+    assert metrics["stages"]["generation"]["timeout"] == 2
+    assert metrics["stages"]["turn"]["ok"] == 2
+
+def test_failed_turn_is_recorded_as_an_error(interview_manager, monkeypatch):
+    """Test that a turn answered with the apology counts as an error."""
+    def fail(*args, **kwargs):
+        raise RuntimeError("generation failed")
+    
+    monkeypatch.setattr(interview_manager, "_next_question", fail)
+    session = InterviewSession("Software Engineer", "Mid Level")
+    assert interview_manager.get_response(session, "Hello.").startswith("I apologize")
+    
+    turn = interview_manager.metrics.snapshot()["stages"]["turn"]
+    assert turn["error"] == 1
+    assert turn["ok"] == 0
+
+def test_within_budget_cancels_and_bounds_abandoned_calls(interview_manager, monkeypatch):
+    """Test that timed-out calls are cancelled if queued and skipped once too many still run."""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    import ml.interview.interview_manager as interview_module
+    
+    monkeypatch.setattr(interview_module, "MAX_ABANDONED_STAGE_CALLS", 2)
+    monkeypatch.setattr(interview_manager, "_stage_pool", ThreadPoolExecutor(max_workers=1))
+    ran = []
+    
+    def slow(name):
+        ran.append(name)
+        time.sleep(0.3)
+        return name
+    
+    assert interview_manager._within_budget("embedding", slow, "first", budget=0.05) is None
+    # Queued behind the first call, so it is cancelled before it starts
+    assert interview_manager._within_budget("embedding", slow, "queued", budget=0.05) is None
+    # The first call is still running past its deadline, so this stage is skipped
+    monkeypatch.setattr(interview_module, "MAX_ABANDONED_STAGE_CALLS", 1)
+    assert interview_manager._within_budget("embedding", slow, "skipped", budget=1.0) is None
+    
+    time.sleep(0.4)
+    assert ran == ["first"]
+    assert interview_manager._abandoned_calls == 0
+    assert interview_manager._within_budget("embedding", slow, "again", budget=1.0) == "again"
+    assert interview_manager.metrics.snapshot()["events"]["stage_pool_saturated"] == 1
+
+def test_follow_up_embeddings_use_the_embedding_budget(interview_manager, monkeypatch):
+    """Test that embedding for the follow-up cache doesn't eat into the generation budget."""
+    import time
+    import types
+    
+    def slow_embedding(text):
+        time.sleep(0.5)
+        return [1.0, 0.0]
+    
+    message = types.SimpleNamespace(content="What would you change?")
+    create = lambda **kwargs: types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+    evaluator = interview_manager.answer_evaluator
+    monkeypatch.setattr(evaluator, "get_embedding", slow_embedding)
+    monkeypatch.setattr(evaluator, "client", types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))))
+    interview_manager.stage_budgets.update(embedding=0.05, generation=0.3)
+    
+    session = InterviewSession("Software Engineer", "Mid Level")
+    assert interview_manager._follow_up_question(session, "How do you shard?", "By key.") == "What would you change?"
+    
+    stages = interview_manager.metrics.snapshot()["stages"]
+    assert stages["embedding"]["timeout"] == 2
+    assert stages["generation"]["ok"] == 1
+
+def test_retrieve_context_is_limited_to_the_session_resume(interview_manager, monkeypatch):
+    """Test that resume context is only searched within the session's resume."""
+    searches = []
+    
+    def search(query, n_results=4, where=None):
+        searches.append(where)
+        return [{"content": "Ran Kafka clusters.", "score": 0.9}]
+    
+    monkeypatch.setattr(interview_manager.vector_store, "search", search)
+    
+    session = InterviewSession("Software Engineer", "Mid Level", resume_hash="abc123")
+    assert "Kafka" in interview_manager._retrieve_context("streaming", session)
+    assert searches == [{"content_hash": "abc123"}]
+    
+    # Without a resume there is nothing of the candidate's to search
+    assert interview_manager._retrieve_context("streaming", InterviewSession("Software Engineer", "Mid Level")) == ""
+    assert len(searches) == 1
+
+def test_cassette_records_and_replays_offline(temp_dir):
+    """Test that recorded calls replay in order without the real backend."""
+    import os
+    from ml.interview.cassette import Cassette, CassetteEmbeddings, CassetteMissError
+    
+    class CountingEmbeddings:
+        model = "text-embedding-3-small"
+        calls = 0
+        
+        def embed_query(self, text):
+            self.calls += 1
+            return [float(len(text)), 0.5]
+        
+        def embed_documents(self, texts):
+            self.calls += 1
+            return [[float(len(text)), 0.5] for text in texts]
+    
+    path = os.path.join(temp_dir, "cassette.jsonl")
+    real = CountingEmbeddings()
+    recorder = CassetteEmbeddings(Cassette(path, mode="record"), real)
+    assert recorder.embed_query("Kafka") == [5.0, 0.5]
+    assert recorder.embed_documents(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    
+    cassette = Cassette(path, mode="auto")
+    answers = iter(["first", "second"])
+    for _ in range(2):
+        cassette.call("chat", {"messages": [{"content": "  Tell me\n about   Kafka"}]}, lambda: {"text": next(answers)})
+    
+    replay = Cassette(path, mode="replay")
+    replayed = CassetteEmbeddings(replay, model="text-embedding-3-small")
+    assert replayed.embed_query("Kafka") == [5.0, 0.5]
+    assert replayed.embed_documents(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    # Whitespace is normalized; repeats replay in order, then repeat the last
+    texts = [replay.call("chat", {"messages": [{"content": "Tell me about Kafka"}], "timeout": 5}, None)["text"] for _ in range(3)]
+    assert texts == ["first", "second", "second"]
+    with pytest.raises(CassetteMissError):
+        replayed.embed_query("Go")
+    assert real.calls == 2
+
+def test_follow_up_cache_threshold_ttl_and_size(monkeypatch):
+    """Test that the follow-up cache serves close pairs only, expires and stays bounded."""
+    import time
+    import numpy as np
+    from ml.interview.follow_up_cache import FollowUpCache
+    
+    rng = np.random.default_rng(0)
+    question, answer, other = (rng.normal(size=64).tolist() for _ in range(3))
+    near_answer = (np.array(answer) + rng.normal(scale=0.05, size=64)).tolist()
+    
+    cache = FollowUpCache(threshold=0.95, ttl_seconds=60, max_items=3)
+    cache.put(question, answer, "Which consistency guarantees did you need?")
+    assert cache.get(question, near_answer) == "Which consistency guarantees did you need?"
+    assert cache.get(question, other) is None
+    assert cache.get(other, answer) is None
+    
+    for i in range(5):
+        cache.put(rng.normal(size=64).tolist(), rng.normal(size=64).tolist(), f"Follow-up {i}")
+    stats = cache.stats()
+    assert stats["size"] == 3
+    assert stats["evictions"] == 3
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.stats()["size"] == 0
+
+def test_cached_follow_ups_are_shared_across_resumes(interview_manager, monkeypatch):
+    """Test that cached follow-ups are generated without resume context and reused for any resume."""
+    import types
+    
+    generated = []
+    
+    def create(**kwargs):
+        generated.append(kwargs)
+        message = types.SimpleNamespace(content=f"Follow-up {len(generated)}?")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+    
+    evaluator = interview_manager.answer_evaluator
+    monkeypatch.setattr(evaluator, "get_embedding", lambda text: [1.0, float(len(text))])
+    monkeypatch.setattr(evaluator, "client", types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))))
+    
+    ask = lambda **kwargs: evaluator.generate_follow_up("How do you shard?", "By key.", **kwargs)
+    assert ask(context="Ran Kafka.", resume_hash="a") == "Follow-up 1?"
+    assert ask(context="Ran Postgres.", resume_hash="b") == "Follow-up 1?"
+    assert ask(context="Ran Redis.") == "Follow-up 1?"
+    assert len(generated) == 1
+    # Neither candidate's resume reached the shared follow-up
+    assert "Ran Kafka." not in generated[0]["messages"][1]["content"]
+    
+    # Without embeddings there is no cache, and the resume grounds the follow-up
+    monkeypatch.setattr(evaluator, "get_embedding", lambda text: None)
+    assert ask(context="Ran Postgres.", resume_hash="b") == "Follow-up 2?"
+    assert "Ran Postgres." in generated[1]["messages"][1]["content"]
+
+def test_next_question_regenerates_paraphrases(interview_manager, monkeypatch):
+    """Test that paraphrases of asked questions are regenerated using scoring embeddings."""
+    import types
+    
+    first = "How would you shard a relational database?"
+    paraphrase = "How would you go about sharding a relational database?"
+    fresh = "How do you debug a memory leak in production?"
+    answer = "By key ranges, with a lookup service for routing."
+    vectors = {first: [1.0, 0.0, 0.0], paraphrase: [0.99, 0.1, 0.0], fresh: [0.0, 1.0, 0.0], answer: [0.9, 0.0, 0.3]}
+    embedded = []
+    
+    def create(model, input):
+        embedded.append(input)
+        return types.SimpleNamespace(data=[types.SimpleNamespace(embedding=vectors[input])])
+    
+    candidates = iter([paraphrase, fresh])
+    avoided = []
+    
+    def generate(context, relevant_context="", avoid=()):
+        avoided.append(list(avoid))
+        return next(candidates)
+    
+    monkeypatch.setattr(interview_manager.answer_evaluator, "client", types.SimpleNamespace(embeddings=types.SimpleNamespace(create=create)))
+    monkeypatch.setattr(interview_manager.vector_store, "search", lambda query, n_results=3: [])
+    monkeypatch.setattr(interview_manager, "_generate_next_question", generate)
+    
+    session = InterviewSession("Software Engineer", "Senior Level")
+    session.add_turn("assistant", first, "question")
+    response = interview_manager.get_response(session, answer)
+    
+    assert response.endswith(fresh)
+    assert avoided == [[], [paraphrase, first]]
+    assert interview_manager.metrics.snapshot()["events"]["duplicate_question"] == 1
+    # Each text is embedded once; scoring the next answer reuses the new question's embedding
+    assert sorted(embedded) == sorted([answer, first, paraphrase, fresh])
+    assert interview_manager.answer_evaluator.cached_embedding(fresh) == vectors[fresh]
+
+def test_context_packer_ranks_and_fits_budget():
+    """Test that retrieved chunks are ranked, deduplicated and cut to the token budget."""
+    packer = ContextPacker(max_tokens=40, min_chunk_tokens=5)
+    best = "Led the migration of a monolith to Kubernetes services."
+    filler = " ".join(["Maintained internal tooling for the data platform team."] * 10)
+    results = [
+        {"content": filler, "score": 0.4},
+        {"content": best, "score": 0.9},
+        {"content": best, "score": 0.8},
+        {"content": "Unrelated hobby section.", "score": 0.1}
+    ]
+    
+    context, report = packer.pack(results)
+    
+    assert context.startswith(best)
+    assert context.count(best) == 1
+    assert packer.count_tokens(context) <= 40
+    assert report["packed_chunks"] == 2
+    assert report["tokens_packed"] <= 40
+    assert report["tokens_in"] == sum(packer.count_tokens(r["content"]) for r in results[:2] + results[3:])
+    assert report["tokens_saved"] == report["tokens_in"] - report["tokens_packed"] > 0
+    # A chunk that fits is left as is
+    assert packer.pack(results[1:2])[0] == best
+    assert packer.pack([])[0] == ""
@@ -115,4 +115,279 @@ def test_check_invalid_answer(mcq_manager):
     
     result = mcq_manager.check_answer(question, "Invalid Option")
     assert result["is_correct"] is False
-    assert "explanation" in result 
\ No newline at end of file
+    assert "explanation" in result
+
+def _write_bank(path, questions):
+    import json
+    with open(path, "w") as f:
+        json.dump({"swe": {"name": "Software Engineer", "questions": questions}}, f)
+
+def test_catalog_shared_and_hot_reloaded(temp_dir):
+    """Test that the MCQ catalog is shared per file and reloads on change."""
+    import os
+    from ml.mcq.mcq_catalog import get_catalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    question = {"id": "q1", "question": "Q?", "options": ["A", "B"], "correct_answer": 0, "explanation": "E"}
+    _write_bank(path, [question])
+    
+    catalog = get_catalog(path)
+    assert get_catalog(path) is catalog
+    assert MCQManager(path).catalog is MCQManager(path).catalog
+    assert catalog.get_question("q1")["question"] == "Q?"
+    assert catalog.get_questions_by_role("Software Engineer") == catalog.get_questions_by_role("swe")
+    
+    _write_bank(path, [question, dict(question, id="q2")])
+    os.utime(path, (0, 12345))
+    assert catalog.reload() is True
+    assert len(catalog.questions) == 2
+    assert catalog.get_available_roles() == [{"id": "swe", "name": "Software Engineer"}]
+
+def test_catalog_does_not_retry_failed_seeding_on_every_access(temp_dir):
+    """Test that a failed vector store seeding is remembered until the bank changes."""
+    import os
+    import types
+    from ml.mcq.mcq_catalog import MCQCatalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    question = {"id": "q1", "question": "Q?", "options": ["A", "B"], "correct_answer": 0, "explanation": "E"}
+    _write_bank(path, [question])
+    catalog = MCQCatalog(path)
+    attempts = []
+    catalog._vector_store = types.SimpleNamespace(add_mcqs=lambda mcqs: attempts.append(mcqs) and False)
+    
+    catalog.vector_store
+    catalog.vector_store
+    assert len(attempts) == 1
+    
+    _write_bank(path, [question, dict(question, id="q2")])
+    os.utime(path, (0, 12345))
+    catalog.reload()
+    catalog.vector_store
+    assert len(attempts) == 2
+
+def test_role_query_embeddings_are_precomputed(temp_dir, monkeypatch):
+    """Test that role prompts are embedded once and reused from the store."""
+    vector_store = MCQVectorStore(collection_name="role_embedding_test", db_path=temp_dir)
+    calls = []
+    
+    def fake_embedding_function(texts):
+        calls.append(list(texts))
+        return [[float(i), 1.0, 0.0] for i in range(len(texts))]
+    
+    monkeypatch.setattr(vector_store, "embedding_function", fake_embedding_function)
+    assert vector_store.seed_role_embeddings(["swe", "ds"]) is True
+    assert len(calls) == 1
+    
+    # A fresh store reads the stored vectors instead of embedding again
+    vector_store._role_embeddings.clear()
+    assert vector_store.seed_role_embeddings(["swe", "ds"]) is True
+    assert len(calls) == 1
+    assert set(vector_store._role_embeddings) == {"swe", "ds"}
+
+def test_adaptive_selector_converges_on_user_level():
+    """Test that the adaptive selector tracks ability and prefers matching questions."""
+    import numpy as np
+    from ml.mcq.adaptive_selector import AdaptiveSelector
+    
+    question_ids = [f"q{i}" for i in range(2000)]
+    selector = AdaptiveSelector(question_ids, {"swe": question_ids}, seed=0)
+    selector.difficulty[:] = np.linspace(-3, 3, len(question_ids))
+    
+    # A strong user answers everything below difficulty 1.5 correctly
+    asked = []
+    for _ in range(30):
+        question_id = selector.select("alice", 1, role_id="swe", exclude_ids=asked)[0]
+        asked.append(question_id)
+        selector.update("alice", question_id, selector.get_difficulty(question_id) < 1.5)
+    
+    assert selector.get_ability("alice") > 0.75
+    assert abs(selector.get_difficulty(asked[-1]) - selector.get_ability("alice")) < 1.0
+
+def test_adaptive_selector_bounds_users_and_rejects_unknown_roles(mcq_manager):
+    """Test that user abilities are capped and an unknown role yields no questions."""
+    from ml.mcq.adaptive_selector import AdaptiveSelector
+    
+    selector = AdaptiveSelector(["q1", "q2"], {"swe": ["q1", "q2"]}, max_users=2)
+    selector.update("alice", "q1", True)
+    selector.update("bob", "q1", False)
+    selector.update("alice", "q2", True)
+    selector.update("carol", "q2", True)
+    
+    # bob was the least recently updated and is forgotten
+    assert selector.get_ability("bob") == 0.0
+    assert selector.get_ability("alice") > 0.0
+    assert len(selector.ability) == 2
+    
+    assert mcq_manager.get_adaptive_questions("No Such Role", "alice") == []
+
+def test_find_duplicate_clusters():
+    """Test lexical and embedding-based near-duplicate detection."""
+    from ml.mcq.mcq_dedup import find_duplicate_clusters, remove_duplicates, similar_pairs
+    import numpy as np
+    
+    def q(question_id, text):
+        return {"id": question_id, "question": text, "options": ["A", "B"], "correct_answer": 0, "explanation": ""}
+    
+    bank = {"swe": {"name": "Software Engineer", "questions": [
+        q("q1", "What is the time complexity of binary search on a sorted array?"),
+        q("q2", "What is the time complexity of binary search on a sorted array ?"),
+        q("q3", "How fast is binary search over sorted data?"),
+        q("q4", "What does the CAP theorem state?"),
+    ]}}
+    
+    assert find_duplicate_clusters(bank) == [["q1", "q2"]]
+    
+    # Pretend q3 is a paraphrase of q1
+    def fake_embed(texts):
+        return [[1.0, 0.0] if "binary search" in t else [0.0, 1.0] for t in texts]
+    
+    clusters = find_duplicate_clusters(bank, embed_fn=fake_embed, block_size=1)
+    assert clusters == [["q1", "q2", "q3"]]
+    assert [x["id"] for x in remove_duplicates(bank, clusters)["swe"]["questions"]] == ["q1", "q4"]
+    
+    # Tiled search matches the full similarity matrix
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(50, 8)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    full = np.triu(embeddings @ embeddings.T, k=1)
+    expected = set(zip(*np.nonzero(full >= 0.6)))
+    assert {(i, j) for i, j, _ in similar_pairs(embeddings, 0.6, block_size=7)} == expected
+
+def test_grade_quiz_updates_aggregate_statistics(temp_dir):
+    """Test whole-quiz grading and incremental per-question/per-role statistics."""
+    import os
+    from ml.mcq.mcq_catalog import MCQCatalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    questions = [
+        {"id": f"q{i}", "question": f"Q{i}?", "options": ["A", "B", "C"], "correct_answer": i % 3,
+         "explanation": "E", "topic": "Algorithms" if i < 2 else "Databases"}
+        for i in range(4)
+    ]
+    _write_bank(path, questions)
+    manager = MCQManager(catalog=MCQCatalog(path), progress_db=os.path.join(temp_dir, "progress.db"))
+    
+    result = manager.grade_quiz(questions, [0, "B", None, 1], role_id="swe", user_id="alice")
+    assert result["correct_count"] == 2
+    assert result["score"] == 0.5
+    assert [r["is_correct"] for r in result["questions"]] == [True, True, False, False]
+    assert result["topics"]["Algorithms"] == {"correct": 2, "total": 2, "score": 1.0}
+    assert result["topics"]["Databases"]["correct"] == 0
+    
+    manager.grade_quiz(questions, [0, 0, 2, 0], role_id="swe")
+    stats = manager.get_question_statistics(["q0", "q1"])
+    assert stats["q0"] == {"attempts": 2, "correct": 2, "correct_rate": 1.0}
+    assert stats["q1"]["correct_rate"] == 0.5
+    role_stats = manager.get_role_statistics("swe")["swe"]
+    assert role_stats["submissions"] == 2
+    assert role_stats["average_score"] == 0.625
+
+def test_grade_quiz_credits_question_roles_and_flags_unparseable_answers(temp_dir):
+    """Test that review quizzes are credited per question role and bad keys yield no correct option."""
+    import json
+    import os
+    from ml.mcq.mcq_catalog import MCQCatalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    question = {"id": "q1", "question": "Q?", "options": ["A", "B"], "correct_answer": 0, "explanation": "E"}
+    broken = dict(question, id="q2", correct_answer="Z")
+    with open(path, "w") as f:
+        json.dump({"swe": {"name": "Software Engineer", "questions": [question]},
+                   "ds": {"name": "Data Scientist", "questions": [broken]}}, f)
+    manager = MCQManager(catalog=MCQCatalog(path), progress_db=os.path.join(temp_dir, "progress.db"))
+    
+    result = manager.grade_quiz([question, broken], [0, 1], role_id="swe")
+    assert result["questions"][0]["correct_option"] == 0
+    assert result["questions"][1]["correct_option"] is None
+    assert result["questions"][1]["is_correct"] is False
+    assert set(manager.get_role_statistics()) == {"swe", "ds"}
+    assert manager.get_role_statistics("ds")["ds"]["submissions"] == 1
+
+def test_random_questions_do_not_repeat_until_role_exhausted(temp_dir):
+    """Test non-repeating sampling with persisted per-user seen bitmaps."""
+    import os
+    from ml.mcq.mcq_catalog import MCQCatalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    db_path = os.path.join(temp_dir, "progress.db")
+    _write_bank(path, [
+        {"id": f"q{i}", "question": f"Q{i}?", "options": ["A", "B"], "correct_answer": 0, "explanation": ""}
+        for i in range(10)
+    ])
+    catalog = MCQCatalog(path)
+    manager = MCQManager(catalog=catalog, progress_db=db_path)
+    
+    first = [q["id"] for q in manager.get_random_questions(4, role_id="swe", user_id="alice")]
+    second = [q["id"] for q in manager.get_random_questions(4, role_id="swe", user_id="alice")]
+    assert len(set(first + second)) == 8
+    
+    # Seen state survives a new manager (i.e. a new session)
+    manager = MCQManager(catalog=catalog, progress_db=db_path)
+    third = [q["id"] for q in manager.get_random_questions(4, role_id="swe", user_id="alice")]
+    assert len(third) == 4
+    assert len(set(first + second + third)) == 10
+    # The role was reset; everything served in the new cycle counts as seen
+    ordinals = manager.seen.ordinals("swe", [f"q{i}" for i in range(10)])
+    assert manager.seen.seen_count("alice", "swe", ordinals) == 4
+    
+    # Other users are unaffected
+    assert manager.seen.seen_count("bob", "swe", ordinals) == 0
+
+def test_seen_questions_follow_ids_across_bank_edits_and_sessions(temp_dir):
+    """Test that seen state survives questions moving in the bank and is shared by sessions."""
+    import os
+    from ml.mcq.mcq_catalog import MCQCatalog
+    
+    path = os.path.join(temp_dir, "mcqs.json")
+    db_path = os.path.join(temp_dir, "progress.db")
+    question = lambda i: {"id": f"q{i}", "question": f"Q{i}?", "options": ["A", "B"], "correct_answer": 0, "explanation": ""}
+    _write_bank(path, [question(i) for i in range(10)])
+    catalog = MCQCatalog(path)
+    tab_a = MCQManager(catalog=catalog, progress_db=db_path)
+    tab_b = MCQManager(catalog=catalog, progress_db=db_path)
+    
+    first = [q["id"] for q in tab_a.get_random_questions(3, role_id="swe", user_id="alice")]
+    second = [q["id"] for q in tab_b.get_random_questions(3, role_id="swe", user_id="alice")]
+    assert len(set(first + second)) == 6
+    
+    # Insert a question at the front and remove one from the middle
+    _write_bank(path, [question(10)] + [question(i) for i in range(10) if i != 5])
+    catalog.reload(force=True)
+    unseen = {f"q{i}" for i in range(11) if i != 5} - set(first + second)
+    rest = [q["id"] for q in tab_a.get_random_questions(len(unseen), role_id="swe", user_id="alice")]
+    assert set(rest) == unseen
+
+def test_review_scheduler_resurfaces_missed_questions(temp_dir):
+    """Test SM-2 scheduling of missed questions and the due queue."""
+    import os
+    from ml.mcq.review_scheduler import ReviewScheduler, DAY_SECONDS, get_review_scheduler
+    
+    db_path = os.path.join(temp_dir, "progress.db")
+    scheduler = ReviewScheduler(db_path)
+    # Sessions share one in-memory queue per database
+    assert get_review_scheduler(db_path) is get_review_scheduler(db_path)
+    now = 1_000_000.0
+    
+    scheduler.record_answers("alice", ["q1", "q2", "q3"], [False, True, False], now=now)
+    assert scheduler.get_due("alice", 5, now=now) == []
+    assert scheduler.next_due_at("alice") == now + DAY_SECONDS
+    assert scheduler.next_due_at("bob") is None
+    assert scheduler.get_due("alice", 5, now=now + DAY_SECONDS) == ["q1", "q3"]
+    assert scheduler.get_due("alice", 1, now=now + DAY_SECONDS) == ["q1"]
+    
+    # A correct review pushes the item out; the queue survives a restart
+    scheduler.record_answers("alice", ["q1"], [True], now=now + DAY_SECONDS)
+    scheduler = ReviewScheduler(db_path)
+    assert scheduler.get_due("alice", 5, now=now + DAY_SECONDS) == ["q3"]
+    assert scheduler.get_due("alice", 5, now=now + 3 * DAY_SECONDS) == ["q3", "q1"]
+    assert scheduler.get_due("bob", 5, now=now + 3 * DAY_SECONDS) == []
+    
+    # Questions that left the bank are deleted rather than taking due slots
+    later = now + 10 * DAY_SECONDS
+    scheduler.record_answers("alice", ["q4", "q5"], [False, False], now=later)
+    assert scheduler.get_due("alice", 5, now=later + DAY_SECONDS, known_ids={"q1", "q3"}) == ["q3", "q1"]
+    assert ReviewScheduler(db_path).get_due("alice", 5, now=later + DAY_SECONDS) == ["q3", "q1"]
+    scheduler.record_answers("alice", ["q6"], [False], now=now - DAY_SECONDS)
+    assert scheduler.next_due_at("alice", known_ids={"q1", "q3"}) == now + DAY_SECONDS
+    assert ReviewScheduler(db_path).next_due_at("alice") == now + DAY_SECONDS
@@ -81,4 +81,355 @@ def test_resume_with_minimal_content(resume_processor):
     assert result["status"] == "success"
     assert len(result["chunks"]) > 0
     assert len(result["metadata"]["skills"]) == 0
-    assert len(result["metadata"]["experience"]) == 0 
\ No newline at end of file
+    assert len(result["metadata"]["experience"]) == 0 
+
+def test_text_processor_chunks(sample_resume_text):
+    """Test chunk sizes, overlap, stable IDs and statistics."""
+    from ml.resume_parser.text_processor import TextProcessor
+    
+    processor = TextProcessor(chunk_size=120, chunk_overlap=30)
+    chunks = processor.create_chunks(sample_resume_text * 3)
+    
+    assert len(chunks) > 1
+    assert all(len(chunk["content"]) <= 120 for chunk in chunks)
+    assert all(chunk["total_chunks"] == len(chunks) for chunk in chunks)
+    assert len({chunk["id"] for chunk in chunks}) == len(chunks)
+    assert [c["id"] for c in processor.create_chunks(sample_resume_text * 3)] == [c["id"] for c in chunks]
+    
+    spans = list(processor.iter_spans(sample_resume_text * 3))
+    assert all(next_start < end for (_, end), (next_start, _) in zip(spans, spans[1:]))
+    
+    stats = processor.get_chunk_statistics(processor.iter_chunks(sample_resume_text * 3))
+    assert stats["total_chunks"] == len(chunks)
+    assert stats["max_chunk_size"] <= 120
+
+def test_text_processor_avoids_tiny_chunks():
+    """Test that an early boundary doesn't produce a chunk of a few characters."""
+    from ml.resume_parser.text_processor import TextProcessor
+    
+    processor = TextProcessor(chunk_size=40, chunk_overlap=0)
+    text = "Hi. " + "distributed systems engineering " * 10
+    spans = list(processor.iter_spans(text))
+    
+    assert spans[0][1] - spans[0][0] >= 20
+    assert all(end - start >= 20 for start, end in spans[:-1])
+    assert all(end - start <= 40 for start, end in spans)
+    assert spans[-1][1] == len(text)
+
+def test_text_processor_token_chunks(sample_resume_text):
+    """Test chunking by token count."""
+    import re
+    from ml.resume_parser.text_processor import TextProcessor
+    
+    processor = TextProcessor(chunk_size=20, chunk_overlap=5, unit="tokens")
+    chunks = processor.create_chunks(sample_resume_text)
+    assert len(chunks) > 1
+    assert all(len(re.findall(r"\w+|[^\w\s]", chunk["content"])) <= 20 for chunk in chunks)
+
+@pytest.mark.slow
+def test_text_processor_scales_linearly():
+    """Benchmark chunking on multi-megabyte input."""
+    import time
+    from ml.resume_parser.text_processor import TextProcessor
+    
+    paragraph = "Led development of microservices. Implemented CI/CD pipelines for 12 teams.\n"
+    text = ("EXPERIENCE\n" + paragraph * 20 + "\n") * 2000  # ~3.3 MB
+    processor = TextProcessor()
+    
+    start = time.perf_counter()
+    stats = processor.get_chunk_statistics(processor.iter_chunks(text[:len(text) // 4]))
+    quarter = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    stats = processor.get_chunk_statistics(processor.iter_chunks(text))
+    full = time.perf_counter() - start
+    
+    assert stats["max_chunk_size"] <= processor.chunk_size
+    assert full < 8 * quarter + 0.05
+
+def test_text_processor_page_metadata():
+    """Test that chunks record the pages they span."""
+    from ml.resume_parser.text_processor import TextProcessor
+    
+    pages = ["Page one. " * 20, "Page two. " * 20, "Page three. " * 20]
+    text = "\n\n".join(pages)
+    offsets = [0, len(pages[0]) + 2, len(pages[0]) + len(pages[1]) + 4]
+    
+    chunks = TextProcessor(chunk_size=150, chunk_overlap=20).create_chunks(text, page_offsets=offsets)
+    assert chunks[0]["metadata"]["page"] == 1
+    assert chunks[-1]["metadata"]["page_end"] == 3
+    words = ["one", "two", "three"]
+    for chunk in chunks:
+        first, last = chunk["metadata"]["page"], chunk["metadata"]["page_end"]
+        assert first <= last
+        assert f"Page {words[first - 1]}" in chunk["content"]
+        assert f"Page {words[last - 1]}" in chunk["content"]
+
+def test_extract_pages_from_pdf_in_parallel():
+    """Test that parallel extraction keeps pages in order."""
+    fitz = pytest.importorskip("fitz")
+    from ml.resume_parser.resume_processor import ResumeProcessor
+    
+    pdf_document = fitz.open()
+    for i in range(6):
+        pdf_document.new_page().insert_text((72, 72), f"Page {i + 1} experience")
+    content = pdf_document.tobytes()
+    pdf_document.close()
+    
+    serial = ResumeProcessor.extract_pages_from_pdf(content, parallel_threshold=100)
+    parallel = ResumeProcessor.extract_pages_from_pdf(content, parallel_threshold=2)
+    assert serial == parallel
+    assert [page.split()[1] for page in parallel] == ["1", "2", "3", "4", "5", "6"]
+    
+    text, offsets = ResumeProcessor.join_pages(parallel)
+    assert all(text.startswith(page, offset) for page, offset in zip(parallel, offsets))
+
+def test_clean_text_preserves_structure():
+    """Test that cleaning keeps paragraph breaks and non-ASCII letters."""
+    from ml.resume_parser.resume_processor import ResumeProcessor
+    
+    text = "  EXPERIENCE \r\n\r\n • Led  ﬁnance\tteam in Zürich ★ (2019–2021)\n  C++ / C# developer  "
+    assert ResumeProcessor.clean_text(text) == (
+        "EXPERIENCE\n\nLed finance team in Zürich (2019-2021)\nC++ / C# developer"
+    )
+    assert ResumeProcessor.clean_text("Acme Corp \u2022 2019 \u2013 2021") == "Acme Corp 2019 - 2021"
+    assert ResumeProcessor.clean_text("plain  ascii\t* text") == "plain ascii text"
+
+def test_resume_cache_round_trip(temp_dir):
+    """Test that processed results are keyed by content and survive restarts."""
+    from ml.resume_parser.resume_cache import ResumeCache
+    
+    cache = ResumeCache(os.path.join(temp_dir, "cache"), max_memory_items=1)
+    key = cache.content_key(b"%PDF resume bytes", "pdf", 1000, 200)
+    assert key == cache.content_key(b"%PDF resume bytes", "pdf", 1000, 200)
+    assert key != cache.content_key(b"%PDF resume bytes", "pdf", 500, 100)
+    assert cache.get(key) is None
+    
+    result = {"success": True, "chunks": [{"id": "abc", "content": "Python"}]}
+    cache.put(key, result)
+    cache.put("other", {"success": True})
+    assert cache.get(key) == result
+    assert ResumeCache(os.path.join(temp_dir, "cache")).get(key) == result
+
+def test_cached_resume_is_added_to_a_new_store(temp_dir):
+    """Test that a cache hit still fills a store lacking the chunks, and hands out copies."""
+    docx = pytest.importorskip("docx")
+    import io
+    from ml.resume_parser.resume_processor import ResumeProcessor
+    
+    class RecordingStore:
+        def __init__(self):
+            self.chunks = {}
+        
+        def missing_ids(self, ids):
+            return [chunk_id for chunk_id in ids if chunk_id not in self.chunks]
+        
+        def add_documents(self, chunks, embeddings=None, batch_size=5000):
+            self.chunks.update((chunk["id"], chunk) for chunk in chunks)
+    
+    document = docx.Document()
+    document.add_paragraph("EXPERIENCE\n\nBuilt data pipelines in Python. " * 40)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    cache_dir = os.path.join(temp_dir, "cache")
+    
+    first = RecordingStore()
+    result = ResumeProcessor(first, cache_dir=cache_dir).process_resume(buffer.getvalue(), "docx")
+    assert result["cached"] is False
+    result["chunks"].clear()
+    
+    second = RecordingStore()
+    processor = ResumeProcessor(second, cache_dir=cache_dir)
+    cached = processor.process_resume(buffer.getvalue(), "docx")
+    assert cached["cached"] is True
+    assert cached["chunks"]
+    assert set(second.chunks) == set(first.chunks)
+    
+    # Nothing is re-added once the store has the chunks
+    second.add_documents = lambda chunks, **kwargs: pytest.fail("chunks added twice")
+    assert processor.process_resume(buffer.getvalue(), "docx")["vector_store_status"] == "success"
+
+def test_bulk_ingest_is_resumable(temp_dir):
+    """Test directory ingestion and skipping files recorded in the manifest."""
+    docx = pytest.importorskip("docx")
+    from ml.resume_parser.bulk_ingest import ingest_directory
+    
+    class RecordingStore:
+        def __init__(self):
+            self.chunks = []
+        
+        def embed_chunks(self, chunks):
+            return [[float(len(chunk["content"]))] for chunk in chunks]
+        
+        def add_documents(self, chunks, embeddings=None, batch_size=5000):
+            assert len(embeddings) == len(chunks)
+            self.chunks.extend(chunks)
+    
+    resumes = os.path.join(temp_dir, "resumes")
+    os.makedirs(resumes)
+    for name in ("alice", "bob", "carol"):
+        document = docx.Document()
+        document.add_paragraph(f"{name.upper()}\n\nEXPERIENCE\n\nBuilt data pipelines in Python. " * 20)
+        document.save(os.path.join(resumes, f"{name}.docx"))
+    
+    store = RecordingStore()
+    stats = ingest_directory(resumes, store, workers=2, embed_batch_size=5, ocr_cache_dir=os.path.join(temp_dir, "ocr_cache"))
+    assert stats["files"] == 3
+    assert stats["failed"] == 0
+    assert {chunk["metadata"]["source"] for chunk in store.chunks} == {"alice.docx", "bob.docx", "carol.docx"}
+    
+    stats = ingest_directory(resumes, RecordingStore(), workers=2, ocr_cache_dir=None)
+    assert stats["files"] == 0
+    assert stats["skipped"] == 3
+
+def test_bulk_ingest_keeps_shared_sections_per_file(temp_dir):
+    """Test that the same section in two resumes is stored once per file."""
+    docx = pytest.importorskip("docx")
+    from ml.resume_parser.bulk_ingest import ingest_directory
+    
+    class UpsertingStore:
+        def __init__(self):
+            self.chunks = {}
+        
+        def embed_chunks(self, chunks):
+            return [[1.0] for _ in chunks]
+        
+        def add_documents(self, chunks, embeddings=None, batch_size=5000):
+            self.chunks.update((chunk["id"], chunk) for chunk in chunks)
+    
+    # Both resumes open with the same long section, so their first chunks are identical
+    shared = "EDUCATION\n\n" + " ".join(f"Course {i} at State University." for i in range(60))
+    resumes = os.path.join(temp_dir, "resumes")
+    os.makedirs(resumes)
+    for name in ("alice", "bob"):
+        document = docx.Document()
+        document.add_paragraph(f"{shared}\n\nEXPERIENCE\n\n{name} built services.")
+        document.save(os.path.join(resumes, f"{name}.docx"))
+    
+    store = UpsertingStore()
+    # Separate batches, so the second file's chunks are upserted after the first's
+    ingest_directory(resumes, store, workers=1, embed_batch_size=1, ocr_cache_dir=None)
+    
+    education = [chunk for chunk in store.chunks.values() if "State University" in chunk["content"]]
+    assert {chunk["metadata"]["source"] for chunk in education} == {"alice.docx", "bob.docx"}
+    assert len({chunk["metadata"]["content_hash"] for chunk in education}) == 2
+
+def test_process_resume_accepts_buffers_and_limits_size():
+    """Test the in-memory upload path and its size guard."""
+    import io
+    from ml.resume_parser.resume_processor import ResumeProcessor, _as_bytes
+    
+    content = b"%PDF-1.4 resume"
+    assert _as_bytes(memoryview(content)) is content
+    assert _as_bytes(io.BytesIO(content).getbuffer()) == content
+    assert _as_bytes(bytearray(content)) == content
+    
+    processor = ResumeProcessor(vector_store=object(), cache_dir=None)
+    result = processor.process_resume(memoryview(b"x" * 2048), "pdf", max_bytes=1024)
+    assert not result["success"]
+    assert "too large" in result["error"]
+    assert not processor.process_resume(b"", "docx")["success"]
+
+def test_ocr_reuses_cached_page_text(temp_dir):
+    """Test that only image-only pages are OCRed and results are cached by page hash."""
+    fitz = pytest.importorskip("fitz")
+    from ml.resume_parser.ocr import image_only_pages, ocr_image_pages, page_fingerprint
+    from ml.resume_parser.resume_cache import ResumeCache
+    
+    pdf_document = fitz.open()
+    pdf_document.new_page().insert_text((72, 72), "Text layer page")
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 32, 32), False)
+    pixmap.clear_with(255)
+    pdf_document.new_page().insert_image(fitz.Rect(72, 72, 272, 272), pixmap=pixmap)
+    content = pdf_document.tobytes()
+    pages = [page.get_text() for page in pdf_document]
+    
+    assert image_only_pages(pdf_document, pages) == [1]
+    assert ocr_image_pages(content, ["Text layer page", "Another text page"]) == {}
+    
+    cache = ResumeCache(os.path.join(temp_dir, "ocr"))
+    cache.put(page_fingerprint(pdf_document, 1, 300, "eng"), {"text": "Scanned EXPERIENCE"})
+    pdf_document.close()
+    assert ocr_image_pages(content, pages, dpi=300, cache=cache) == {1: "Scanned EXPERIENCE"}
+
+def test_skill_extractor_normalizes_aliases():
+    """Test gazetteer matching on word boundaries with leftmost-longest overlaps."""
+    from ml.resume_parser.skill_extractor import SkillExtractor, get_skill_extractor
+    
+    extractor = get_skill_extractor()
+    assert extractor is get_skill_extractor()
+    
+    text = "Built React Native apps in JavaScript and golang; deployed on k8s. Let's go. R&D lead."
+    matches = extractor.find(text)
+    assert [m["skill"] for m in matches] == ["React Native", "JavaScript", "Go", "Kubernetes"]
+    assert all(text[m["start"]:m["end"]] == m["text"] for m in matches)
+    
+    skills = extractor.extract("Python, python3 and C++ (C++17)")
+    assert [(s["skill"], s["count"]) for s in skills] == [("Python", 2), ("C++", 2)]
+    
+    custom = SkillExtractor({"Tools": {"Vim": ["neovim"]}}, case_sensitive_terms=[])
+    assert [s["skill"] for s in custom.extract("NeoVim user; vimscript")] == ["Vim"]
+
+def test_skill_extractor_needs_context_for_single_letter_languages():
+    """Test that "C" and "R" are not read from grades and initials."""
+    from ml.resume_parser.skill_extractor import get_skill_extractor
+    
+    extractor = get_skill_extractor()
+    for text in ["Grade C", "John C. Smith, Manager", "Final grade: C in Chemistry"]:
+        assert extractor.find(text) == []
+    
+    assert [m["skill"] for m in extractor.find("Languages: C, Python, Java")] == ["C", "Python", "Java"]
+    assert [m["skill"] for m in extractor.find("Proficient in C and C++")] == ["C", "C++"]
+    assert [m["skill"] for m in extractor.find("Skills: R")] == ["R"]
+
+def test_role_fit_ranks_matching_role_first():
+    """Test role ranking for one resume and batch scoring against one role."""
+    from ml.resume_parser.role_fit import get_role_fit_scorer
+    
+    scorer = get_role_fit_scorer()
+    devops = ["Docker", "Kubernetes", "Terraform", "AWS", "Linux"]
+    data = [{"skill": "Python", "count": 3}, {"skill": "Statistics", "count": 1}, {"skill": "scikit-learn", "count": 2}]
+    
+    ranking = scorer.rank_roles(devops)
+    assert ranking[0]["role"] == "DevOps Engineer"
+    assert "Kubernetes" in ranking[0]["matched_skills"]
+    assert scorer.rank_roles(data, top_k=1)[0]["role"] == "Data Scientist"
+    
+    scores = scorer.score_batch([devops, data, []])
+    assert scores.shape == (3, len(scorer.roles))
+    assert scores[2].sum() == 0
+    by_role = scorer.score_batch([devops, data], role="Data Scientist")
+    assert by_role[1] > by_role[0]
+
+def _write_docx(paragraphs, header=None):
+    import io
+    import zipfile
+    
+    ns = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    body = "".join(
+        f"<w:p><w:r><w:t>{text}</w:t><w:tab/><w:t>x</w:t></w:r></w:p>" if text else "<w:p/>"
+        for text in paragraphs
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", f"<w:document {ns}><w:body>{body}</w:body></w:document>")
+        if header:
+            archive.writestr("word/header1.xml", f"<w:hdr {ns}><w:p><w:r><w:t>{header}</w:t></w:r></w:p></w:hdr>")
+    return buffer.getvalue()
+
+def test_docx_streaming_extraction_and_size_cap():
+    """Test paragraph streaming from DOCX parts and the decompressed size cap."""
+    from ml.resume_parser.docx_reader import iter_docx_paragraphs
+    from ml.resume_parser.resume_processor import ResumeProcessor
+    
+    content = _write_docx(["JOHN DOE", "", "EXPERIENCE", "Led team"], header="john@example.com")
+    assert list(iter_docx_paragraphs(content)) == [
+        "john@example.com", "JOHN DOE\tx", "", "EXPERIENCE\tx", "Led team\tx"
+    ]
+    assert ResumeProcessor.extract_from_docx(content) == "john@example.com\nJOHN DOE x\n\nEXPERIENCE x\nLed team x"
+    
+    bomb = _write_docx(["A" * 1_000_000])
+    assert len(bomb) < 10_000
+    with pytest.raises(ValueError):
+        list(iter_docx_paragraphs(bomb, max_xml_bytes=100_000))
+    assert ResumeProcessor.extract_from_docx(b"not a zip") is None